@@ -0,0 +1,5 @@
+"""Performance benchmarks for morgenmcp.
+
+Run with: uv run python -m benchmarks [--profile small|medium|large]
+See benchmarks/suite.py for options and the results format.
+"""
@@ -0,0 +1,340 @@
+"""Benchmark cases. Importing this module registers them with the suite."""
+
+import json
+import tempfile
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from key_value.aio.stores.filetree import FileTreeStore
+
+from benchmarks.fake_morgen import FakeMorgen
+from benchmarks.suite import Operation, benchmark
+from morgenmcp.client import _parse_events, get_client
+from morgenmcp.models import Event
+from morgenmcp.resources import (
+    res_events_this_week,
+    res_events_today,
+    res_events_upcoming,
+)
+from morgenmcp.tools import id_registry
+from morgenmcp.tools.events import (
+    _format_compact_event,
+    _format_full_event,
+    _resolve_display_tz,
+    batch_update_events,
+    list_events,
+)
+from morgenmcp.tools.id_store import SQLiteIDStore
+from morgenmcp.tools.tasks import list_tasks
+
+BATCH_UPDATE_SIZE = 50
+FANOUT_CALENDARS_PER_REQUEST = (1, 4, 10, 20, None)
+
+_COLLECTION = "id_mappings"
+
+
+def _history_ids(fake: FakeMorgen) -> list[str]:
+    """Event-shaped real IDs, as long as the ones Morgen returns."""
+    prefix = "WyJ1c2VyQGV4YW1wbGUuY29tIiwiZXZ0LXVpZC0"
+    return [
+        f"{prefix}{i:08d}IiwiNTA3ZjFmNzdiY2Y4NmNkNzk5NDM5MDExIl0"
+        for i in range(fake.config.id_history)
+    ]
+
+
+async def _all_events(fake: FakeMorgen) -> list[Event]:
+    client = get_client()
+    start, end = fake.window(days=fake.config.span_days, offset_days=-7)
+    events: list[Event] = []
+    for account in fake.dataset.accounts:
+        calendar_ids = [
+            c["id"] for c in fake.dataset.calendars if c["accountId"] == account["id"]
+        ]
+        events += await client.list_events(account["id"], calendar_ids, start, end)
+    return events
+
+
+# --- list_events tool ---
+
+
+def _list_events_case(fake: FakeMorgen, compact: bool, days: int = 7) -> Operation:
+    start, end = fake.window(days=days, offset_days=-7 if days > 7 else 0)
+
+    async def run() -> int:
+        result = await list_events(start=start, end=end, compact=compact)
+        return result["count"]
+
+    return run
+
+
+@benchmark("list_events.compact.cold", fresh=True, unit="events")
+@asynccontextmanager
+async def _list_events_compact_cold(fake: FakeMorgen) -> AsyncIterator[Operation]:
+    yield _list_events_case(fake, compact=True)
+
+
+@benchmark("list_events.full.cold", fresh=True, unit="events")
+@asynccontextmanager
+async def _list_events_full_cold(fake: FakeMorgen) -> AsyncIterator[Operation]:
+    yield _list_events_case(fake, compact=False)
+
+
+@benchmark("list_events.compact.warm", unit="events")
+@asynccontextmanager
+async def _list_events_compact_warm(fake: FakeMorgen) -> AsyncIterator[Operation]:
+    yield _list_events_case(fake, compact=True)
+
+
+@benchmark("list_events.compact.long_window.cold", fresh=True, unit="events")
+@asynccontextmanager
+async def _list_events_long_window(fake: FakeMorgen) -> AsyncIterator[Operation]:
+    # 120 days: split into 30-day /events/list chunks fetched concurrently
+    yield _list_events_case(fake, compact=True, days=120)
+
+
+# --- Per-calendar fan-out ---
+#
+# One account's calendars fetched with different calendars_per_request
+# settings. Run with a per-calendar cost to find the crossover, e.g.
+#   --profile calendars --latency-ms 80 --latency-per-calendar-ms 5 --only fanout
+
+
+def _fanout_case(fake: FakeMorgen, per_request: int | None) -> Operation:
+    start, end = fake.window(days=7)
+    account_id = max(
+        fake.dataset.accounts,
+        key=lambda a: sum(c["accountId"] == a["id"] for c in fake.dataset.calendars),
+    )["id"]
+    calendar_ids = [
+        c["id"] for c in fake.dataset.calendars if c["accountId"] == account_id
+    ]
+
+    async def run() -> int:
+        async with fake.client(calendars_per_request=per_request) as client:
+            events = await client.list_events(account_id, calendar_ids, start, end)
+        return len(events)
+
+    return run
+
+
+def _register_fanout(per_request: int | None) -> None:
+    @benchmark(f"list_events.fanout.{per_request or 'all'}_per_request", unit="events")
+    @asynccontextmanager
+    async def setup(fake: FakeMorgen) -> AsyncIterator[Operation]:
+        yield _fanout_case(fake, per_request)
+
+
+for _per_request in FANOUT_CALENDARS_PER_REQUEST:
+    _register_fanout(_per_request)
+
+
+# --- Event resources ---
+
+
+def _resource_case(read) -> Operation:
+    async def run() -> int:
+        return len(await read())
+
+    return run
+
+
+@benchmark("resource.events_today", fresh=True, unit="bytes")
+@asynccontextmanager
+async def _res_today(fake: FakeMorgen) -> AsyncIterator[Operation]:
+    yield _resource_case(res_events_today)
+
+
+@benchmark("resource.events_this_week", fresh=True, unit="bytes")
+@asynccontextmanager
+async def _res_this_week(fake: FakeMorgen) -> AsyncIterator[Operation]:
+    yield _resource_case(res_events_this_week)
+
+
+@benchmark("resource.events_upcoming", fresh=True, unit="bytes")
+@asynccontextmanager
+async def _res_upcoming(fake: FakeMorgen) -> AsyncIterator[Operation]:
+    yield _resource_case(res_events_upcoming)
+
+
+# --- Tasks ---
+
+
+@benchmark("list_tasks.all_pages", fresh=True, unit="tasks")
+@asynccontextmanager
+async def _list_tasks_all_pages(fake: FakeMorgen) -> AsyncIterator[Operation]:
+    async def run() -> int:
+        return (await list_tasks(all_pages=True))["count"]
+
+    yield run
+
+
+# --- Writes ---
+
+
+@benchmark("batch_update_events", unit="updates")
+@asynccontextmanager
+async def _batch_update(fake: FakeMorgen) -> AsyncIterator[Operation]:
+    start, end = fake.window(days=fake.config.span_days, offset_days=-7)
+    listed = await list_events(start=start, end=end)
+    updates = [
+        {"event_id": event["id"], "title": "Renamed"}
+        for event in listed["events"][:BATCH_UPDATE_SIZE]
+    ]
+
+    async def run() -> int:
+        result = await batch_update_events(updates=updates)
+        if result["failed"]:
+            raise RuntimeError(f"batch_update_events failed: {result['failed'][:3]}")
+        return len(result["updated"])
+
+    yield run
+
+
+# --- ID registry startup ---
+
+
+def _temporary_directory() -> tempfile.TemporaryDirectory[str]:
+    return tempfile.TemporaryDirectory(prefix="morgenmcp-bench-")
+
+
+@benchmark("id_registry.load.sqlite", unit="mappings")
+@asynccontextmanager
+async def _load_sqlite(fake: FakeMorgen) -> AsyncIterator[Operation]:
+    with _temporary_directory() as tmp:
+        data_dir = Path(tmp)
+        store = SQLiteIDStore(data_dir / "ids.sqlite3")
+        await store.setup()
+        real_ids = _history_ids(fake)
+        await store.put_many(
+            [id_registry._generate_virtual_id(r) for r in real_ids],
+            [{"real_id": r} for r in real_ids],
+        )
+
+        async def run() -> int:
+            id_registry.clear_registry()
+            id_registry.set_store(store)
+            try:
+                return await id_registry.load_from_store(data_dir, _COLLECTION)
+            finally:
+                id_registry.set_store(None)
+
+        try:
+            yield run
+        finally:
+            await store.close()
+
+
+@benchmark("id_registry.load.filetree", unit="mappings")
+@asynccontextmanager
+async def _load_filetree(fake: FakeMorgen) -> AsyncIterator[Operation]:
+    with _temporary_directory() as tmp:
+        data_dir = Path(tmp)
+        store = FileTreeStore(data_directory=data_dir, default_collection=_COLLECTION)
+        await store.setup()
+        real_ids = _history_ids(fake)
+        await store.put_many(
+            [id_registry._generate_virtual_id(r) for r in real_ids],
+            [{"real_id": r} for r in real_ids],
+        )
+
+        async def run() -> int:
+            id_registry.clear_registry()
+            id_registry.set_store(store)
+            try:
+                return await id_registry.load_from_store(data_dir, _COLLECTION)
+            finally:
+                id_registry.set_store(None)
+
+        yield run
+
+
+@benchmark("id_registry.first_resolve.lazy", unit="lookups")
+@asynccontextmanager
+async def _first_resolve_lazy(fake: FakeMorgen) -> AsyncIterator[Operation]:
+    with _temporary_directory() as tmp:
+        data_dir = Path(tmp)
+        path = data_dir / "ids.sqlite3"
+        seed = SQLiteIDStore(path)
+        await seed.setup()
+        real_ids = _history_ids(fake)
+        virtual_ids = [id_registry._generate_virtual_id(r) for r in real_ids]
+        await seed.put_many(virtual_ids, [{"real_id": r} for r in real_ids])
+        await seed.close()
+
+        async def run() -> int:
+            # Cold start: open the store and resolve one ID from disk
+            id_registry.clear_registry()
+            store = SQLiteIDStore(path)
+            await store.setup()
+            id_registry.set_store(store)
+            try:
+                id_registry.resolve_id(virtual_ids[len(virtual_ids) // 2])
+            finally:
+                id_registry.set_store(None)
+                await store.close()
+            return 1
+
+        yield run
+
+
+# --- Decoding ---
+
+
+@benchmark("decode.events", unit="events")
+@asynccontextmanager
+async def _decode_events(fake: FakeMorgen) -> AsyncIterator[Operation]:
+    events = await _all_events(fake)
+    payload = [e.model_dump(mode="json", by_alias=True) for e in events]
+    body = json.dumps({"data": {"events": payload}}).encode()
+
+    async def run() -> int:
+        return len(_parse_events(body))
+
+    yield run
+
+
+# --- Formatting ---
+
+
+async def _format_compact_case(fake: FakeMorgen) -> Operation:
+    events = await _all_events(fake)
+    display_tz = _resolve_display_tz(None)
+
+    async def run() -> int:
+        return len([_format_compact_event(e, display_tz) for e in events])
+
+    return run
+
+
+async def _format_full_case(fake: FakeMorgen) -> Operation:
+    events = await _all_events(fake)
+
+    async def run() -> int:
+        return len([_format_full_event(e) for e in events])
+
+    return run
+
+
+@benchmark("format.compact", fresh=True, unit="events")
+@asynccontextmanager
+async def _format_compact(fake: FakeMorgen) -> AsyncIterator[Operation]:
+    yield await _format_compact_case(fake)
+
+
+@benchmark("format.full", fresh=True, unit="events")
+@asynccontextmanager
+async def _format_full(fake: FakeMorgen) -> AsyncIterator[Operation]:
+    yield await _format_full_case(fake)
+
+
+@benchmark("format.compact.cached", unit="events")
+@asynccontextmanager
+async def _format_compact_cached(fake: FakeMorgen) -> AsyncIterator[Operation]:
+    yield await _format_compact_case(fake)
+
+
+@benchmark("format.full.cached", unit="events")
+@asynccontextmanager
+async def _format_full_cached(fake: FakeMorgen) -> AsyncIterator[Operation]:
+    yield await _format_full_case(fake)
@@ -0,0 +1,416 @@
+"""Local stand-in for the Morgen v3 API.
+
+Serves a synthetic, deterministic dataset (accounts × calendars × events,
+plus tasks and tags) from memory as a Starlette app. Responses carry
+Morgen-style RateLimit-* headers drawn from a point budget, and every
+request can be delayed by a configurable latency to model the network.
+
+The app normally runs in-process through httpx.ASGITransport, so the
+benchmarks need no sockets. To poke at it by hand:
+
+    python -m benchmarks.fake_morgen --port 8765
+
+Payload fragments are serialized once up front, so the stand-in's own
+CPU cost stays small next to the client code being measured.
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import random
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+
+import httpx
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+from morgenmcp.client import MorgenClient
+from morgenmcp.ratelimit import DEFAULT_COST, ENDPOINT_COSTS, RateLimiter
+
+BASE_URL = "http://fake-morgen/v3"
+
+_LOCAL_DT_FMT = "%Y-%m-%dT%H:%M:%S"
+_DURATIONS = [("PT15M", 15), ("PT30M", 30), ("PT1H", 60), ("PT1H30M", 90)]
+_TIME_ZONES = ["Europe/Berlin", "America/Chicago", "Asia/Tokyo", None]
+_DESCRIPTION = (
+    "Agenda: review last week's numbers, agree on owners for open items, "
+    "and confirm the timeline for the next milestone. Dial-in details are "
+    "in the invite; notes go to the shared folder afterwards."
+)
+
+
+@dataclass(frozen=True)
+class FakeMorgenConfig:
+    """Shape of the synthetic dataset and behaviour of the stand-in."""
+
+    accounts: int = 2
+    calendars_per_account: int = 3
+    events_per_calendar: int = 300
+    tasks: int = 300
+    tags: int = 20
+    span_days: int = 28  # events spread over this many days from a week ago
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    latency_per_calendar_ms: float = 0.0  # /events/list work per calendar queried
+    rate_limit: int = 100_000
+    rate_window_s: int = 900
+    seed: int = 0
+    id_history: int = 10_000  # persisted ID mappings for the registry benchmarks
+
+    @property
+    def total_events(self) -> int:
+        return self.accounts * self.calendars_per_account * self.events_per_calendar
+
+
+def _b64_id(parts: list[str]) -> str:
+    """Encode an ID the way Morgen does: unpadded base64 of a JSON array."""
+    raw = json.dumps(parts, separators=(",", ":")).encode()
+    return base64.b64encode(raw).decode().rstrip("=")
+
+
+def _dumps(value: object) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+@dataclass
+class _StoredEvent:
+    start: datetime
+    end: datetime
+    payload: bytes
+
+
+@dataclass
+class FakeMorgenDataset:
+    """Pre-built entities and their serialized forms."""
+
+    accounts: list[dict] = field(default_factory=list)
+    calendars: list[dict] = field(default_factory=list)
+    events: dict[tuple[str, str], list[_StoredEvent]] = field(default_factory=dict)
+    tasks: list[dict] = field(default_factory=list)
+    tags: list[dict] = field(default_factory=list)
+
+    @classmethod
+    def build(cls, config: FakeMorgenConfig) -> FakeMorgenDataset:
+        rng = random.Random(config.seed)
+        dataset = cls()
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        first_day = today - timedelta(days=7)
+        span_min = config.span_days * 24 * 60
+
+        for a in range(config.accounts):
+            account_id = f"{rng.getrandbits(96):024x}"
+            email = f"user{a}@example.com"
+            dataset.accounts.append(
+                {
+                    "id": account_id,
+                    "providerId": "google",
+                    "integrationId": "google",
+                    "providerUserId": email,
+                    "providerUserDisplayName": f"Bench User {a}",
+                }
+            )
+            for c in range(config.calendars_per_account):
+                cal_email = f"user{a}.cal{c}@example.com"
+                calendar_id = _b64_id([account_id, cal_email])
+                dataset.calendars.append(
+                    {
+                        "@type": "Calendar",
+                        "id": calendar_id,
+                        "accountId": account_id,
+                        "integrationId": "google",
+                        "name": f"Calendar {a}.{c}",
+                        "color": "#3b82f6",
+                        "sortOrder": c,
+                        "myRights": {"mayReadItems": True, "mayWriteAll": True},
+                    }
+                )
+                dataset.events[(account_id, calendar_id)] = [
+                    _build_event(
+                        rng,
+                        j,
+                        account_id,
+                        calendar_id,
+                        cal_email,
+                        # Evenly spread, on 15-minute boundaries
+                        first_day
+                        + timedelta(
+                            minutes=j
+                            * span_min
+                            // config.events_per_calendar
+                            // 15
+                            * 15
+                        ),
+                    )
+                    for j in range(config.events_per_calendar)
+                ]
+
+        tag_ids = [f"{rng.getrandbits(128):032x}" for _ in range(config.tags)]
+        dataset.tags = [
+            {
+                "id": tag_id,
+                "name": f"tag-{i}",
+                "color": "#10b981",
+                "updated": (first_day + timedelta(minutes=i)).strftime(
+                    _LOCAL_DT_FMT + "Z"
+                ),
+            }
+            for i, tag_id in enumerate(tag_ids)
+        ]
+        for i in range(config.tasks):
+            task = {
+                "@type": "Task",
+                "id": base64.b64encode(f"task-{config.seed}-{i}".encode()).decode(),
+                "integrationId": "morgen",
+                "title": f"Task {i}",
+                "description": _DESCRIPTION if i % 4 == 0 else None,
+                "updated": (first_day + timedelta(minutes=i)).strftime(
+                    _LOCAL_DT_FMT + "Z"
+                ),
+                "priority": i % 10,
+                "progress": "completed" if i % 5 == 0 else "needs-action",
+                "due": (today + timedelta(days=i % 14)).strftime(_LOCAL_DT_FMT)
+                if i % 3
+                else None,
+                "tags": rng.sample(tag_ids, k=min(2, len(tag_ids))) if i % 2 else [],
+            }
+            dataset.tasks.append({k: v for k, v in task.items() if v is not None})
+        return dataset
+
+
+def _build_event(
+    rng: random.Random,
+    i: int,
+    account_id: str,
+    calendar_id: str,
+    cal_email: str,
+    start: datetime,
+) -> _StoredEvent:
+    all_day = i % 17 == 0
+    duration, minutes = ("P1D", 24 * 60) if all_day else _DURATIONS[i % 4]
+    if all_day:
+        start = start.replace(hour=0, minute=0)
+    event: dict = {
+        "@type": "Event",
+        "id": _b64_id([cal_email, f"evt-{i}-{rng.getrandbits(32):08x}", account_id]),
+        "calendarId": calendar_id,
+        "accountId": account_id,
+        "integrationId": "google",
+        "updated": (start - timedelta(days=1)).strftime(_LOCAL_DT_FMT + "Z"),
+        "title": f"Meeting {i}",
+        "description": _DESCRIPTION if i % 2 == 0 else None,
+        "start": start.strftime(_LOCAL_DT_FMT),
+        "duration": duration,
+        "timeZone": None if all_day else _TIME_ZONES[i % len(_TIME_ZONES)],
+        "showWithoutTime": all_day,
+        "freeBusyStatus": "busy",
+        "privacy": "public",
+    }
+    if i % 4 == 0:
+        event["locations"] = {"1": {"@type": "Location", "name": f"Room {i % 9}"}}
+    if i % 3 == 0:
+        event["participants"] = {
+            str(p): {
+                "@type": "Participant",
+                "name": f"Person {p}",
+                "email": f"person{p}@example.com",
+                "roles": {"attendee": True, "owner": p == 0},
+                "participationStatus": "accepted",
+            }
+            for p in range(3)
+        }
+    if i % 5 == 0:
+        event["alerts"] = {
+            "a1": {
+                "@type": "Alert",
+                "trigger": {"@type": "OffsetTrigger", "offset": "-PT10M"},
+                "action": "display",
+            }
+        }
+    event = {k: v for k, v in event.items() if v is not None}
+    return _StoredEvent(start, start + timedelta(minutes=minutes), _dumps(event))
+
+
+def _parse_bound(value: str) -> datetime:
+    dt = datetime.fromisoformat(value)
+    return dt.replace(tzinfo=None)
+
+
+class FakeMorgen:
+    """The stand-in server: dataset, rate-limit budget and request stats."""
+
+    def __init__(self, config: FakeMorgenConfig | None = None):
+        self.config = config or FakeMorgenConfig()
+        self.dataset = FakeMorgenDataset.build(self.config)
+        self.requests: Counter[str] = Counter()
+        self.bytes_sent = 0
+        self._rng = random.Random(self.config.seed)
+        self._remaining = self.config.rate_limit
+        self._window_started = time.monotonic()
+        self.app = Starlette(
+            routes=[
+                Route("/v3/integrations/accounts/list", self._accounts),
+                Route("/v3/calendars/list", self._calendars),
+                Route("/v3/events/list", self._events),
+                Route("/v3/tasks/list", self._tasks),
+                Route("/v3/tags/list", self._tags),
+                Route("/v3/events/create", self._create_event, methods=["POST"]),
+                Route("/v3/{path:path}", self._accept_write, methods=["POST"]),
+            ]
+        )
+
+    # --- Client wiring ---
+
+    def transport(self) -> httpx.AsyncBaseTransport:
+        return httpx.ASGITransport(app=self.app)
+
+    def client(self, **kwargs) -> MorgenClient:
+        """A MorgenClient talking to this stand-in in-process."""
+        kwargs.setdefault(
+            "rate_limiter",
+            RateLimiter(
+                limit=self.config.rate_limit, window_s=self.config.rate_window_s
+            ),
+        )
+        return MorgenClient(
+            api_key="bench", base_url=BASE_URL, transport=self.transport(), **kwargs
+        )
+
+    def window(self, days: int, offset_days: int = 0) -> tuple[str, str]:
+        """A [start, end) window in LocalDateTime format, from today's midnight."""
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        start = today + timedelta(days=offset_days)
+        end = start + timedelta(days=days)
+        return start.strftime(_LOCAL_DT_FMT), end.strftime(_LOCAL_DT_FMT)
+
+    # --- Plumbing ---
+
+    async def _respond(
+        self, request: Request, body: bytes, status: int = 200, work_ms: float = 0.0
+    ):
+        path = request.url.path.removeprefix("/v3")
+        self.requests[path] += 1
+        if not request.headers.get("authorization", "").startswith("ApiKey "):
+            return Response(status_code=401)
+
+        if self.config.latency_ms or self.config.jitter_ms or work_ms:
+            delay = (
+                self.config.latency_ms
+                + work_ms
+                + self._rng.uniform(0, self.config.jitter_ms)
+            )
+            await asyncio.sleep(delay / 1000)
+
+        now = time.monotonic()
+        elapsed = now - self._window_started
+        if elapsed >= self.config.rate_window_s:
+            self._window_started, elapsed = now, 0.0
+            self._remaining = self.config.rate_limit
+        reset = max(0, int(self.config.rate_window_s - elapsed))
+        cost = ENDPOINT_COSTS.get(path, DEFAULT_COST)
+        headers = {"RateLimit-Limit": str(self.config.rate_limit)}
+        if self._remaining < cost:
+            headers |= {
+                "RateLimit-Remaining": str(self._remaining),
+                "RateLimit-Reset": str(reset),
+                "Retry-After": str(reset),
+            }
+            return Response(status_code=429, headers=headers)
+        self._remaining -= cost
+        headers |= {
+            "RateLimit-Remaining": str(self._remaining),
+            "RateLimit-Reset": str(reset),
+        }
+
+        self.bytes_sent += len(body)
+        return Response(
+            body, status_code=status, headers=headers, media_type="application/json"
+        )
+
+    # --- Endpoints ---
+
+    async def _accounts(self, request: Request) -> Response:
+        body = _dumps({"data": {"accounts": self.dataset.accounts}})
+        return await self._respond(request, body)
+
+    async def _calendars(self, request: Request) -> Response:
+        body = _dumps({"data": {"calendars": self.dataset.calendars}})
+        return await self._respond(request, body)
+
+    async def _events(self, request: Request) -> Response:
+        params = request.query_params
+        account_id = params.get("accountId", "")
+        try:
+            start = _parse_bound(params["start"])
+            end = _parse_bound(params["end"])
+        except KeyError, ValueError:
+            return await self._respond(request, b'{"message":"bad window"}', 400)
+        calendar_ids = params.get("calendarIds", "").split(",")
+        fragments = [
+            stored.payload
+            for calendar_id in calendar_ids
+            for stored in self.dataset.events.get((account_id, calendar_id), [])
+            if stored.start < end and stored.end > start
+        ]
+        body = b'{"data":{"events":[' + b",".join(fragments) + b"]}}"
+        work_ms = self.config.latency_per_calendar_ms * len(calendar_ids)
+        return await self._respond(request, body, work_ms=work_ms)
+
+    async def _tasks(self, request: Request) -> Response:
+        params = request.query_params
+        tasks = self.dataset.tasks
+        if updated_after := params.get("updatedAfter"):
+            tasks = [t for t in tasks if t["updated"] > updated_after]
+        limit = min(int(params.get("limit", 100)), 100)
+        body = _dumps({"data": {"tasks": tasks[:limit]}})
+        return await self._respond(request, body)
+
+    async def _tags(self, request: Request) -> Response:
+        params = request.query_params
+        tags = self.dataset.tags
+        if updated_after := params.get("updatedAfter"):
+            tags = [t for t in tags if t["updated"] > updated_after]
+        if limit := params.get("limit"):
+            tags = tags[: int(limit)]
+        return await self._respond(request, _dumps(tags))
+
+    async def _create_event(self, request: Request) -> Response:
+        data = await request.json()
+        created = {
+            "id": _b64_id(["new@example.com", f"new-{self._rng.getrandbits(32)}", ""]),
+            "calendarId": data.get("calendarId", ""),
+            "accountId": data.get("accountId", ""),
+        }
+        return await self._respond(request, _dumps({"data": {"event": created}}))
+
+    async def _accept_write(self, request: Request) -> Response:
+        await request.body()
+        return await self._respond(request, b"{}")
+
+
+def main() -> None:
+    """Serve the stand-in over HTTP for manual exploration."""
+    import uvicorn
+
+    parser = argparse.ArgumentParser(
+        description="Local stand-in for the Morgen v3 API."
+    )
+    parser.add_argument("--port", type=int, default=8765)
+    for name, default in asdict(FakeMorgenConfig()).items():
+        parser.add_argument(
+            f"--{name.replace('_', '-')}", type=type(default), default=default
+        )
+    args = vars(parser.parse_args())
+    port = args.pop("port")
+    fake = FakeMorgen(FakeMorgenConfig(**args))
+    print(f"Fake Morgen API on http://127.0.0.1:{port}/v3 (any 'ApiKey ...' works)")
+    uvicorn.run(fake.app, host="127.0.0.1", port=port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+"""Benchmark suite for morgenmcp against the local Morgen stand-in.
+
+Each benchmark is an async context manager that does its one-time setup
+and yields the operation to time. The operation returns how many items
+it processed (events, bytes, mappings), which becomes a throughput
+figure. Benchmarks marked `fresh` get a new MorgenClient, an empty ID
+registry and an empty formatted-event cache before every iteration, so they measure cold-cache behaviour.
+
+Results are written as one JSON document (see `run_suite`), so runs can
+be archived and compared with `--baseline`.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from benchmarks.fake_morgen import FakeMorgen, FakeMorgenConfig
+from morgenmcp.client import set_client
+from morgenmcp.tools import events, id_registry
+
+SCHEMA_VERSION = 1
+
+PROFILES: dict[str, FakeMorgenConfig] = {
+    "small": FakeMorgenConfig(
+        accounts=1,
+        calendars_per_account=2,
+        events_per_calendar=50,
+        tasks=50,
+        id_history=1_000,
+    ),
+    "medium": FakeMorgenConfig(),
+    "large": FakeMorgenConfig(
+        accounts=4,
+        calendars_per_account=10,
+        events_per_calendar=500,
+        tasks=1000,
+        id_history=50_000,
+    ),
+    # One account with many shared calendars, for the list_events.fanout.* cases
+    "calendars": FakeMorgenConfig(
+        accounts=1,
+        calendars_per_account=40,
+        events_per_calendar=30,
+        tasks=50,
+        id_history=1_000,
+    ),
+}
+
+type Operation = Callable[[], Awaitable[int]]
+type Setup = Callable[[FakeMorgen], AbstractAsyncContextManager[Operation]]
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    setup: Setup
+    fresh: bool = False
+    unit: str = "items"
+
+
+BENCHMARKS: list[Benchmark] = []
+
+
+def benchmark(
+    name: str, *, fresh: bool = False, unit: str = "items"
+) -> Callable[[Setup], Setup]:
+    """Register a benchmark; see the module docstring for the contract."""
+
+    def register(setup: Setup) -> Setup:
+        BENCHMARKS.append(Benchmark(name, setup, fresh, unit))
+        return setup
+
+    return register
+
+
+def _reset(fake: FakeMorgen) -> None:
+    id_registry.set_store(None)
+    id_registry.clear_registry()
+    events._formatted.clear()
+    set_client(fake.client())
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    unit: str
+    samples_s: list[float]
+    items: int
+    upstream_requests: float
+    upstream_bytes: float
+
+    def summary(self) -> dict[str, Any]:
+        samples = sorted(self.samples_s)
+        median = statistics.median(samples)
+        p95 = samples[min(len(samples) - 1, round(0.95 * (len(samples) - 1)))]
+        return {
+            "name": self.name,
+            "iterations": len(samples),
+            "min_s": samples[0],
+            "median_s": median,
+            "p95_s": p95,
+            "mean_s": statistics.fmean(samples),
+            "items": self.items,
+            "unit": self.unit,
+            "items_per_s": self.items / median if median > 0 else None,
+            "upstream_requests": self.upstream_requests,
+            "upstream_bytes": self.upstream_bytes,
+        }
+
+
+async def run_benchmark(
+    bench: Benchmark, fake: FakeMorgen, iterations: int, warmup: int = 1
+) -> BenchmarkResult:
+    """Time `iterations` runs of one benchmark after `warmup` untimed runs."""
+    _reset(fake)
+    samples: list[float] = []
+    items = 0
+    requests_before = sum(fake.requests.values())
+    bytes_before = fake.bytes_sent
+    async with bench.setup(fake) as operation:
+        for i in range(warmup + iterations):
+            if bench.fresh:
+                _reset(fake)
+            if i == warmup:
+                requests_before = sum(fake.requests.values())
+                bytes_before = fake.bytes_sent
+            started = time.perf_counter()
+            items = await operation()
+            elapsed = time.perf_counter() - started
+            if i >= warmup:
+                samples.append(elapsed)
+        await id_registry.flush_pending()
+    _reset(fake)
+    return BenchmarkResult(
+        name=bench.name,
+        unit=bench.unit,
+        samples_s=samples,
+        items=items,
+        upstream_requests=(sum(fake.requests.values()) - requests_before) / iterations,
+        upstream_bytes=(fake.bytes_sent - bytes_before) / iterations,
+    )
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except OSError, subprocess.CalledProcessError:
+        return None
+
+
+async def run_suite(
+    config: FakeMorgenConfig,
+    iterations: int = 5,
+    only: list[str] | None = None,
+) -> dict[str, Any]:
+    """Run the registered benchmarks and return the results document.
+
+    Args:
+        config: Dataset shape and stand-in behaviour.
+        iterations: Timed runs per benchmark.
+        only: Substrings; when given, only matching benchmarks run.
+    """
+    import benchmarks.cases  # noqa: F401  (registers the benchmarks)
+
+    fake = FakeMorgen(config)
+    results = []
+    for bench in BENCHMARKS:
+        if only and not any(pattern in bench.name for pattern in only):
+            continue
+        result = await run_benchmark(bench, fake, iterations)
+        results.append(result.summary())
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": asdict(config),
+        "iterations": iterations,
+        "results": results,
+    }
+
+
+def _print_table(
+    document: dict[str, Any], baseline: dict[str, Any] | None, out=sys.stderr
+) -> None:
+    base = {r["name"]: r for r in (baseline or {}).get("results", [])}
+    print(
+        f"{'benchmark':<40} {'median':>10} {'p95':>10} {'items/s':>12} "
+        f"{'reqs':>6} {'vs base':>8}",
+        file=out,
+    )
+    for r in document["results"]:
+        ratio = ""
+        if r["name"] in base and base[r["name"]]["median_s"]:
+            ratio = f"{r['median_s'] / base[r['name']]['median_s']:.2f}x"
+        rate = f"{r['items_per_s']:.0f}" if r["items_per_s"] else "-"
+        print(
+            f"{r['name']:<40} {r['median_s'] * 1000:>8.2f}ms "
+            f"{r['p95_s'] * 1000:>8.2f}ms {rate:>12} "
+            f"{r['upstream_requests']:>6.1f} {ratio:>8}",
+            file=out,
+        )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark morgenmcp against a local Morgen API stand-in.",
+    )
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="medium")
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--only", nargs="*", help="run benchmarks matching these")
+    parser.add_argument("--latency-ms", type=float, help="per-request latency")
+    parser.add_argument("--jitter-ms", type=float, help="extra random latency")
+    parser.add_argument(
+        "--latency-per-calendar-ms",
+        type=float,
+        help="extra /events/list latency per calendar queried",
+    )
+    parser.add_argument("--accounts", type=int)
+    parser.add_argument("--calendars-per-account", type=int)
+    parser.add_argument("--events-per-calendar", type=int)
+    parser.add_argument("--tasks", type=int)
+    parser.add_argument("--id-history", type=int)
+    parser.add_argument("--output", type=Path, help="write JSON results here")
+    parser.add_argument("--baseline", type=Path, help="earlier results to compare")
+    args = parser.parse_args(argv)
+
+    overrides = {
+        name: value
+        for name in (
+            "latency_ms",
+            "jitter_ms",
+            "latency_per_calendar_ms",
+            "accounts",
+            "calendars_per_account",
+            "events_per_calendar",
+            "tasks",
+            "id_history",
+        )
+        if (value := getattr(args, name)) is not None
+    }
+    config = FakeMorgenConfig(**(asdict(PROFILES[args.profile]) | overrides))
+
+    document = asyncio.run(run_suite(config, args.iterations, args.only))
+    document["profile"] = args.profile
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else None
+    _print_table(document, baseline)
+    payload = json.dumps(document, indent=2)
+    if args.output:
+        args.output.write_text(payload + "\n")
+    else:
+        print(payload)
@@ -1,10 +1,18 @@
 """Async HTTP client for Morgen API."""
 
+import asyncio
 import os
-from typing import Any
+import time
+from collections.abc import AsyncIterator, Callable, Mapping
+from datetime import timedelta
+from typing import Any, cast
 
 import httpx
+from pydantic_core import from_json
 
+from morgenmcp.directory import Directory
+from morgenmcp.event_store import EventStore, split_window
+from morgenmcp.metrics import TRANSPORT_ERROR, ClientMetrics
 from morgenmcp.models import (
     Account,
     AccountsListResponse,
@@ -35,6 +43,58 @@ from morgenmcp.models import (
     TasksListResponse,
     TaskUpdateRequest,
 )
+from morgenmcp.pagination import collect, paginate
+from morgenmcp.ratelimit import RateLimiter
+from morgenmcp.retry import RETRYABLE_STATUS_CODES, RetryPolicy, parse_retry_after
+from morgenmcp.singleflight import SingleFlight
+from morgenmcp.tag_index import TagIndex
+from morgenmcp.task_mirror import TaskMirror
+
+# Morgen recommends fetching at most ~2 months of events per request.
+DEFAULT_EVENT_CHUNK_DAYS = 30.0
+# Above this many calendars, one account's /events/list is split into
+# several concurrent requests (see benchmarks' list_events.fanout.* cases).
+DEFAULT_CALENDARS_PER_REQUEST = 10
+
+
+def _split_calendars(
+    calendar_ids: list[str], per_request: int | None
+) -> list[list[str]]:
+    """Split calendar IDs into near-equal groups of at most per_request."""
+    if not per_request or len(calendar_ids) <= per_request:
+        return [calendar_ids]
+    groups = -(-len(calendar_ids) // per_request)
+    size = -(-len(calendar_ids) // groups)
+    return [calendar_ids[i : i + size] for i in range(0, len(calendar_ids), size)]
+
+
+async def _live_tags(pages: AsyncIterator[list[Tag]]) -> AsyncIterator[list[Tag]]:
+    """Drop deleted tags, which pages fetched with updatedAfter include."""
+    async for page in pages:
+        if live := [tag for tag in page if not tag.deleted]:
+            yield live
+
+
+def _parse_events(body: bytes) -> list[Event]:
+    """Parse an /events/list body straight from bytes.
+
+    This is the hottest decode: a large window carries thousands of events,
+    each with nested participants, alerts and recurrence rules.
+    model_validate_json validates in one pass in pydantic-core, which is
+    markedly faster than json.loads followed by model_validate and, unlike
+    model_construct, still builds the nested models the formatters use.
+    """
+    return APIResponse[EventsListResponse].model_validate_json(body).data.events
+
+
+def _parse_tags(body: bytes) -> list[Tag]:
+    """Parse a /tags/list body, which is a bare array rather than {data: ...}."""
+    data = from_json(body)
+    if isinstance(data, list):
+        return [Tag.model_validate(item) for item in data]
+    # Defensive: support {data: [...]} just in case
+    wrapped = data.get("data", []) if isinstance(data, dict) else []
+    return [Tag.model_validate(item) for item in wrapped]
 
 
 class MorgenClient:
@@ -42,11 +102,50 @@ class MorgenClient:
 
     BASE_URL = "https://api.morgen.so/v3"
 
-    def __init__(self, api_key: str | None = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        event_store: EventStore | None = None,
+        base_url: str | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        metrics: ClientMetrics | None = None,
+        event_chunk_days: float | None = DEFAULT_EVENT_CHUNK_DAYS,
+        calendars_per_request: int | None = DEFAULT_CALENDARS_PER_REQUEST,
+        task_mirror: TaskMirror | None = None,
+        tag_index: TagIndex | None = None,
+        directory: Directory | None = None,
+    ):
         """Initialize the Morgen client.
 
         Args:
             api_key: Morgen API key. If not provided, reads from MORGEN_API_KEY env var.
+            rate_limiter: Pacing for outgoing requests. Defaults to a
+                RateLimiter sized for Morgen's standard budget.
+            retry_policy: Backoff and budget for retrying transient failures
+                of reads and idempotent writes. Defaults to RetryPolicy().
+            event_store: Window-aware cache behind list_events. Defaults to
+                EventStore(); pass EventStore(ttl_s=0) to always refetch.
+            base_url: API root. Defaults to BASE_URL; the benchmarks point
+                this at a local stand-in.
+            transport: Custom httpx transport (e.g. httpx.ASGITransport).
+            metrics: Where per-endpoint request metrics are recorded.
+                Defaults to a fresh ClientMetrics().
+            event_chunk_days: Longest window sent in one /events/list call.
+                Longer windows are split and the chunks fetched concurrently.
+                None sends every window in one call.
+            calendars_per_request: Most calendars queried in one
+                /events/list call. Larger calendar sets are split into
+                near-equal groups fetched concurrently. None never splits.
+            task_mirror: Incrementally synced copy of all tasks behind
+                list_all_tasks. Defaults to TaskMirror().
+            tag_index: Incrementally synced copy of all live tags behind
+                list_all_tags, tag_names and find_tag. Defaults to TagIndex().
+            directory: TTL cache of accounts and calendars behind
+                list_accounts, list_calendars, get_account and get_calendar.
+                Defaults to Directory(); pass Directory(ttl_s=0) to always
+                refetch.
         """
         self.api_key = api_key or os.environ.get("MORGEN_API_KEY")
         if not self.api_key:
@@ -55,19 +154,34 @@ class MorgenClient:
                 "Pass it directly or set MORGEN_API_KEY environment variable."
             )
         self._client: httpx.AsyncClient | None = None
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._inflight = SingleFlight()
+        self.event_store = event_store or EventStore()
+        self.base_url = base_url or self.BASE_URL
+        self._transport = transport
+        self.metrics = metrics or ClientMetrics()
+        self.event_chunk = (
+            timedelta(days=event_chunk_days) if event_chunk_days else None
+        )
+        self.calendars_per_request = calendars_per_request
+        self.task_mirror = task_mirror or TaskMirror()
+        self.tag_index = tag_index or TagIndex()
+        self.directory = directory or Directory()
 
     @property
     def client(self) -> httpx.AsyncClient:
         """Get or create the HTTP client."""
         if self._client is None:
             self._client = httpx.AsyncClient(
-                base_url=self.BASE_URL,
+                base_url=self.base_url,
                 headers={
                     "Authorization": f"ApiKey {self.api_key}",
                     "Accept": "application/json",
                     "Content-Type": "application/json",
                 },
                 timeout=30.0,
+                transport=self._transport,
             )
         return self._client
 
@@ -143,35 +257,145 @@ class MorgenClient:
                 rate_limit_info=rate_limit_info,
             )
 
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json: Any = None,
+        idempotent: bool | None = None,
+    ) -> httpx.Response:
+        """Send one request through the rate limiter and check for errors.
+
+        The endpoint's point cost is reserved before every attempt, and the
+        budget reported in the response headers is fed back to the limiter
+        whether or not the call succeeded.
+
+        GETs and requests marked `idempotent` are retried on transient
+        failures (429, 5xx, transport errors) according to retry_policy.
+
+        Each attempt is recorded in `metrics`, including time spent waiting
+        for rate-limit budget.
+        """
+        retryable = method == "GET" if idempotent is None else idempotent
+        policy = self.retry_policy
+        policy.budget.deposit()
+        attempt = 0
+
+        while True:
+            started = time.perf_counter()
+            await self.rate_limiter.acquire(path)
+            sent = time.perf_counter()
+            self.metrics.record_wait(path, sent - started)
+            try:
+                response = await self.client.request(
+                    method, path, params=params, json=json
+                )
+            except httpx.TransportError:
+                self.metrics.record(path, TRANSPORT_ERROR, time.perf_counter() - sent)
+                delay = policy.next_delay(attempt) if retryable else None
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            self.metrics.record(
+                path,
+                response.status_code,
+                time.perf_counter() - sent,
+                len(response.content),
+            )
+            rate_limit_info = self._parse_rate_limit_headers(response)
+            if rate_limit_info is not None:
+                self.rate_limiter.observe(rate_limit_info)
+                self.metrics.observe_rate_limit(rate_limit_info)
+
+            if retryable and response.status_code in RETRYABLE_STATUS_CODES:
+                delay = policy.next_delay(attempt, parse_retry_after(response))
+                if delay is not None:
+                    await asyncio.sleep(delay)
+                    attempt += 1
+                    continue
+
+            self._handle_error(response)
+            return response
+
+    async def _get[T](
+        self,
+        path: str,
+        parse: Callable[[bytes], T],
+        params: dict[str, Any] | None = None,
+    ) -> T:
+        """GET `path` and parse the raw body, coalescing identical calls.
+
+        `parse` receives the undecoded bytes so models can validate them
+        with model_validate_json, which parses and validates in one pass
+        instead of first building a tree of Python dicts and lists.
+
+        Concurrent calls with the same path and params share one HTTP
+        request and one parsed result. Lists are copied per caller so one
+        caller extending its result cannot affect another's.
+        """
+        key = (path, tuple(sorted((params or {}).items())))
+
+        async def fetch() -> T:
+            response = await self._request("GET", path, params=params)
+            return parse(response.content)
+
+        result = await self._inflight.do(key, fetch)
+        if isinstance(result, list):
+            return cast(T, list(result))
+        return result
+
     # Account endpoints
 
     async def list_accounts(self) -> list[Account]:
-        """List all connected calendar accounts.
+        """List all connected calendar accounts, from the directory cache.
 
         Returns:
             List of Account objects.
         """
-        response = await self.client.get("/integrations/accounts/list")
-        self._handle_error(response)
-
-        data = response.json()
-        api_response = APIResponse[AccountsListResponse].model_validate(data)
-        return api_response.data.accounts
+        return await self.directory.accounts(self._fetch_accounts)
+
+    async def get_account(self, account_id: str) -> Account | None:
+        """The connected account with this ID, from the directory cache."""
+        return await self.directory.account(account_id, self._fetch_accounts)
+
+    async def _fetch_accounts(self) -> list[Account]:
+        return await self._get(
+            "/integrations/accounts/list",
+            lambda body: (
+                APIResponse[AccountsListResponse]
+                .model_validate_json(body)
+                .data.accounts
+            ),
+        )
 
     # Calendar endpoints
 
     async def list_calendars(self) -> list[Calendar]:
-        """List all calendars across connected accounts.
+        """List all calendars across connected accounts, from the directory cache.
 
         Returns:
             List of Calendar objects.
         """
-        response = await self.client.get("/calendars/list")
-        self._handle_error(response)
-
-        data = response.json()
-        api_response = APIResponse[CalendarsListResponse].model_validate(data)
-        return api_response.data.calendars
+        return await self.directory.calendars(self._fetch_calendars)
+
+    async def get_calendar(self, calendar_id: str) -> Calendar | None:
+        """The calendar with this ID, from the directory cache."""
+        return await self.directory.calendar(calendar_id, self._fetch_calendars)
+
+    async def _fetch_calendars(self) -> list[Calendar]:
+        return await self._get(
+            "/calendars/list",
+            lambda body: (
+                APIResponse[CalendarsListResponse]
+                .model_validate_json(body)
+                .data.calendars
+            ),
+        )
 
     async def update_calendar_metadata(
         self,
@@ -204,11 +428,15 @@ class MorgenClient:
             metadata=metadata,
         )
 
-        response = await self.client.post(
-            "/calendars/update",
-            json=request.model_dump(by_alias=True, exclude_none=True),
-        )
-        self._handle_error(response)
+        try:
+            await self._request(
+                "POST",
+                "/calendars/update",
+                json=request.model_dump(by_alias=True, exclude_none=True),
+                idempotent=True,
+            )
+        finally:
+            self.directory.invalidate_calendars()
 
     # Event endpoints
 
@@ -221,6 +449,9 @@ class MorgenClient:
     ) -> list[Event]:
         """List events in a time window.
 
+        Ranges already fetched recently are answered from the event store;
+        only the uncovered parts of the window are requested upstream.
+
         Args:
             account_id: The calendar account ID.
             calendar_ids: List of calendar IDs to retrieve events from.
@@ -230,6 +461,55 @@ class MorgenClient:
         Returns:
             List of Event objects.
         """
+        return await self.event_store.list_events(
+            account_id, calendar_ids, start, end, self._fetch_events
+        )
+
+    async def _fetch_events(
+        self,
+        account_id: str,
+        calendar_ids: list[str],
+        start: str,
+        end: str,
+    ) -> list[Event]:
+        """Fetch events in a time window from /events/list.
+
+        Windows longer than event_chunk are split into time chunks, and
+        calendar sets larger than calendars_per_request into groups. Every
+        (chunk, group) pair is fetched concurrently; the rate limiter still
+        paces them. Events spanning a chunk boundary come back from both
+        chunks and are kept once.
+        """
+        windows = (
+            split_window(start, end, self.event_chunk)
+            if self.event_chunk
+            else [(start, end)]
+        )
+        groups = _split_calendars(calendar_ids, self.calendars_per_request)
+        if len(windows) == 1 and len(groups) == 1:
+            return await self._fetch_events_chunk(account_id, calendar_ids, start, end)
+
+        results = await asyncio.gather(
+            *(
+                self._fetch_events_chunk(account_id, group, chunk_start, chunk_end)
+                for chunk_start, chunk_end in windows
+                for group in groups
+            )
+        )
+        merged: dict[str, Event] = {}
+        for events in results:
+            for event in events:
+                merged.setdefault(event.id, event)
+        return list(merged.values())
+
+    async def _fetch_events_chunk(
+        self,
+        account_id: str,
+        calendar_ids: list[str],
+        start: str,
+        end: str,
+    ) -> list[Event]:
+        """Fetch one window straight from /events/list."""
         params = {
             "accountId": account_id,
             "calendarIds": ",".join(calendar_ids),
@@ -237,12 +517,11 @@ class MorgenClient:
             "end": end,
         }
 
-        response = await self.client.get("/events/list", params=params)
-        self._handle_error(response)
-
-        data = response.json()
-        api_response = APIResponse[EventsListResponse].model_validate(data)
-        return api_response.data.events
+        return await self._get(
+            "/events/list",
+            _parse_events,
+            params=params,
+        )
 
     async def create_event(self, request: EventCreateRequest) -> EventCreateResponse:
         """Create a new calendar event.
@@ -253,11 +532,15 @@ class MorgenClient:
         Returns:
             EventCreateResponse with the new event's ID.
         """
-        response = await self.client.post(
-            "/events/create",
-            json=request.model_dump(by_alias=True, exclude_none=True),
-        )
-        self._handle_error(response)
+        try:
+            response = await self._request(
+                "POST",
+                "/events/create",
+                json=request.model_dump(by_alias=True, exclude_none=True),
+            )
+        finally:
+            # Invalidate even on failure: the write may have landed anyway.
+            self.event_store.invalidate(request.account_id, request.calendar_id)
 
         data = response.json()
         return APIResponse[EventCreateResponse].model_validate(data).data
@@ -278,12 +561,16 @@ class MorgenClient:
         """
         params = {"seriesUpdateMode": series_update_mode}
 
-        response = await self.client.post(
-            "/events/update",
-            params=params,
-            json=request.model_dump(by_alias=True, exclude_none=True),
-        )
-        self._handle_error(response)
+        try:
+            await self._request(
+                "POST",
+                "/events/update",
+                params=params,
+                json=request.model_dump(by_alias=True, exclude_none=True),
+                idempotent=True,
+            )
+        finally:
+            self.event_store.invalidate(request.account_id, request.calendar_id)
 
     async def delete_event(
         self,
@@ -301,12 +588,15 @@ class MorgenClient:
         """
         params = {"seriesUpdateMode": series_update_mode}
 
-        response = await self.client.post(
-            "/events/delete",
-            params=params,
-            json=request.model_dump(by_alias=True, exclude_none=True),
-        )
-        self._handle_error(response)
+        try:
+            await self._request(
+                "POST",
+                "/events/delete",
+                params=params,
+                json=request.model_dump(by_alias=True, exclude_none=True),
+            )
+        finally:
+            self.event_store.invalidate(request.account_id, request.calendar_id)
 
     # Task endpoints
 
@@ -330,12 +620,42 @@ class MorgenClient:
         if updated_after is not None:
             params["updatedAfter"] = updated_after
 
-        response = await self.client.get("/tasks/list", params=params)
-        self._handle_error(response)
+        return await self._get(
+            "/tasks/list",
+            lambda body: (
+                APIResponse[TasksListResponse].model_validate_json(body).data.tasks
+            ),
+            params=params,
+        )
 
-        data = response.json()
-        api_response = APIResponse[TasksListResponse].model_validate(data)
-        return api_response.data.tasks
+    async def list_all_tasks(self) -> list[Task]:
+        """List every task, served from the task mirror.
+
+        The first call downloads the full list; later calls only fetch
+        tasks updated since the last sync, and none at all within the
+        mirror's TTL.
+
+        Returns:
+            List of Task objects.
+        """
+        return await self.task_mirror.tasks(
+            lambda updated_after: collect(self.iter_tasks(updated_after))
+        )
+
+    def iter_tasks(self, updated_after: str | None = None) -> AsyncIterator[list[Task]]:
+        """Walk every page of /tasks/list, past the 100-task limit.
+
+        Pages are yielded as they arrive, with the next page's request
+        already in flight. Each page costs a /tasks/list call (10 points).
+
+        Args:
+            updated_after: ISO 8601 datetime to start from; None walks
+                every task.
+        """
+        return paginate(
+            lambda cursor, limit: self.list_tasks(limit=limit, updated_after=cursor),
+            updated_after,
+        )
 
     async def get_task(self, task_id: str) -> Task:
         """Retrieve a single task by ID.
@@ -346,12 +666,13 @@ class MorgenClient:
         Returns:
             The Task object.
         """
-        response = await self.client.get("/tasks", params={"id": task_id})
-        self._handle_error(response)
-
-        data = response.json()
-        api_response = APIResponse[TaskGetResponse].model_validate(data)
-        return api_response.data.task
+        return await self._get(
+            "/tasks",
+            lambda body: (
+                APIResponse[TaskGetResponse].model_validate_json(body).data.task
+            ),
+            params={"id": task_id},
+        )
 
     async def create_task(self, request: TaskCreateRequest) -> str:
         """Create a new task.
@@ -362,54 +683,79 @@ class MorgenClient:
         Returns:
             The new task's Morgen ID.
         """
-        response = await self.client.post(
-            "/tasks/create",
-            json=request.model_dump(by_alias=True, exclude_none=True),
-        )
-        self._handle_error(response)
+        try:
+            response = await self._request(
+                "POST",
+                "/tasks/create",
+                json=request.model_dump(by_alias=True, exclude_none=True),
+            )
+        finally:
+            self.task_mirror.invalidate()
 
         data = response.json()
         return APIResponse[TaskCreateResponse].model_validate(data).data.id
 
     async def update_task(self, request: TaskUpdateRequest) -> None:
         """Update a task. Patch semantics — only provided fields change."""
-        response = await self.client.post(
-            "/tasks/update",
-            json=request.model_dump(by_alias=True, exclude_none=True),
-        )
-        self._handle_error(response)
+        try:
+            await self._request(
+                "POST",
+                "/tasks/update",
+                json=request.model_dump(by_alias=True, exclude_none=True),
+                idempotent=True,
+            )
+        finally:
+            self.task_mirror.invalidate()
 
     async def move_task(self, request: TaskMoveRequest) -> None:
         """Reorder a task within its list or change its parent."""
-        response = await self.client.post(
-            "/tasks/move",
-            json=request.model_dump(by_alias=True, exclude_none=True),
-        )
-        self._handle_error(response)
+        try:
+            await self._request(
+                "POST",
+                "/tasks/move",
+                json=request.model_dump(by_alias=True, exclude_none=True),
+            )
+        finally:
+            self.task_mirror.invalidate()
 
     async def close_task(self, request: TaskCloseRequest) -> None:
         """Mark a task as completed."""
-        response = await self.client.post(
-            "/tasks/close",
-            json=request.model_dump(by_alias=True, exclude_none=True),
-        )
-        self._handle_error(response)
+        try:
+            await self._request(
+                "POST",
+                "/tasks/close",
+                json=request.model_dump(by_alias=True, exclude_none=True),
+                idempotent=True,
+            )
+        finally:
+            self.task_mirror.invalidate()
 
     async def reopen_task(self, request: TaskReopenRequest) -> None:
         """Mark a completed task as not completed."""
-        response = await self.client.post(
-            "/tasks/reopen",
-            json=request.model_dump(by_alias=True, exclude_none=True),
-        )
-        self._handle_error(response)
+        try:
+            await self._request(
+                "POST",
+                "/tasks/reopen",
+                json=request.model_dump(by_alias=True, exclude_none=True),
+                idempotent=True,
+            )
+        finally:
+            self.task_mirror.invalidate()
 
     async def delete_task(self, request: TaskDeleteRequest) -> None:
         """Permanently delete a task."""
-        response = await self.client.post(
-            "/tasks/delete",
-            json=request.model_dump(by_alias=True, exclude_none=True),
-        )
-        self._handle_error(response)
+        try:
+            await self._request(
+                "POST",
+                "/tasks/delete",
+                json=request.model_dump(by_alias=True, exclude_none=True),
+            )
+        except BaseException:
+            # The delete may have gone through anyway (e.g. a timeout), and
+            # task deltas carry no tombstones: only a full sync can tell.
+            self.task_mirror.reset()
+            raise
+        self.task_mirror.discard(request.id)
 
     # Tag endpoints
 
@@ -433,23 +779,40 @@ class MorgenClient:
         if updated_after is not None:
             params["updatedAfter"] = updated_after
 
-        response = await self.client.get("/tags/list", params=params)
-        self._handle_error(response)
+        return await self._get("/tags/list", _parse_tags, params=params)
 
-        data = response.json()
-        # The tags endpoint returns a bare array, not wrapped in {data: ...}
-        if isinstance(data, list):
-            return [Tag.model_validate(item) for item in data]
-        # Defensive: support {data: [...]} just in case
-        wrapped = data.get("data", []) if isinstance(data, dict) else []
-        return [Tag.model_validate(item) for item in wrapped]
+    def iter_tags(self, updated_after: str | None = None) -> AsyncIterator[list[Tag]]:
+        """Walk every page of /tags/list; see iter_tasks.
+
+        Only a walk started with updated_after includes deleted tags, the
+        same as a single list_tags call.
+        """
+        pages = paginate(
+            lambda cursor, limit: self.list_tags(limit=limit, updated_after=cursor),
+            updated_after,
+        )
+        return pages if updated_after is not None else _live_tags(pages)
+
+    async def list_all_tags(self) -> list[Tag]:
+        """Every live tag, served from the incrementally synced tag index."""
+        return await self.tag_index.tags(self._fetch_tags)
+
+    async def tag_names(self) -> Mapping[str, str]:
+        """Map of tag ID to name, from the tag index."""
+        await self.tag_index.sync(self._fetch_tags)
+        return self.tag_index.names()
+
+    async def find_tag(self, name: str) -> Tag | None:
+        """The live tag with this name (case-insensitive), from the tag index."""
+        await self.tag_index.sync(self._fetch_tags)
+        return self.tag_index.find(name)
+
+    async def _fetch_tags(self, updated_after: str | None) -> list[Tag]:
+        return await collect(self.iter_tags(updated_after))
 
     async def get_tag(self, tag_id: str) -> Tag:
         """Retrieve a single tag by ID."""
-        response = await self.client.get("/tags", params={"id": tag_id})
-        self._handle_error(response)
-
-        return Tag.model_validate(response.json())
+        return await self._get("/tags", Tag.model_validate_json, params={"id": tag_id})
 
     async def create_tag(self, request: TagCreateRequest) -> Tag:
         """Create a new tag.
@@ -457,29 +820,41 @@ class MorgenClient:
         Returns:
             The created Tag object including the assigned ID.
         """
-        response = await self.client.post(
+        response = await self._request(
+            "POST",
             "/tags/create",
             json=request.model_dump(by_alias=True, exclude_none=True),
         )
-        self._handle_error(response)
 
-        return Tag.model_validate(response.json())
+        tag = Tag.model_validate(response.json())
+        self.tag_index.put(tag)
+        return tag
 
     async def update_tag(self, request: TagUpdateRequest) -> None:
         """Update a tag's name or color."""
-        response = await self.client.post(
-            "/tags/update",
-            json=request.model_dump(by_alias=True, exclude_none=True),
-        )
-        self._handle_error(response)
+        try:
+            await self._request(
+                "POST",
+                "/tags/update",
+                json=request.model_dump(by_alias=True, exclude_none=True),
+                idempotent=True,
+            )
+        finally:
+            self.tag_index.invalidate()
 
     async def delete_tag(self, request: TagDeleteRequest) -> None:
         """Soft-delete a tag."""
-        response = await self.client.post(
-            "/tags/delete",
-            json=request.model_dump(by_alias=True, exclude_none=True),
-        )
-        self._handle_error(response)
+        try:
+            await self._request(
+                "POST",
+                "/tags/delete",
+                json=request.model_dump(by_alias=True, exclude_none=True),
+            )
+        finally:
+            # Even a failed delete may have gone through; the delta's
+            # tombstone settles it.
+            self.tag_index.invalidate()
+        self.tag_index.discard(request.id)
 
 
 # Global client instance for use in tools
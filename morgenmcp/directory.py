@@ -0,0 +1,111 @@
+"""Shared, TTL-cached directory of accounts and calendars.
+
+Every all-calendar events read starts from /calendars/list, and the
+single-account and single-calendar resources used to download the whole
+list to find one entry. Accounts and calendars rarely change, so
+Directory keeps both lists with an index by real ID. A listing is
+refetched once it is older than `ttl_s` (5 minutes by default), when
+MorgenClient invalidates it after a calendar metadata write, or when a
+lookup misses on a listing that was not fetched by that same call (so a
+just-connected calendar is still found). An invalidation that lands while
+a fetch is in flight keeps the listing stale.
+"""
+
+import time
+from collections.abc import Awaitable, Callable
+from typing import Protocol
+
+from morgenmcp.freshness import Freshness
+from morgenmcp.models import Account, Calendar
+
+DEFAULT_TTL_S = 300.0
+
+
+class _Identified(Protocol):
+    @property
+    def id(self) -> str: ...
+
+
+type Fetcher[T] = Callable[[], Awaitable[list[T]]]
+
+
+class _Listing[T: _Identified]:
+    """One cached list endpoint, indexed by ID."""
+
+    def __init__(self, ttl_s: float, clock: Callable[[], float]) -> None:
+        self.items: list[T] = []
+        self.by_id: dict[str, T] = {}
+        self.freshness = Freshness(ttl_s, clock)
+
+    def store(self, items: list[T]) -> None:
+        self.items = items
+        self.by_id = {item.id: item for item in items}
+
+
+class Directory:
+    """Accounts and calendars, cached for `ttl_s` and indexed by ID."""
+
+    def __init__(
+        self,
+        ttl_s: float = DEFAULT_TTL_S,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the directory.
+
+        Args:
+            ttl_s: How long a fetched listing is served. 0 refetches on
+                every read.
+            clock: Monotonic time source (injectable for tests).
+        """
+        self._accounts: _Listing[Account] = _Listing(ttl_s, clock)
+        self._calendars: _Listing[Calendar] = _Listing(ttl_s, clock)
+
+    async def accounts(self, fetch: Fetcher[Account]) -> list[Account]:
+        """All accounts, fetching them if the cached listing is stale."""
+        await self._load(self._accounts, fetch)
+        return list(self._accounts.items)
+
+    async def account(self, account_id: str, fetch: Fetcher[Account]) -> Account | None:
+        """The account with this real ID, or None."""
+        return await self._lookup(self._accounts, account_id, fetch)
+
+    async def calendars(self, fetch: Fetcher[Calendar]) -> list[Calendar]:
+        """All calendars, fetching them if the cached listing is stale."""
+        await self._load(self._calendars, fetch)
+        return list(self._calendars.items)
+
+    async def calendar(
+        self, calendar_id: str, fetch: Fetcher[Calendar]
+    ) -> Calendar | None:
+        """The calendar with this real ID, or None."""
+        return await self._lookup(self._calendars, calendar_id, fetch)
+
+    def invalidate_calendars(self) -> None:
+        """Refetch calendars on the next read."""
+        self._calendars.freshness.invalidate()
+
+    def invalidate(self) -> None:
+        """Refetch both listings on the next read."""
+        self._accounts.freshness.invalidate()
+        self.invalidate_calendars()
+
+    async def _load[T: _Identified](
+        self, listing: _Listing[T], fetch: Fetcher[T], force: bool = False
+    ) -> bool:
+        """Refresh `listing` if stale (or forced); True if it was fetched."""
+        freshness = listing.freshness
+        async with freshness.lock:
+            ticket = freshness.begin()
+            if not force and not freshness.stale(ticket.started_at):
+                return False
+            listing.store(await fetch())
+            freshness.finish(ticket)
+            return True
+
+    async def _lookup[T: _Identified](
+        self, listing: _Listing[T], item_id: str, fetch: Fetcher[T]
+    ) -> T | None:
+        fetched = await self._load(listing, fetch)
+        if item_id not in listing.by_id and not fetched:
+            await self._load(listing, fetch, force=True)
+        return listing.by_id.get(item_id)
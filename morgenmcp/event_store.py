@@ -0,0 +1,327 @@
+"""In-process event store with incremental window fills.
+
+Every events read used to re-download its whole window from /events/list,
+even when windows overlap (today ⊂ this-week ⊂ upcoming). EventStore
+remembers, per (account, calendar), which time ranges it fetched and when.
+A window query only fetches the uncovered sub-ranges and answers the rest
+from an interval index of the events it already holds.
+
+Time frame: everything is compared in UTC. Window bounds without an
+offset are taken as UTC wall-clock; bounds with one are converted. Timed
+events are placed using their own `timeZone`; floating and all-day events
+are placed on the same naive wall clock as the window.
+
+Freshness: coverage expires after `ttl_s` (60s by default), and
+MorgenClient invalidates a calendar whenever it creates, updates or
+deletes an event in it. A fetch that an invalidation overtook may hold
+pre-write data: it still answers the read that made it, but its range
+is stored as already expired, so the next read fetches it again.
+
+Long windows: split_window cuts a range into sub-windows so MorgenClient
+can keep each /events/list call within the ~2 months Morgen recommends.
+"""
+
+import math
+import re
+import time
+from bisect import bisect_left, insort
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from itertools import pairwise
+from zoneinfo import ZoneInfoNotFoundError
+
+from morgenmcp.freshness import Freshness, Ticket
+from morgenmcp.models import Event
+from morgenmcp.timezones import time_zones
+
+DEFAULT_TTL_S = 60.0
+
+_LOCAL_DT_FMT = "%Y-%m-%dT%H:%M:%S"
+_DURATION_PATTERN = re.compile(
+    r"^P(?:(?P<weeks>\d+)W)?(?:(?P<days>\d+)D)?"
+    r"(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+(?:\.\d+)?)S)?)?$"
+)
+
+type Interval = tuple[datetime, datetime]
+type EventFetcher = Callable[[str, list[str], str, str], Awaitable[list[Event]]]
+
+
+def _parse_bound(value: str) -> tuple[datetime, bool]:
+    """Parse a window bound into naive UTC, noting whether it had an offset."""
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is None:
+        return dt, False
+    return dt.astimezone(UTC).replace(tzinfo=None), True
+
+
+def _format_bound(dt: datetime, aware: bool) -> str:
+    """Inverse of _parse_bound, preserving the caller's format."""
+    return dt.strftime(_LOCAL_DT_FMT) + ("Z" if aware else "")
+
+
+def split_window(start: str, end: str, max_span: timedelta) -> list[tuple[str, str]]:
+    """Split [start, end) into consecutive sub-windows no longer than max_span.
+
+    The outer bounds are returned verbatim; inner bounds use the same
+    format as the window (UTC with "Z" if it carried an offset). A window
+    that fits, or cannot be parsed, comes back as the single original pair.
+    """
+    try:
+        window_start, aware = _parse_bound(start)
+        window_end, _ = _parse_bound(end)
+    except ValueError:
+        return [(start, end)]
+    if max_span <= timedelta(0) or window_end - window_start <= max_span:
+        return [(start, end)]
+
+    bounds = [start]
+    cursor = window_start + max_span
+    while cursor < window_end:
+        bounds.append(_format_bound(cursor, aware))
+        cursor += max_span
+    bounds.append(end)
+    return list(pairwise(bounds))
+
+
+def _parse_duration(value: str | None) -> timedelta:
+    """Parse the week/day/time subset of ISO 8601 durations Morgen returns."""
+    match = _DURATION_PATTERN.match(value or "")
+    if not match:
+        return timedelta(0)
+    parts = {k: float(v) for k, v in match.groupdict().items() if v}
+    return timedelta(**parts)
+
+
+def _event_span(event: Event) -> Interval | None:
+    """Return the event's [start, end) in naive UTC, or None if unparseable."""
+    try:
+        start = datetime.fromisoformat(event.start)
+    except ValueError, TypeError:
+        return None
+    if start.tzinfo is not None:
+        start = start.astimezone(UTC).replace(tzinfo=None)
+    elif event.time_zone and not event.show_without_time:
+        try:
+            tz = time_zones.zone(event.time_zone)
+        except ZoneInfoNotFoundError:
+            tz = UTC
+        start = start.replace(tzinfo=tz).astimezone(UTC).replace(tzinfo=None)
+    return start, start + _parse_duration(event.duration)
+
+
+def _overlaps(span: Interval, window: Interval) -> bool:
+    start, end = span
+    if start == end:
+        return window[0] <= start < window[1]
+    return start < window[1] and end > window[0]
+
+
+def _subtract(window: Interval, covered: list[Interval]) -> list[Interval]:
+    """Return the parts of `window` not covered by any interval in `covered`."""
+    gaps: list[Interval] = []
+    cursor, end = window
+    for c_start, c_end in sorted(covered):
+        if c_end <= cursor:
+            continue
+        if c_start >= end:
+            break
+        if c_start > cursor:
+            gaps.append((cursor, c_start))
+        cursor = max(cursor, c_end)
+        if cursor >= end:
+            break
+    if cursor < end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+def _merge(intervals: list[Interval]) -> list[Interval]:
+    merged: list[Interval] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+@dataclass
+class _CalendarIndex:
+    """Events and fetched coverage for one (account, calendar)."""
+
+    coverage: list[tuple[Interval, float]] = field(default_factory=list)
+    events: dict[str, tuple[Interval, Event]] = field(default_factory=dict)
+    starts: list[tuple[datetime, str]] = field(default_factory=list)
+    max_span: timedelta = timedelta(0)
+
+    def fresh_coverage(self, now: float, ttl_s: float) -> list[Interval]:
+        self.coverage = [(iv, at) for iv, at in self.coverage if now - at < ttl_s]
+        return [iv for iv, _ in self.coverage]
+
+    def add(self, span: Interval, event: Event) -> None:
+        self.discard(event.id)
+        self.events[event.id] = (span, event)
+        insort(self.starts, (span[0], event.id))
+        self.max_span = max(self.max_span, span[1] - span[0])
+
+    def discard(self, event_id: str) -> None:
+        entry = self.events.pop(event_id, None)
+        if entry is None:
+            return
+        key = (entry[0][0], event_id)
+        i = bisect_left(self.starts, key)
+        if i < len(self.starts) and self.starts[i] == key:
+            del self.starts[i]
+
+    def query(self, window: Interval) -> list[tuple[Interval, Event]]:
+        """Events overlapping `window`, via bisect over start times."""
+        out: list[tuple[Interval, Event]] = []
+        i = bisect_left(self.starts, (window[0] - self.max_span,))
+        while i < len(self.starts) and self.starts[i][0] < window[1]:
+            entry = self.events[self.starts[i][1]]
+            if _overlaps(entry[0], window):
+                out.append(entry)
+            i += 1
+        return out
+
+    def prune(self) -> None:
+        """Drop events no longer inside any coverage interval."""
+        covered = [iv for iv, _ in self.coverage]
+        for event_id, (span, _) in list(self.events.items()):
+            if not any(_overlaps(span, iv) for iv in covered):
+                self.discard(event_id)
+
+
+class EventStore:
+    """Time-indexed event cache that fills windows incrementally."""
+
+    def __init__(
+        self,
+        ttl_s: float = DEFAULT_TTL_S,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the store.
+
+        Args:
+            ttl_s: How long a fetched range counts as fresh. 0 disables reuse.
+            clock: Monotonic time source (injectable for tests).
+        """
+        # Coverage keeps its own fetch times; this supplies the TTL and
+        # tells a fetch whether an invalidation overtook it.
+        self._freshness = Freshness(ttl_s, clock)
+        self._calendars: dict[tuple[str, str], _CalendarIndex] = {}
+
+    def _index(self, account_id: str, calendar_id: str) -> _CalendarIndex:
+        key = (account_id, calendar_id)
+        index = self._calendars.get(key)
+        if index is None:
+            index = self._calendars[key] = _CalendarIndex()
+        return index
+
+    def invalidate(
+        self, account_id: str | None = None, calendar_id: str | None = None
+    ) -> None:
+        """Forget stored events, optionally only for one account or calendar."""
+        self._freshness.invalidate()
+        for key in list(self._calendars):
+            if account_id is not None and key[0] != account_id:
+                continue
+            if calendar_id is not None and key[1] != calendar_id:
+                continue
+            del self._calendars[key]
+
+    async def list_events(
+        self,
+        account_id: str,
+        calendar_ids: list[str],
+        start: str,
+        end: str,
+        fetch: EventFetcher,
+    ) -> list[Event]:
+        """Return events in [start, end), fetching only uncovered ranges.
+
+        Args:
+            account_id: The calendar account ID.
+            calendar_ids: Calendars to include.
+            start: Window start, as passed to /events/list.
+            end: Window end, as passed to /events/list.
+            fetch: Upstream fetch with MorgenClient.list_events' signature.
+        """
+        try:
+            window_start, aware = _parse_bound(start)
+            window_end, _ = _parse_bound(end)
+        except ValueError:
+            return await fetch(account_id, calendar_ids, start, end)
+        window = (window_start, window_end)
+
+        ticket = self._freshness.begin()
+        gaps_by_calendar = {
+            cal_id: _subtract(
+                window,
+                self._index(account_id, cal_id).fresh_coverage(
+                    ticket.started_at, self._freshness.ttl_s
+                ),
+            )
+            for cal_id in calendar_ids
+        }
+        gaps = _merge([g for cal_gaps in gaps_by_calendar.values() for g in cal_gaps])
+
+        if gaps == [window] and all(
+            cal_gaps == [window] for cal_gaps in gaps_by_calendar.values()
+        ):
+            # Nothing usable is stored: fetch the window verbatim and return
+            # the upstream result exactly as received.
+            events = await fetch(account_id, calendar_ids, start, end)
+            self._store(account_id, calendar_ids, window, events, ticket)
+            return events
+
+        for gap in gaps:
+            cal_ids = [
+                cal_id
+                for cal_id, cal_gaps in gaps_by_calendar.items()
+                if any(_overlaps(g, gap) for g in cal_gaps)
+            ]
+            events = await fetch(
+                account_id,
+                cal_ids,
+                _format_bound(gap[0], aware),
+                _format_bound(gap[1], aware),
+            )
+            self._store(account_id, cal_ids, gap, events, ticket)
+
+        found: dict[str, tuple[Interval, Event]] = {}
+        for cal_id in calendar_ids:
+            for entry in self._index(account_id, cal_id).query(window):
+                found.setdefault(entry[1].id, entry)
+        return [event for _, event in sorted(found.values(), key=lambda e: e[0][0])]
+
+    def _store(
+        self,
+        account_id: str,
+        calendar_ids: list[str],
+        window: Interval,
+        events: list[Event],
+        ticket: Ticket,
+    ) -> None:
+        """Replace stored events in `window` with a fresh upstream result.
+
+        If the store was invalidated since `ticket` was taken, the result
+        may predate a write, so its coverage is stored already expired.
+        """
+        fetched_at = ticket.started_at
+        if self._freshness.overtaken(ticket):
+            fetched_at = -math.inf
+        for cal_id in calendar_ids:
+            index = self._index(account_id, cal_id)
+            for _, event in index.query(window):
+                index.discard(event.id)
+            index.coverage.append((window, fetched_at))
+            index.prune()
+
+        fetched = set(calendar_ids)
+        for event in events:
+            if event.account_id != account_id or event.calendar_id not in fetched:
+                continue
+            span = _event_span(event) or window
+            self._index(account_id, event.calendar_id).add(span, event)
@@ -0,0 +1,56 @@
+"""Bounded LRU memo for formatted tool and resource output.
+
+Formatting an event means ISO parsing, duration math, tz conversion and
+strftime, and the same unchanged events are formatted again on every
+view of the same week. FormatCache keeps the most recently used outputs;
+callers key them by what the output depends on (for events: ID, updated
+stamp, display tz and output mode), so entries never need invalidating
+and the least recently used ones simply fall out.
+"""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+
+DEFAULT_MAX_ENTRIES = 4096
+
+
+class FormatCache[K: Hashable, V]:
+    """Least-recently-used map of formatted output, at most `max_entries`."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Entries kept before the least recently used is
+                dropped. 0 disables caching.
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[K, V] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        """The cached value for `key`, marking it most recently used."""
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        """Store `value`, dropping the least recently used entries if full."""
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
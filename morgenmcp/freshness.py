@@ -0,0 +1,63 @@
+"""TTL and invalidation bookkeeping shared by the client's local stores.
+
+TaskMirror, TagIndex, Directory and EventStore each serve a copy of some
+upstream listing for `ttl_s` after fetching it, and MorgenClient
+invalidates a copy after writing to it. A write can land while a sync's
+fetch is in flight, and that fetch may have seen the pre-write state: its
+result still answers the read that made it, but must not count as fresh.
+
+Freshness tracks this with a generation counter. A sync calls begin()
+before fetching and finish() after applying the result; the copy only
+counts as fresh from the sync's start if no invalidate() came in between.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from typing import NamedTuple
+
+
+class Ticket(NamedTuple):
+    """When a sync started, and the generation it started from."""
+
+    started_at: float
+    generation: int
+
+
+class Freshness:
+    """Sync lock, last sync time and invalidation count of one local copy."""
+
+    def __init__(self, ttl_s: float, clock: Callable[[], float] = time.monotonic):
+        """Initialize the bookkeeping.
+
+        Args:
+            ttl_s: How long after a sync the copy is served as is. 0 makes
+                it stale on every read.
+            clock: Monotonic time source (injectable for tests).
+        """
+        self.ttl_s = ttl_s
+        self.clock = clock
+        self.synced_at: float | None = None
+        self.lock = asyncio.Lock()
+        self._generation = 0
+
+    def begin(self) -> Ticket:
+        """Start a sync; pass the ticket to finish() once it is applied."""
+        return Ticket(self.clock(), self._generation)
+
+    def stale(self, now: float) -> bool:
+        """Whether the copy needs a sync: never synced, invalidated or expired."""
+        return self.synced_at is None or now - self.synced_at >= self.ttl_s
+
+    def overtaken(self, ticket: Ticket) -> bool:
+        """Whether an invalidate() landed after `ticket` was taken."""
+        return ticket.generation != self._generation
+
+    def finish(self, ticket: Ticket) -> None:
+        """Mark the copy fresh as of `ticket`, unless it was overtaken."""
+        self.synced_at = None if self.overtaken(ticket) else ticket.started_at
+
+    def invalidate(self) -> None:
+        """Make the copy stale, including any sync currently in flight."""
+        self.synced_at = None
+        self._generation += 1
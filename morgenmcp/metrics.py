@@ -0,0 +1,233 @@
+"""Per-endpoint request metrics for MorgenClient.
+
+Every HTTP attempt MorgenClient makes is recorded against its endpoint
+path: count, status code, latency, response size and time spent waiting
+for rate-limit budget. Latency percentiles are computed over a window of
+recent samples, while a fixed-bucket histogram keeps the lifetime
+distribution for Prometheus. The rate-limit budget reported by the
+server is kept as a short history so its trend is visible.
+
+Surfaced through the morgen://metrics resources and the heartbeat log.
+"""
+
+import math
+import time
+from collections import Counter, deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from morgenmcp.models import RateLimitInfo
+
+RECENT_SAMPLES = 512
+"""Latency samples kept per endpoint for percentiles."""
+
+RATE_LIMIT_HISTORY = 60
+"""Rate-limit observations kept for the budget trend."""
+
+LATENCY_BUCKETS_S = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+"""Upper bounds of the Prometheus latency histogram (plus +Inf)."""
+
+TRANSPORT_ERROR = "transport_error"
+"""Status label for attempts that never got an HTTP response."""
+
+
+def _percentile(sorted_samples: list[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    rank = min(len(sorted_samples), max(1, math.ceil(q * len(sorted_samples))))
+    return sorted_samples[rank - 1]
+
+
+@dataclass
+class EndpointMetrics:
+    """Counters and latency samples for one endpoint path."""
+
+    requests: int = 0
+    statuses: Counter[str] = field(default_factory=Counter)
+    bytes_received: int = 0
+    latency_sum_s: float = 0.0
+    latency_max_s: float = 0.0
+    bucket_counts: list[int] = field(
+        default_factory=lambda: [0] * len(LATENCY_BUCKETS_S)
+    )
+    rate_limit_wait_s: float = 0.0
+    recent: deque[float] = field(default_factory=lambda: deque(maxlen=RECENT_SAMPLES))
+
+    def record(self, status: str, latency_s: float, size: int) -> None:
+        self.requests += 1
+        self.statuses[status] += 1
+        self.bytes_received += size
+        self.latency_sum_s += latency_s
+        self.latency_max_s = max(self.latency_max_s, latency_s)
+        for i, bound in enumerate(LATENCY_BUCKETS_S):
+            if latency_s <= bound:
+                self.bucket_counts[i] += 1
+        self.recent.append(latency_s)
+
+    def snapshot(self) -> dict[str, Any]:
+        samples = sorted(self.recent)
+        latency: dict[str, float] = {}
+        if samples:
+            latency = {
+                f"p{int(q * 100)}Ms": round(_percentile(samples, q) * 1000, 1)
+                for q in (0.5, 0.9, 0.99)
+            }
+            latency["maxMs"] = round(self.latency_max_s * 1000, 1)
+        return {
+            "requests": self.requests,
+            "statusCodes": dict(self.statuses),
+            "bytesReceived": self.bytes_received,
+            "avgBytes": self.bytes_received // self.requests if self.requests else 0,
+            "latency": latency,
+            "rateLimitWaitS": round(self.rate_limit_wait_s, 3),
+        }
+
+
+class ClientMetrics:
+    """Request metrics for one MorgenClient, keyed by endpoint path."""
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        """Initialize empty metrics.
+
+        Args:
+            clock: Wall-clock time source for rate-limit history timestamps.
+        """
+        self._clock = clock
+        self.started_at = clock()
+        self.endpoints: dict[str, EndpointMetrics] = {}
+        self.last_rate_limit: RateLimitInfo | None = None
+        self.rate_limit_history: deque[tuple[float, int]] = deque(
+            maxlen=RATE_LIMIT_HISTORY
+        )
+
+    def _endpoint(self, path: str) -> EndpointMetrics:
+        metrics = self.endpoints.get(path)
+        if metrics is None:
+            metrics = self.endpoints[path] = EndpointMetrics()
+        return metrics
+
+    def record(
+        self, path: str, status: int | str, latency_s: float, size: int = 0
+    ) -> None:
+        """Record one HTTP attempt (status is TRANSPORT_ERROR if it failed)."""
+        self._endpoint(path).record(str(status), latency_s, size)
+
+    def record_wait(self, path: str, wait_s: float) -> None:
+        """Record time an attempt spent waiting for rate-limit budget."""
+        if wait_s > 0:
+            self._endpoint(path).rate_limit_wait_s += wait_s
+
+    def observe_rate_limit(self, info: RateLimitInfo) -> None:
+        """Remember the budget the server reported."""
+        self.last_rate_limit = info
+        self.rate_limit_history.append((self._clock(), info.remaining))
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-ready view of all metrics."""
+        info = self.last_rate_limit
+        return {
+            "uptimeS": int(self._clock() - self.started_at),
+            "endpoints": {
+                path: metrics.snapshot()
+                for path, metrics in sorted(self.endpoints.items())
+            },
+            "rateLimit": {
+                "limit": info.limit,
+                "remaining": info.remaining,
+                "resetSeconds": info.reset_seconds,
+                "history": [
+                    {"at": int(at), "remaining": remaining}
+                    for at, remaining in self.rate_limit_history
+                ],
+            }
+            if info
+            else None,
+        }
+
+    def summary(self) -> str:
+        """One-line summary for the heartbeat log."""
+        total = sum(m.requests for m in self.endpoints.values())
+        errors = sum(
+            count
+            for m in self.endpoints.values()
+            for status, count in m.statuses.items()
+            if not status.startswith(("2", "3"))
+        )
+        slowest = ""
+        if self.endpoints:
+            path, metrics = max(
+                self.endpoints.items(),
+                key=lambda item: item[1].latency_sum_s / max(item[1].requests, 1),
+            )
+            avg_ms = metrics.latency_sum_s / max(metrics.requests, 1) * 1000
+            slowest = f" slowest={path}:{avg_ms:.0f}ms"
+        budget = ""
+        if self.last_rate_limit:
+            budget = (
+                f" ratelimit={self.last_rate_limit.remaining}"
+                f"/{self.last_rate_limit.limit}"
+            )
+        return f"api_requests={total} api_errors={errors}{slowest}{budget}"
+
+    def to_prometheus(self) -> str:
+        """Render metrics in the Prometheus text exposition format."""
+        lines = [
+            "# HELP morgen_api_requests_total Morgen API attempts by endpoint and status.",
+            "# TYPE morgen_api_requests_total counter",
+        ]
+        for path, m in sorted(self.endpoints.items()):
+            for status, count in sorted(m.statuses.items()):
+                lines.append(
+                    f'morgen_api_requests_total{{endpoint="{path}",status="{status}"}} {count}'
+                )
+
+        lines += [
+            "# HELP morgen_api_request_duration_seconds Morgen API attempt latency.",
+            "# TYPE morgen_api_request_duration_seconds histogram",
+        ]
+        for path, m in sorted(self.endpoints.items()):
+            label = f'endpoint="{path}"'
+            for bound, count in zip(LATENCY_BUCKETS_S, m.bucket_counts, strict=True):
+                lines.append(
+                    f'morgen_api_request_duration_seconds_bucket{{{label},le="{bound}"}} {count}'
+                )
+            lines += [
+                f'morgen_api_request_duration_seconds_bucket{{{label},le="+Inf"}} {m.requests}',
+                f"morgen_api_request_duration_seconds_sum{{{label}}} {m.latency_sum_s}",
+                f"morgen_api_request_duration_seconds_count{{{label}}} {m.requests}",
+            ]
+
+        lines += [
+            "# HELP morgen_api_response_bytes_total Response body bytes received.",
+            "# TYPE morgen_api_response_bytes_total counter",
+        ]
+        lines += [
+            f'morgen_api_response_bytes_total{{endpoint="{path}"}} {m.bytes_received}'
+            for path, m in sorted(self.endpoints.items())
+        ]
+
+        lines += [
+            "# HELP morgen_api_rate_limit_wait_seconds_total Time spent waiting for budget.",
+            "# TYPE morgen_api_rate_limit_wait_seconds_total counter",
+        ]
+        lines += [
+            f'morgen_api_rate_limit_wait_seconds_total{{endpoint="{path}"}} {m.rate_limit_wait_s}'
+            for path, m in sorted(self.endpoints.items())
+        ]
+
+        if info := self.last_rate_limit:
+            for name, value, help_text in (
+                ("limit", info.limit, "Points per rate-limit window."),
+                ("remaining", info.remaining, "Points left in the window."),
+                (
+                    "reset_seconds",
+                    info.reset_seconds,
+                    "Seconds until the window resets.",
+                ),
+            ):
+                lines += [
+                    f"# HELP morgen_api_rate_limit_{name} {help_text}",
+                    f"# TYPE morgen_api_rate_limit_{name} gauge",
+                    f"morgen_api_rate_limit_{name} {value}",
+                ]
+        return "\n".join(lines) + "\n"
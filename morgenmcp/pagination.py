@@ -0,0 +1,136 @@
+"""Cursor pagination over Morgen's updatedAfter-filtered list endpoints.
+
+/tasks/list returns at most 100 items per call and /tags/list is
+limit-capped the same way; neither hands out a page token. Both accept
+`updatedAfter` and return items oldest-update first, so the newest
+`updated` stamp of a full page is the cursor for the next one.
+
+Stamps have one-second resolution, and several items can share one. The
+next page therefore starts CURSOR_OVERLAP before the newest stamp and
+items already yielded are skipped by ID. If a full page ends in the
+second it started from (more than a page's worth of items within one
+second, e.g. after a bulk import), the same cursor is fetched again with
+a doubled limit until the page reaches past that second. The endpoints offer no other
+key to walk by, so if the server caps the limit, or it reaches
+page_size * MAX_LIMIT_GROWTH, the cursor moves strictly past the stamp
+and the items that did not fit are skipped with a warning.
+
+paginate() is an async generator: while the caller works on one page,
+the request for the next is already in flight.
+"""
+
+import asyncio
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Sequence,
+)
+from datetime import datetime, timedelta
+from typing import Protocol
+
+from fastmcp.utilities.logging import get_logger
+
+logger = get_logger(__name__)
+
+PAGE_SIZE = 100
+MAX_LIMIT_GROWTH = 16
+
+CURSOR_OVERLAP = timedelta(seconds=1)
+
+
+class Cursored(Protocol):
+    @property
+    def id(self) -> str: ...
+
+    @property
+    def updated(self) -> str | None: ...
+
+
+type PageFetcher[T] = Callable[[str | None, int], Awaitable[list[T]]]
+
+
+def since(stamp: str) -> str:
+    """The updatedAfter value that re-includes items updated at `stamp`."""
+    try:
+        dt = datetime.fromisoformat(stamp)
+    except ValueError:
+        return stamp
+    return (dt - CURSOR_OVERLAP).isoformat().replace("+00:00", "Z")
+
+
+def latest(items: Iterable[Cursored], cursor: str | None = None) -> str | None:
+    """The newest `updated` stamp among `items` and `cursor`, if any."""
+    stamps = [item.updated for item in items if item.updated]
+    if cursor:
+        stamps.append(cursor)
+    return max(stamps, default=None)
+
+
+def _next_request(
+    page: Sequence[Cursored], cursor: str | None, limit: int, page_size: int
+) -> tuple[str | None, int] | None:
+    """(updatedAfter, limit) of the request after `page`, or None at the end."""
+    newest = latest(page)
+    if newest is None:
+        return None
+    if len(page) < limit:
+        # A short page is the last one, unless the server ignored a grown
+        # limit and sent no more than before.
+        if limit == page_size or len(page) > limit // 2:
+            return None
+    elif cursor is None or since(newest) > cursor:
+        return since(newest), page_size
+    elif limit < page_size * MAX_LIMIT_GROWTH:
+        # The page ends in the second it started from: fetch that again
+        # with room to get past it.
+        return cursor, limit * 2
+    logger.warning(
+        "More than %d items share the updated stamp %s; "
+        "skipping the ones that did not fit in a page",
+        len(page),
+        newest,
+    )
+    if cursor is None or newest > cursor:
+        return newest, page_size
+    return None
+
+
+async def paginate[T: Cursored](
+    fetch: PageFetcher[T],
+    updated_after: str | None = None,
+    page_size: int = PAGE_SIZE,
+) -> AsyncGenerator[list[T]]:
+    """Yield every item updated after `updated_after`, one page at a time.
+
+    Args:
+        fetch: Fetches one page given (updatedAfter, limit).
+        updated_after: Where to start; None starts from the beginning.
+        page_size: Items per request. A shorter page ends the walk.
+    """
+    seen: set[str] = set()
+    cursor, limit = updated_after, page_size
+    pending: asyncio.Future[list[T]] | None = asyncio.ensure_future(
+        fetch(cursor, limit)
+    )
+    try:
+        while pending is not None:
+            page = await pending
+            pending = None
+            fresh = [item for item in page if item.id not in seen]
+            seen.update(item.id for item in fresh)
+            if (request := _next_request(page, cursor, limit, page_size)) is not None:
+                cursor, limit = request
+                pending = asyncio.ensure_future(fetch(cursor, limit))
+            if fresh:
+                yield fresh
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+async def collect[T](pages: AsyncIterator[list[T]]) -> list[T]:
+    """Concatenate every page of a paginate() walk."""
+    return [item async for page in pages for item in page]
@@ -0,0 +1,141 @@
+"""Client-side pacing against Morgen's point-based rate limit.
+
+Morgen meters usage in points per window and reports the budget on every
+response through the RateLimit-Limit / RateLimit-Remaining /
+RateLimit-Reset headers. Most endpoints cost one point; /tasks/list costs
+ten. Without pacing, a single asyncio.gather fan-out (batch deletes, the
+per-account list_events fetch) can spend the whole window in one burst,
+after which every tool fails with 429 until the reset.
+
+RateLimiter is a token bucket shared by all requests of one MorgenClient.
+Each request reserves its endpoint's cost before it is sent; every
+response feeds the server's view of the budget back in, so the local
+estimate never drifts above what Morgen will actually accept.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+
+from morgenmcp.models import MorgenAPIError, RateLimitInfo
+
+DEFAULT_LIMIT = 300
+DEFAULT_WINDOW_S = 900.0  # 15 minutes
+DEFAULT_COST = 1
+DEFAULT_MAX_WAIT_S = 30.0  # fail fast rather than outlive the tool timeout
+# Points background work (warm-up, subscription polls) leaves for
+# interactive requests: it skips a run while fewer are available.
+BACKGROUND_RESERVE = 100
+
+ENDPOINT_COSTS: dict[str, int] = {
+    "/tasks/list": 10,
+}
+"""Point cost per endpoint path. Anything not listed costs DEFAULT_COST."""
+
+
+class RateLimiter:
+    """Token bucket that paces requests to stay inside Morgen's budget.
+
+    Until the server has reported its budget, the bucket refills
+    continuously at limit/window. Once a response carries RateLimit-*
+    headers, the server's numbers win: the bucket is capped at
+    `remaining` and refills in full when the reported reset elapses.
+    """
+
+    def __init__(
+        self,
+        limit: int = DEFAULT_LIMIT,
+        window_s: float = DEFAULT_WINDOW_S,
+        costs: dict[str, int] | None = None,
+        max_wait_s: float = DEFAULT_MAX_WAIT_S,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            limit: Points per window, until the server reports its own limit.
+            window_s: Window length in seconds, used for continuous refill.
+            costs: Per-path point costs, merged over ENDPOINT_COSTS.
+            max_wait_s: Longest a request may wait for budget before
+                acquire() raises instead.
+            clock: Monotonic time source (injectable for tests).
+        """
+        self._capacity = float(limit)
+        self._tokens = float(limit)
+        self._window_s = window_s
+        self._refill_per_s = limit / window_s
+        self._costs = {**ENDPOINT_COSTS, **(costs or {})}
+        self._max_wait_s = max_wait_s
+        self._clock = clock
+        self._updated = clock()
+        self._reset_at: float | None = None
+        self._lock = asyncio.Lock()
+        self.last_info: RateLimitInfo | None = None
+
+    @property
+    def available(self) -> float:
+        """Points currently available without waiting."""
+        self._refill(self._clock())
+        return self._tokens
+
+    def cost(self, path: str) -> int:
+        """Return the point cost of a request to `path`."""
+        return self._costs.get(path, DEFAULT_COST)
+
+    def _refill(self, now: float) -> None:
+        if self._reset_at is not None:
+            # Server-reported window: nothing comes back until it resets.
+            if now >= self._reset_at:
+                self._tokens = self._capacity
+                self._reset_at = None
+        else:
+            elapsed = max(now - self._updated, 0.0)
+            self._tokens = min(
+                self._capacity, self._tokens + elapsed * self._refill_per_s
+            )
+        self._updated = now
+
+    def _wait_for(self, cost: float, now: float) -> float:
+        if self._reset_at is not None:
+            return max(self._reset_at - now, 0.0)
+        return max((cost - self._tokens) / self._refill_per_s, 0.0)
+
+    async def acquire(self, path: str) -> None:
+        """Reserve the cost of one request to `path`, waiting if needed.
+
+        Waiters are served in arrival order, so a burst of concurrent
+        requests is spread out rather than racing for the same points.
+
+        Raises:
+            MorgenAPIError: (status 429) if the budget will not cover the
+                request within max_wait_s.
+        """
+        cost = min(float(self.cost(path)), self._capacity)
+        async with self._lock:
+            while True:
+                now = self._clock()
+                self._refill(now)
+                if self._tokens >= cost:
+                    self._tokens -= cost
+                    return
+                wait = self._wait_for(cost, now)
+                if wait > self._max_wait_s:
+                    raise MorgenAPIError(
+                        f"Rate limit budget exhausted. Retry after {int(wait) + 1} seconds.",
+                        status_code=429,
+                        rate_limit_info=self.last_info,
+                    )
+                await asyncio.sleep(wait)
+
+    def observe(self, info: RateLimitInfo) -> None:
+        """Fold the budget reported by a response into the bucket."""
+        now = self._clock()
+        self._refill(now)
+        self.last_info = info
+        if info.limit > 0:
+            self._capacity = float(info.limit)
+            self._refill_per_s = info.limit / self._window_s
+        # Never trust the local estimate over the server's: other clients
+        # sharing the API key spend from the same budget.
+        self._tokens = min(self._tokens, float(info.remaining))
+        self._reset_at = now + max(info.reset_seconds, 0)
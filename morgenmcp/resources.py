@@ -17,29 +17,50 @@ URI scheme:
     morgen://tasks                        — open tasks (not completed/cancelled)
     morgen://tasks/today                  — open tasks due today
     morgen://tags                         — list of tags
+    morgen://metrics                      — per-endpoint Morgen API request metrics
+    morgen://metrics/prometheus           — the same, in Prometheus text format
 
-All bodies are JSON. IDs are virtual IDs, identical to those returned by tools.
+All bodies are JSON (except the Prometheus dump). IDs are virtual IDs,
+identical to those returned by tools.
+
+Event and task resources also accept a `fields` query parameter, e.g.
+morgen://tasks?fields=title,due. Task resources then return only those
+task fields. Event resources return objects with only those full-format
+fields (as list_events does), instead of compact one-liners.
 """
 
 from __future__ import annotations
 
 import asyncio
-import json
 from collections import defaultdict
-from datetime import date, datetime, timedelta, tzinfo
+from collections.abc import Collection
+from datetime import date, datetime, timedelta
 
 from fastmcp.exceptions import ResourceError
 
 from morgenmcp import __version__
 from morgenmcp.client import get_client
 from morgenmcp.models import Event
+from morgenmcp.serialization import dumps
 from morgenmcp.tools.calendars import _format_calendar
-from morgenmcp.tools.events import _format_compact_event, _resolve_display_tz
+from morgenmcp.tools.events import (
+    _EVENT_FIELDS,
+    _format_compact_event,
+    _format_full_event_json,
+    _resolve_display_tz,
+)
 from morgenmcp.tools.id_registry import HASH_SPEC, register_id, resolve_id
 from morgenmcp.tools.id_utils import extract_account_from_calendar
 from morgenmcp.tools.tags import _format_tag
-from morgenmcp.tools.tasks import _format_task
-from morgenmcp.tools.utils import filter_none_values
+from morgenmcp.tools.tasks import (
+    _TASK_FIELDS,
+    _due_datetime,
+    _format_task,
+    _is_open,
+    _tag_names,
+)
+from morgenmcp.tools.utils import filter_none_values, select_fields
+from morgenmcp.validators import ValidationError
 
 _LOCAL_DT_FMT = "%Y-%m-%dT%H:%M:%S"
 
@@ -51,7 +72,7 @@ def _today_range() -> tuple[str, str]:
     return start.strftime(_LOCAL_DT_FMT), end.strftime(_LOCAL_DT_FMT)
 
 
-def _this_week_range() -> tuple[str, str]:
+def this_week_range() -> tuple[str, str]:
     """ISO week: Monday 00:00 → next Monday 00:00 (local time)."""
     today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
     monday = today - timedelta(days=today.weekday())
@@ -66,7 +87,7 @@ def _upcoming_range(days: int = 7) -> tuple[str, str]:
     return start.strftime(_LOCAL_DT_FMT), end.strftime(_LOCAL_DT_FMT)
 
 
-async def _fetch_events_in_window(
+async def fetch_events_in_window(
     start: str,
     end: str,
     calendar_ids: list[str] | None = None,
@@ -125,12 +146,30 @@ def _format_account(acc) -> dict:
     )
 
 
+def _parse_fields(
+    fields: str | None, available: Collection[str]
+) -> frozenset[str] | None:
+    """Parse a comma-separated `fields` query parameter (see select_fields)."""
+    if fields is None:
+        return None
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    try:
+        return select_fields(names, available)
+    except ValidationError as e:
+        raise ResourceError(str(e)) from e
+
+
 def _events_payload(
-    events: list[Event], window: tuple[str, str], display_tz: tzinfo
+    events: list[Event], window: tuple[str, str], selected: frozenset[str] | None
 ) -> str:
-    return json.dumps(
+    if selected is None:
+        display_tz = _resolve_display_tz(None)
+        formatted = [_format_compact_event(e, display_tz) for e in events]
+    else:
+        formatted = [_format_full_event_json(e, selected) for e in events]
+    return dumps(
         {
-            "events": [_format_compact_event(e, display_tz) for e in events],
+            "events": formatted,
             "count": len(events),
             "window": {"start": window[0], "end": window[1]},
         }
@@ -152,7 +191,7 @@ async def res_server() -> str:
     the published `reference_implementation` and verify them against the
     `test_vectors` entries — this is a self-describing contract.
     """
-    return json.dumps(
+    return dumps(
         {
             "name": "morgen-calendar",
             "version": __version__,
@@ -168,7 +207,7 @@ async def res_accounts() -> str:
     """List of connected calendar accounts."""
     client = get_client()
     accounts = await client.list_accounts()
-    return json.dumps(
+    return dumps(
         {
             "accounts": [_format_account(a) for a in accounts],
             "count": len(accounts),
@@ -180,10 +219,9 @@ async def res_account(account_id: str) -> str:
     """Single account by virtual ID."""
     real_id = resolve_id(account_id)
     client = get_client()
-    accounts = await client.list_accounts()
-    for acc in accounts:
-        if acc.id == real_id:
-            return json.dumps({"account": _format_account(acc)})
+    acc = await client.get_account(real_id)
+    if acc is not None:
+        return dumps({"account": _format_account(acc)})
     raise ResourceError(f"Account {account_id!r} not found")
 
 
@@ -194,7 +232,7 @@ async def res_calendars() -> str:
     """List of all calendars across all accounts."""
     client = get_client()
     calendars = await client.list_calendars()
-    return json.dumps(
+    return dumps(
         {
             "calendars": [_format_calendar(c) for c in calendars],
             "count": len(calendars),
@@ -206,90 +244,83 @@ async def res_calendar(calendar_id: str) -> str:
     """Single calendar by virtual ID."""
     real_id = resolve_id(calendar_id)
     client = get_client()
-    calendars = await client.list_calendars()
-    for cal in calendars:
-        if cal.id == real_id:
-            return json.dumps({"calendar": _format_calendar(cal)})
+    cal = await client.get_calendar(real_id)
+    if cal is not None:
+        return dumps({"calendar": _format_calendar(cal)})
     raise ResourceError(f"Calendar {calendar_id!r} not found")
 
 
-async def res_calendar_events(calendar_id: str) -> str:
+async def res_calendar_events(calendar_id: str, fields: str | None = None) -> str:
     """Events in a single calendar from today through next 7 days."""
+    selected = _parse_fields(fields, _EVENT_FIELDS)
     real_id = resolve_id(calendar_id)
     start, end = _upcoming_range(days=7)
-    events = await _fetch_events_in_window(start, end, calendar_ids=[real_id])
-    display_tz = _resolve_display_tz(None)
-    return _events_payload(events, (start, end), display_tz)
+    events = await fetch_events_in_window(start, end, calendar_ids=[real_id])
+    return _events_payload(events, (start, end), selected)
 
 
 # --- Event window resources ---
 
 
-async def res_events_today() -> str:
+async def res_events_today(fields: str | None = None) -> str:
     """Events scheduled for today (local-midnight to local-midnight)."""
+    selected = _parse_fields(fields, _EVENT_FIELDS)
     start, end = _today_range()
-    events = await _fetch_events_in_window(start, end)
-    display_tz = _resolve_display_tz(None)
-    return _events_payload(events, (start, end), display_tz)
+    events = await fetch_events_in_window(start, end)
+    return _events_payload(events, (start, end), selected)
 
 
-async def res_events_this_week() -> str:
+async def res_events_this_week(fields: str | None = None) -> str:
     """Events scheduled this ISO week (Monday through Sunday, local)."""
-    start, end = _this_week_range()
-    events = await _fetch_events_in_window(start, end)
-    display_tz = _resolve_display_tz(None)
-    return _events_payload(events, (start, end), display_tz)
+    selected = _parse_fields(fields, _EVENT_FIELDS)
+    start, end = this_week_range()
+    events = await fetch_events_in_window(start, end)
+    return _events_payload(events, (start, end), selected)
 
 
-async def res_events_upcoming() -> str:
+async def res_events_upcoming(fields: str | None = None) -> str:
     """Events from now through the next 7 days."""
+    selected = _parse_fields(fields, _EVENT_FIELDS)
     start, end = _upcoming_range(days=7)
-    events = await _fetch_events_in_window(start, end)
-    display_tz = _resolve_display_tz(None)
-    return _events_payload(events, (start, end), display_tz)
+    events = await fetch_events_in_window(start, end)
+    return _events_payload(events, (start, end), selected)
 
 
 # --- Task resources ---
 
-_OPEN_PROGRESS_VALUES = {"needs-action", "in-process", None}
-
-
-def _is_open(task) -> bool:
-    return task.progress in _OPEN_PROGRESS_VALUES
-
 
 def _due_date(task) -> date | None:
-    if not task.due:
-        return None
-    try:
-        return datetime.fromisoformat(task.due).date()
-    except ValueError:
-        return None
+    due = _due_datetime(task)
+    return due.date() if due else None
 
 
-async def res_tasks() -> str:
+async def res_tasks(fields: str | None = None) -> str:
     """Open tasks (not completed or cancelled)."""
+    selected = _parse_fields(fields, _TASK_FIELDS)
     client = get_client()
-    tasks = await client.list_tasks()
+    tasks = await client.list_all_tasks()
     open_tasks = [t for t in tasks if _is_open(t)]
-    return json.dumps(
+    tag_names = await _tag_names(open_tasks, selected)
+    return dumps(
         {
-            "tasks": [_format_task(t) for t in open_tasks],
+            "tasks": [_format_task(t, tag_names, selected) for t in open_tasks],
             "count": len(open_tasks),
             "filter": "open",
         }
     )
 
 
-async def res_tasks_today() -> str:
+async def res_tasks_today(fields: str | None = None) -> str:
     """Open tasks with a due date of today (local)."""
+    selected = _parse_fields(fields, _TASK_FIELDS)
     client = get_client()
-    tasks = await client.list_tasks()
+    tasks = await client.list_all_tasks()
     today = date.today()
     todays = [t for t in tasks if _is_open(t) and _due_date(t) == today]
-    return json.dumps(
+    tag_names = await _tag_names(todays, selected)
+    return dumps(
         {
-            "tasks": [_format_task(t) for t in todays],
+            "tasks": [_format_task(t, tag_names, selected) for t in todays],
             "count": len(todays),
             "filter": "open,due_today",
             "date": today.isoformat(),
@@ -303,10 +334,25 @@ async def res_tasks_today() -> str:
 async def res_tags() -> str:
     """List of user tags."""
     client = get_client()
-    tags = await client.list_tags()
-    return json.dumps(
+    tags = await client.list_all_tags()
+    return dumps(
         {
             "tags": [_format_tag(t) for t in tags],
             "count": len(tags),
         }
     )
+
+
+# --- Metrics resources ---
+
+
+async def res_metrics() -> str:
+    """Per-endpoint request counts, latency percentiles, bytes and status
+    codes for this server's Morgen API calls, plus the rate-limit budget.
+    """
+    return dumps(get_client().metrics.snapshot())
+
+
+async def res_metrics_prometheus() -> str:
+    """The metrics from morgen://metrics in Prometheus text format."""
+    return get_client().metrics.to_prometheus()
@@ -0,0 +1,306 @@
+"""Response caching that write tools invalidate precisely.
+
+FastMCP's ResponseCachingMiddleware only expires entries by TTL, so a
+cached read could show data from before a write the user just made.
+DependencyCachingMiddleware records, for every cached tool call and
+resource read, which data it covered as dependency keys:
+
+- "accounts", "calendars", "tasks", "tags": whole collections.
+- "calendar:<id>", "task:<id>": a single item.
+- "events": events of every calendar; "events:<calendar id>": one calendar.
+
+Each write tool maps to the keys it touches, and the entries depending on
+any of them are deleted once the write finishes, whether or not it
+succeeded. IDs are virtual IDs, the same ones tool arguments and resource
+URIs carry. Event writes only name an event, so the calendar is derived
+from the event ID; when that fails, the write touches every calendar's
+events ("events:*").
+
+Changes made outside this server rely on the TTL, except for subscribed
+resources, whose poller calls invalidate_resource when they change.
+
+Resources whose window is computed from the local date at read time
+("today", "this week") are also dropped at the next local midnight, so
+a read just before it cannot serve yesterday's window afterwards.
+
+The middleware builds on ResponseCachingMiddleware internals: the cache
+key helpers imported below, and the instance's tool and resource
+settings, tool filter and key-value stores. pyproject.toml pins fastmcp
+to the 3.3 series, which these were checked against, and
+tests/test_response_cache.py fails if a release drops or changes one.
+"""
+
+import re
+import time
+from collections.abc import Callable, Iterable
+from datetime import datetime, timedelta
+from typing import Any
+
+from fastmcp.server.middleware.caching import (
+    ResponseCachingMiddleware,
+    _get_auth_partition_key,
+    _make_call_tool_cache_key,
+    _make_read_resource_cache_key,
+)
+
+from morgenmcp.tools.id_registry import register_id, resolve_id
+from morgenmcp.tools.id_utils import extract_ids_from_event
+
+type Keys = frozenset[str]
+
+_ALL_EVENTS = "events:*"
+_TASK_READS = frozenset({"tasks", "tags"})  # task output carries tag names
+_PRUNE_AT = 512
+
+
+def _calendar_events(calendar_id: str) -> str:
+    return f"events:{calendar_id}"
+
+
+def _event_keys(event_id: Any) -> set[str]:
+    """Keys touched by a write to one event, given its virtual ID."""
+    try:
+        _, calendar_id = extract_ids_from_event(resolve_id(str(event_id)))
+    except Exception:
+        return {"events", _ALL_EVENTS}
+    return {"events", _calendar_events(register_id(calendar_id))}
+
+
+def _task_keys(task_id: Any) -> set[str]:
+    return {"tasks", f"task:{task_id}"}
+
+
+def _list_events_deps(args: dict[str, Any]) -> set[str]:
+    if calendar_ids := args.get("calendar_ids"):
+        return {_calendar_events(c) for c in calendar_ids}
+    return {"events"}
+
+
+# Cached read tool -> dependency keys of its result.
+READ_TOOL_DEPENDENCIES: dict[str, Callable[[dict[str, Any]], Iterable[str]]] = {
+    "morgen_list_accounts": lambda args: {"accounts"},
+    "morgen_list_calendars": lambda args: {"calendars"},
+    "morgen_list_events": _list_events_deps,
+    "morgen_list_tasks": lambda args: _TASK_READS,
+    "morgen_get_task": lambda args: {f"task:{args.get('task_id')}", "tags"},
+    "morgen_list_tags": lambda args: {"tags"},
+}
+
+# Write tool -> keys it touches.
+WRITE_TOOL_KEYS: dict[str, Callable[[dict[str, Any]], Iterable[str]]] = {
+    "morgen_update_calendar_metadata": lambda args: {
+        "calendars",
+        f"calendar:{args.get('calendar_id')}",
+    },
+    "morgen_create_event": lambda args: {
+        "events",
+        _calendar_events(args.get("calendar_id", "*")),
+    },
+    "morgen_update_event": lambda args: _event_keys(args.get("event_id")),
+    "morgen_delete_event": lambda args: _event_keys(args.get("event_id")),
+    "morgen_batch_delete_events": lambda args: set().union(
+        {"events"}, *(_event_keys(e) for e in args.get("event_ids") or [])
+    ),
+    "morgen_batch_update_events": lambda args: set().union(
+        {"events"},
+        *(_event_keys(u.get("event_id")) for u in args.get("updates") or []),
+    ),
+    "morgen_create_task": lambda args: {"tasks"},
+    "morgen_update_task": lambda args: _task_keys(args.get("task_id")),
+    "morgen_move_task": lambda args: _task_keys(args.get("task_id")),
+    "morgen_complete_task": lambda args: _task_keys(args.get("task_id")),
+    "morgen_reopen_task": lambda args: _task_keys(args.get("task_id")),
+    "morgen_delete_task": lambda args: _task_keys(args.get("task_id")),
+    "morgen_batch_delete_tasks": lambda args: set().union(
+        {"tasks"}, *(_task_keys(t) for t in args.get("task_ids") or [])
+    ),
+    "morgen_create_tag": lambda args: {"tags"},
+    "morgen_update_tag": lambda args: {"tags"},
+    "morgen_delete_tag": lambda args: {"tags"},
+}
+
+# Resource URI pattern -> dependency keys of its content.
+RESOURCE_DEPENDENCIES: list[
+    tuple[re.Pattern[str], Callable[[re.Match[str]], Iterable[str]]]
+] = [
+    (re.compile(r"morgen://server"), lambda m: ()),
+    (re.compile(r"morgen://accounts|morgen://account/.+"), lambda m: {"accounts"}),
+    (re.compile(r"morgen://calendars"), lambda m: {"calendars"}),
+    (
+        re.compile(r"morgen://calendar/([^/]+)/events"),
+        lambda m: {_calendar_events(m[1])},
+    ),
+    (re.compile(r"morgen://calendar/([^/]+)"), lambda m: {f"calendar:{m[1]}"}),
+    (re.compile(r"morgen://events/.+"), lambda m: {"events"}),
+    (re.compile(r"morgen://tasks(/.+)?"), lambda m: _TASK_READS),
+    (re.compile(r"morgen://tags"), lambda m: {"tags"}),
+]
+
+
+def resource_dependencies(uri: str) -> Keys | None:
+    """Dependency keys of a resource, or None if the URI is unknown.
+
+    Query parameters (such as a `fields` projection) do not change what
+    data the resource covers and are ignored.
+    """
+    path = uri.partition("?")[0]
+    for pattern, deps in RESOURCE_DEPENDENCIES:
+        if match := pattern.fullmatch(path):
+            return frozenset(deps(match))
+    return None
+
+
+def _affected(deps: Keys, touched: Keys) -> bool:
+    if deps & touched:
+        return True
+    return _ALL_EVENTS in touched and any(d.startswith("events:") for d in deps)
+
+
+class DependencyCachingMiddleware(ResponseCachingMiddleware):
+    """ResponseCachingMiddleware whose entries write tools invalidate.
+
+    Resources whose URI has no known dependencies are cached with a
+    dependency on everything, so any write drops them.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        uncached_resources: Iterable[str] = (),
+        day_relative_resources: Iterable[str] = (),
+        clock: Callable[[], float] = time.monotonic,
+        local_now: Callable[[], datetime] = datetime.now,
+        **kwargs: Any,
+    ):
+        """Initialize the middleware.
+
+        Args:
+            *args: Passed to ResponseCachingMiddleware.
+            uncached_resources: Resource URIs never served from the cache.
+            day_relative_resources: Resource URIs (with any query) whose
+                cached reads expire at the next local midnight at the latest.
+            clock: Monotonic time source (injectable for tests).
+            local_now: Local wall-clock time source (injectable for tests).
+            **kwargs: Passed to ResponseCachingMiddleware.
+        """
+        super().__init__(*args, **kwargs)
+        self._uncached_resources = frozenset(uncached_resources)
+        self._day_relative_resources = frozenset(day_relative_resources)
+        self._clock = clock
+        self._local_now = local_now
+        # (collection, cache key) -> (dependency keys, expiry)
+        self._entries: dict[tuple[str, str], tuple[Keys | None, float]] = {}
+        self._generation = 0
+
+    async def on_call_tool(self, context, call_next):
+        name = context.message.name
+        args = context.message.arguments or {}
+        if (touches := WRITE_TOOL_KEYS.get(name)) is not None:
+            try:
+                touched: Keys | None = frozenset(touches(args))
+            except Exception:
+                touched = None  # malformed arguments: drop everything
+            try:
+                return await call_next(context=context)
+            finally:
+                await self.invalidate(touched)
+        if self._call_tool_settings.get(
+            "enabled"
+        ) is False or not self._matches_tool_cache_settings(tool_name=name):
+            return await call_next(context=context)
+
+        deps_of = READ_TOOL_DEPENDENCIES.get(name)
+        key = _make_call_tool_cache_key(
+            msg=context.message, auth_key=_get_auth_partition_key()
+        )
+        return await self._tracked(
+            "tools/call",
+            key,
+            frozenset(deps_of(args)) if deps_of else None,
+            self._call_tool_settings.get("ttl"),
+            super().on_call_tool(context, call_next),
+        )
+
+    async def on_read_resource(self, context, call_next):
+        uri = str(context.message.uri)
+        if uri in self._uncached_resources:
+            return await call_next(context=context)
+        if self._read_resource_settings.get("enabled") is False:
+            return await call_next(context=context)
+
+        key = _make_read_resource_cache_key(
+            msg=context.message, auth_key=_get_auth_partition_key()
+        )
+        ttl = self._read_resource_settings.get("ttl")
+        if uri.split("?", 1)[0] in self._day_relative_resources:
+            ttl = min(ttl or 3600, self._until_midnight())
+        return await self._tracked(
+            "resources/read",
+            key,
+            resource_dependencies(uri),
+            ttl,
+            super().on_read_resource(context, call_next),
+        )
+
+    def _until_midnight(self) -> float:
+        now = self._local_now()
+        midnight = (now + timedelta(days=1)).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        return (midnight - now).total_seconds()
+
+    async def invalidate(self, touched: Keys | None) -> None:
+        """Delete every cached entry that depends on any of `touched`.
+
+        None deletes every tracked entry.
+        """
+        self._generation += 1
+        now = self._clock()
+        for entry, (deps, expires) in list(self._entries.items()):
+            if (
+                expires <= now
+                or touched is None
+                or deps is None
+                or _affected(deps, touched)
+            ):
+                del self._entries[entry]
+                await self._delete(*entry)
+
+    async def invalidate_resource(self, uri: str) -> None:
+        """Delete cached entries that overlap the data behind a resource.
+
+        Used when a resource is found to have changed upstream, so cached
+        reads of the same data are not served for the rest of their TTL.
+        """
+        await self.invalidate(resource_dependencies(uri))
+
+    async def _tracked(self, collection, key, deps, ttl, read):
+        # Entries can expire here before the underlying cache's TTL does
+        # (see day_relative_resources), so expired ones are deleted there too.
+        now = self._clock()
+        if (entry := self._entries.get((collection, key))) and entry[1] <= now:
+            del self._entries[(collection, key)]
+            await self._delete(collection, key)
+        generation = self._generation
+        result = await read
+        if self._generation != generation:
+            # A write finished while this read was in flight; the stored
+            # result may predate it.
+            await self._delete(collection, key)
+            return result
+        if len(self._entries) >= _PRUNE_AT:
+            now = self._clock()
+            for expired in [e for e, v in self._entries.items() if v[1] <= now]:
+                del self._entries[expired]
+                await self._delete(*expired)
+        # A hit must not push the expiry past the cached copy's own.
+        self._entries.setdefault((collection, key), (deps, now + (ttl or 3600)))
+        return result
+
+    async def _delete(self, collection: str, key: str) -> None:
+        cache = (
+            self._call_tool_cache
+            if collection == "tools/call"
+            else self._read_resource_cache
+        )
+        await cache.delete(key=key)
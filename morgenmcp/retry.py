@@ -0,0 +1,140 @@
+"""Retry policy for transient Morgen API failures.
+
+A single 429 or 5xx used to fail the whole tool call (or silently drop one
+account from a list_events fan-out). MorgenClient now retries reads and
+idempotent writes on transient failures, with:
+
+- full-jitter exponential backoff, so concurrent retries don't resynchronize;
+- Retry-After honoring, as either delta-seconds or an HTTP date;
+- a client-wide retry budget, so that under sustained overload retries stay a
+  small fraction of traffic instead of multiplying it.
+
+Non-idempotent writes (create, delete, move) are never retried: a timeout
+after the server applied the write would turn one create into two.
+"""
+
+import random
+from collections.abc import Callable
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BASE_DELAY_S = 0.5
+DEFAULT_MAX_DELAY_S = 8.0
+DEFAULT_MAX_RETRY_AFTER_S = 30.0  # longer waits would outlive the tool timeout
+DEFAULT_BUDGET_CAPACITY = 10.0
+DEFAULT_BUDGET_RATIO = 0.1  # one retry earned per ten first attempts
+
+
+def parse_retry_after(response: httpx.Response) -> float | None:
+    """Parse a Retry-After header into seconds from now.
+
+    Returns:
+        Seconds to wait, or None if the header is absent or malformed.
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except TypeError, ValueError:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max((when - datetime.now(UTC)).total_seconds(), 0.0)
+
+
+class RetryBudget:
+    """Token bucket bounding retries to a fraction of first attempts.
+
+    Every first attempt deposits `ratio` tokens (up to `capacity`); every
+    retry withdraws one. When the bucket is empty, failures surface
+    immediately instead of adding load to an already struggling upstream.
+    """
+
+    def __init__(
+        self,
+        capacity: float = DEFAULT_BUDGET_CAPACITY,
+        ratio: float = DEFAULT_BUDGET_RATIO,
+    ):
+        self._capacity = capacity
+        self._ratio = ratio
+        self._tokens = capacity
+
+    @property
+    def available(self) -> float:
+        """Retries currently affordable."""
+        return self._tokens
+
+    def deposit(self) -> None:
+        """Credit one first attempt."""
+        self._tokens = min(self._capacity, self._tokens + self._ratio)
+
+    def withdraw(self) -> bool:
+        """Spend one retry. Returns False if the budget is exhausted."""
+        if self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        return True
+
+
+class RetryPolicy:
+    """Decides whether and how long to wait before retrying a request."""
+
+    def __init__(
+        self,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        base_delay_s: float = DEFAULT_BASE_DELAY_S,
+        max_delay_s: float = DEFAULT_MAX_DELAY_S,
+        max_retry_after_s: float = DEFAULT_MAX_RETRY_AFTER_S,
+        budget: RetryBudget | None = None,
+        rng: Callable[[], float] = random.random,
+    ):
+        """Initialize the policy.
+
+        Args:
+            max_attempts: Total attempts per request, including the first.
+            base_delay_s: Backoff ceiling for the first retry; doubles per retry.
+            max_delay_s: Upper bound for the backoff ceiling.
+            max_retry_after_s: Give up instead of honoring a longer Retry-After.
+            budget: Shared retry budget. Defaults to a fresh RetryBudget.
+            rng: Uniform [0, 1) source for jitter (injectable for tests).
+        """
+        self.max_attempts = max_attempts
+        self.base_delay_s = base_delay_s
+        self.max_delay_s = max_delay_s
+        self.max_retry_after_s = max_retry_after_s
+        self.budget = budget or RetryBudget()
+        self._rng = rng
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given 0-based retry."""
+        ceiling = min(self.max_delay_s, self.base_delay_s * (2**attempt))
+        return self._rng() * ceiling
+
+    def next_delay(
+        self, attempt: int, retry_after: float | None = None
+    ) -> float | None:
+        """Return the delay before retry number `attempt` (0-based), or None.
+
+        None means "don't retry": attempts are used up, the server asked for
+        a wait longer than max_retry_after_s, or the retry budget is empty.
+        """
+        if attempt + 1 >= self.max_attempts:
+            return None
+        if retry_after is not None and retry_after > self.max_retry_after_s:
+            return None
+        if not self.budget.withdraw():
+            return None
+        delay = self.backoff(attempt)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
@@ -0,0 +1,78 @@
+"""Compact JSON encoding for resource bodies.
+
+Resources return JSON text, which the MCP transport embeds in its own
+message, so the text itself is what there is to make cheap. dumps writes
+it without whitespace or ASCII escaping, using orjson when it is
+installed (several times faster on large payloads) and the stdlib
+encoder otherwise; both produce the same document.
+
+Fragment holds JSON that is already encoded, e.g. an item whose formatted
+output is cached. dumps embeds it verbatim, so unchanged items are not
+re-encoded on every read.
+"""
+
+import json
+import re
+import secrets
+from typing import Any
+
+try:
+    import orjson  # pyright: ignore[reportMissingImports]
+except ImportError:  # optional speedup: the "fast" extra
+    orjson = None
+
+
+class Fragment:
+    """Pre-encoded JSON, embedded verbatim by dumps."""
+
+    __slots__ = ("json",)
+
+    def __init__(self, json_text: str):
+        self.json = json_text
+
+    @classmethod
+    def of(cls, value: Any) -> Fragment:
+        """Encode `value` once, for embedding in later dumps calls."""
+        return cls(dumps(value))
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Fragment) and other.json == self.json
+
+    def __hash__(self) -> int:
+        return hash(self.json)
+
+    def __repr__(self) -> str:
+        return f"Fragment({self.json!r})"
+
+
+def _orjson_default(value: Any) -> Any:
+    assert orjson is not None  # only passed to orjson.dumps
+    if isinstance(value, Fragment):
+        return orjson.Fragment(value.json)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value: Any) -> str:
+    """Encode `value` as compact JSON text, embedding any Fragments."""
+    if orjson is not None:
+        return orjson.dumps(value, default=_orjson_default).decode()
+    return _stdlib_dumps(value)
+
+
+def _stdlib_dumps(value: Any) -> str:
+    # The stdlib encoder cannot emit raw text, so each Fragment is encoded
+    # as a unique placeholder string and swapped in afterwards.
+    fragments: list[str] = []
+    nonce = secrets.token_hex(4)
+
+    def default(obj: Any) -> Any:
+        if isinstance(obj, Fragment):
+            fragments.append(obj.json)
+            return f"\x00{nonce}:{len(fragments) - 1}\x00"
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    text = json.dumps(value, default=default, ensure_ascii=False, separators=(",", ":"))
+    if not fragments:
+        return text
+    placeholder = re.compile(rf'"\\u0000{nonce}:(\d+)\\u0000"')
+    return placeholder.sub(lambda m: fragments[int(m[1])], text)
@@ -3,17 +3,15 @@
 import asyncio
 import os
 import time
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 
 from fastmcp import FastMCP
-from fastmcp.server.middleware.caching import (
-    CallToolSettings,
-    ReadResourceSettings,
-    ResponseCachingMiddleware,
-)
+from fastmcp.resources import FunctionResource
+from fastmcp.server.middleware.caching import CallToolSettings, ReadResourceSettings
 from fastmcp.utilities.logging import get_logger
+from mcp.types import Annotations
 
 from morgenmcp import __version__
 from morgenmcp.resources import (
@@ -25,11 +23,15 @@ from morgenmcp.resources import (
     res_events_this_week,
     res_events_today,
     res_events_upcoming,
+    res_metrics,
+    res_metrics_prometheus,
     res_server,
     res_tags,
     res_tasks,
     res_tasks_today,
 )
+from morgenmcp.response_cache import DependencyCachingMiddleware
+from morgenmcp.subscriptions import SubscriptionHub, enable_subscriptions
 from morgenmcp.tools.accounts import list_accounts
 from morgenmcp.tools.calendars import list_calendars, update_calendar_metadata
 from morgenmcp.tools.events import (
@@ -50,6 +52,7 @@ from morgenmcp.tools.tasks import (
     get_task,
     list_tasks,
     move_task,
+    query_tasks,
     reopen_task,
     update_task,
 )
@@ -58,9 +61,13 @@ logger = get_logger(__name__)
 
 _ID_STORE_DIR = "id_store"
 _ID_COLLECTION = "id_mappings"
+_ID_DB_FILE = "id_mappings.sqlite3"
 _HEARTBEAT_INTERVAL_S = (
     300.0  # 5 minutes — long enough not to spam, short enough to detect wedges
 )
+# How often subscribed resources are re-read to detect upstream changes;
+# a task delta alone costs 10 points (see morgenmcp.subscriptions).
+_SUBSCRIPTION_POLL_S = 300.0
 
 
 def _get_data_dir() -> Path:
@@ -74,6 +81,28 @@ def _get_data_dir() -> Path:
     return Path(platformdirs.user_data_dir("morgenmcp"))
 
 
+def _preload_ids() -> bool:
+    """Whether to load every persisted ID mapping at startup.
+
+    Off by default: resolve_id looks unknown IDs up in the store on first
+    use, so startup time does not grow with the ID history. Set
+    MORGENMCP_ID_PRELOAD=1 to load everything up front instead.
+    """
+    return os.environ.get("MORGENMCP_ID_PRELOAD", "").lower() in {"1", "true", "yes"}
+
+
+def _warmup_enabled() -> bool:
+    """Whether to prefetch hot data once, right after startup.
+
+    Off by default; set MORGENMCP_WARMUP=1 to enable. The prefetch is not
+    repeated: the stores it fills go stale within one to five minutes, and
+    refreshing them that often in the background would spend rate budget
+    on data nothing may read. After startup, each store refreshes on the
+    first read that finds it stale.
+    """
+    return os.environ.get("MORGENMCP_WARMUP", "").lower() in {"1", "true", "yes"}
+
+
 async def _heartbeat(started_at: float) -> None:
     """Periodically log liveness so a wedged event loop is detectable in logs.
 
@@ -82,11 +111,15 @@ async def _heartbeat(started_at: float) -> None:
     that *does* keep firing means the loop is healthy and the wedge is in the
     transport; a heartbeat that *stops* means the loop itself is stuck.
     """
+    from morgenmcp.client import get_client
+
     while True:
         try:
             await asyncio.sleep(_HEARTBEAT_INTERVAL_S)
             uptime_s = int(time.monotonic() - started_at)
-            logger.info("heartbeat uptime=%ds", uptime_s)
+            logger.info(
+                "heartbeat uptime=%ds %s", uptime_s, get_client().metrics.summary()
+            )
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -98,23 +131,24 @@ async def lifespan(server: FastMCP) -> AsyncIterator[None]:
     """Initialize and clean up the Morgen HTTP client and persistent ID store."""
     from morgenmcp.client import get_client
     from morgenmcp.tools.id_registry import flush_pending, load_from_store, set_store
+    from morgenmcp.tools.id_store import SQLiteIDStore, migrate_from_filetree
 
     started_at = time.monotonic()
     logger.info("morgenmcp lifespan starting")
 
     # Initialize persistent ID store
+    store: SQLiteIDStore | None = None
     try:
-        from key_value.aio.stores.filetree import FileTreeStore
-
         data_dir = _get_data_dir() / _ID_STORE_DIR
-        store = FileTreeStore(
-            data_directory=data_dir,
-            default_collection=_ID_COLLECTION,
-        )
+        store = SQLiteIDStore(data_dir / _ID_DB_FILE)
         await store.setup()
+        await migrate_from_filetree(store, data_dir, _ID_COLLECTION)
         set_store(store)
-        count = await load_from_store(data_dir, _ID_COLLECTION)
-        logger.info("ID store ready (%d persisted mappings loaded)", count)
+        if _preload_ids():
+            count = await load_from_store(data_dir, _ID_COLLECTION)
+            logger.info("ID store ready (%d persisted mappings loaded)", count)
+        else:
+            logger.info("ID store ready (persisted mappings resolved on demand)")
     except Exception:
         logger.warning(
             "Failed to initialize persistent ID store, continuing without persistence",
@@ -125,14 +159,24 @@ async def lifespan(server: FastMCP) -> AsyncIterator[None]:
     heartbeat_task = asyncio.create_task(
         _heartbeat(started_at), name="morgenmcp-heartbeat"
     )
+    subscription_task = asyncio.create_task(
+        _subscriptions.run(), name="morgenmcp-subscriptions"
+    )
+    background: list[asyncio.Task] = [subscription_task, heartbeat_task]
+    if _warmup_enabled():
+        from morgenmcp.warmup import warm_up
+
+        background.append(asyncio.create_task(warm_up(), name="morgenmcp-warmup"))
+        logger.info("warm-up enabled (startup only)")
     logger.info("morgenmcp ready (heartbeat every %ds)", int(_HEARTBEAT_INTERVAL_S))
 
     try:
         yield
     finally:
-        heartbeat_task.cancel()
-        with suppress(asyncio.CancelledError):
-            await heartbeat_task
+        for task in background:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
         try:
             await flush_pending()
         except Exception:
@@ -140,6 +184,11 @@ async def lifespan(server: FastMCP) -> AsyncIterator[None]:
                 "Error flushing pending ID writes on shutdown", exc_info=True
             )
         set_store(None)
+        if store is not None:
+            try:
+                await store.close()
+            except Exception:
+                logger.warning("Error closing ID store on shutdown", exc_info=True)
         client = get_client()
         await client.close()
         logger.info("morgenmcp lifespan stopped")
@@ -162,25 +211,39 @@ mcp = FastMCP(
 
     Calendar workflow:
     1. Use list_calendars to discover available calendars
-    2. Use list_events with calendar_ids to get events (compact=True for fewer tokens)
+    2. Use list_events with calendar_ids to get events (compact=True for fewer
+       tokens, or fields=["title", "start", ...] to return only those fields)
     3. Use update_event or delete_event with just event_id
     4. Use batch_delete_events or batch_update_events for bulk operations
 
     Task workflow:
-    1. Use list_tasks to enumerate tasks (paginate via limit + updated_after)
+    1. Use list_tasks to enumerate tasks (all_pages=True to go past 100;
+       fields=[...] to return only some fields),
+       or query_tasks to filter all tasks by status, due date, tags or text
     2. Use create_task / update_task / delete_task for CRUD
     3. Use complete_task / reopen_task to toggle completion
     4. Use move_task to reorder or change a task's parent
 
     Tag workflow:
-    1. Use list_tags to enumerate user tags
+    1. Use list_tags to enumerate user tags, or list_tags(name=...) to find
+       one; task results already include tag names as tagNames
     2. Use create_tag / update_tag / delete_tag for CRUD
     3. Pass tag virtual IDs to create_task or update_task via tag_ids
 
+    Resource field projection:
+    - Event and task resources accept ?fields=a,b (e.g.
+      morgen://tasks?fields=title,due) to return only those fields
+
+    Resource subscriptions:
+    - morgen://events/today, morgen://tasks and morgen://tags support
+      resources/subscribe; a resources/updated notification is sent only
+      when their content actually changes
+
     Simplified signatures:
     - create_event: just calendar_id (account derived automatically)
     - update_event/delete_event: just event_id (account/calendar derived automatically)
-    - list_events: optional calendar_ids (queries all if omitted)
+    - list_events: optional calendar_ids (queries all if omitted); with
+      stream=True each account's events also arrive as progress messages
 
     Important notes:
     - Times are in LocalDateTime format (e.g., "2023-03-01T10:15:00") with separate timeZone
@@ -303,6 +366,16 @@ mcp.tool(
         "openWorldHint": True,
     },
 )(list_tasks)
+mcp.tool(
+    name="morgen_query_tasks",
+    tags={"tasks", "read"},
+    timeout=30.0,
+    annotations={
+        "title": "Query Tasks",
+        "readOnlyHint": True,
+        "openWorldHint": True,
+    },
+)(query_tasks)
 mcp.tool(
     name="morgen_get_task",
     tags={"tasks", "read"},
@@ -443,7 +516,37 @@ mcp.tool(
 
 
 # MCP resources — read-only data clients can fetch without invoking tools
-_RESOURCE_ANNOTATIONS = {"readOnlyHint": True, "idempotentHint": True}
+# Annotations declares no hint fields; they are carried as allowed extras.
+_RESOURCE_ANNOTATIONS = Annotations.model_validate(
+    {"readOnlyHint": True, "idempotentHint": True}
+)
+
+
+def _projectable_resource(
+    uri: str, fn: Callable[..., Awaitable[str]], tags: set[str]
+) -> None:
+    """Register `fn` at `uri` and, for field projection, at `uri{?fields}`.
+
+    The plain URI stays a listed resource served with every field; a read
+    of `uri?fields=...` has no exact match and falls through to the
+    template, which passes `fields` to `fn`.
+    """
+    mcp.add_resource(
+        FunctionResource.from_function(
+            fn,
+            uri=uri,
+            mime_type="application/json",
+            tags=tags,
+            annotations=_RESOURCE_ANNOTATIONS,
+        )
+    )
+    mcp.resource(
+        uri + "{?fields}",
+        mime_type="application/json",
+        tags=tags,
+        annotations=_RESOURCE_ANNOTATIONS,
+    )(fn)
+
 
 mcp.resource(
     "morgen://server",
@@ -476,47 +579,40 @@ mcp.resource(
     annotations=_RESOURCE_ANNOTATIONS,
 )(res_calendar)
 mcp.resource(
-    "morgen://calendar/{calendar_id}/events",
+    "morgen://calendar/{calendar_id}/events{?fields}",
     mime_type="application/json",
     tags={"calendars", "events", "read"},
     annotations=_RESOURCE_ANNOTATIONS,
 )(res_calendar_events)
+_projectable_resource(
+    "morgen://events/today", res_events_today, tags={"events", "read"}
+)
+_projectable_resource(
+    "morgen://events/this-week", res_events_this_week, tags={"events", "read"}
+)
+_projectable_resource(
+    "morgen://events/upcoming", res_events_upcoming, tags={"events", "read"}
+)
+_projectable_resource("morgen://tasks", res_tasks, tags={"tasks", "read"})
+_projectable_resource("morgen://tasks/today", res_tasks_today, tags={"tasks", "read"})
 mcp.resource(
-    "morgen://events/today",
-    mime_type="application/json",
-    tags={"events", "read"},
-    annotations=_RESOURCE_ANNOTATIONS,
-)(res_events_today)
-mcp.resource(
-    "morgen://events/this-week",
-    mime_type="application/json",
-    tags={"events", "read"},
-    annotations=_RESOURCE_ANNOTATIONS,
-)(res_events_this_week)
-mcp.resource(
-    "morgen://events/upcoming",
-    mime_type="application/json",
-    tags={"events", "read"},
-    annotations=_RESOURCE_ANNOTATIONS,
-)(res_events_upcoming)
-mcp.resource(
-    "morgen://tasks",
+    "morgen://tags",
     mime_type="application/json",
-    tags={"tasks", "read"},
+    tags={"tags", "read"},
     annotations=_RESOURCE_ANNOTATIONS,
-)(res_tasks)
+)(res_tags)
 mcp.resource(
-    "morgen://tasks/today",
+    "morgen://metrics",
     mime_type="application/json",
-    tags={"tasks", "read"},
+    tags={"server", "read"},
     annotations=_RESOURCE_ANNOTATIONS,
-)(res_tasks_today)
+)(res_metrics)
 mcp.resource(
-    "morgen://tags",
-    mime_type="application/json",
-    tags={"tags", "read"},
+    "morgen://metrics/prometheus",
+    mime_type="text/plain",
+    tags={"server", "read"},
     annotations=_RESOURCE_ANNOTATIONS,
-)(res_tags)
+)(res_metrics_prometheus)
 
 
 # Response caching for read-only tools and all resources.
@@ -526,11 +622,11 @@ mcp.resource(
 # duplicate writes into no-ops. The list below is conservative; everything not
 # listed bypasses the cache.
 #
-# 60s TTL is short enough that a write the user just made appears almost
-# immediately, and long enough to dedupe rapid repeat reads inside one
-# conversation. Storage is in-memory (FastMCP default) — disk persistence
-# would let stale "events/today" survive a server restart, which is worse
-# than re-fetching.
+# Writes made through this server delete exactly the cached reads they
+# affect (see morgenmcp.response_cache), so the TTL only bounds how long
+# changes made in other Morgen clients can go unseen. Storage is in-memory
+# (FastMCP default) — disk persistence would let stale "events/today"
+# survive a server restart, which is worse than re-fetching.
 _CACHEABLE_READ_TOOLS = [
     "morgen_list_accounts",
     "morgen_list_calendars",
@@ -539,20 +635,43 @@ _CACHEABLE_READ_TOOLS = [
     "morgen_get_task",
     "morgen_list_tags",
 ]
-_CACHE_TTL_S = 60
-
-mcp.add_middleware(
-    ResponseCachingMiddleware(
-        call_tool_settings=CallToolSettings(
-            included_tools=_CACHEABLE_READ_TOOLS,
-            ttl=_CACHE_TTL_S,
-        ),
-        read_resource_settings=ReadResourceSettings(
-            enabled=True,
-            ttl=_CACHE_TTL_S,
-        ),
-    )
+# morgen_query_tasks is deliberately absent: it reads the client's task
+# mirror, which keeps itself current with cheap deltas, so a cached copy
+# would only add staleness.
+_CACHE_TTL_S = 600
+
+# Live diagnostics; a cached copy would hide recent traffic.
+_UNCACHED_RESOURCES = {"morgen://metrics", "morgen://metrics/prometheus"}
+# Windows computed from the local date; cached reads end at local midnight.
+_DAY_RELATIVE_RESOURCES = {
+    "morgen://events/today",
+    "morgen://events/this-week",
+    "morgen://tasks/today",
+}
+
+_response_cache = DependencyCachingMiddleware(
+    uncached_resources=_UNCACHED_RESOURCES,
+    day_relative_resources=_DAY_RELATIVE_RESOURCES,
+    call_tool_settings=CallToolSettings(
+        included_tools=_CACHEABLE_READ_TOOLS,
+        ttl=_CACHE_TTL_S,
+    ),
+    read_resource_settings=ReadResourceSettings(
+        enabled=True,
+        ttl=_CACHE_TTL_S,
+    ),
+)
+mcp.add_middleware(_response_cache)
+
+# resources/subscribe: a background poller re-reads subscribed resources
+# through the delta-synced mirrors and notifies only on content changes.
+# A change also drops the cached reads of the same data, so the client's
+# follow-up read is fresh.
+_subscriptions = SubscriptionHub(
+    interval_s=_SUBSCRIPTION_POLL_S,
+    on_change=_response_cache.invalidate_resource,
 )
+enable_subscriptions(mcp, _subscriptions)
 
 
 def main() -> None:
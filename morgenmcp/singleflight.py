@@ -0,0 +1,46 @@
+"""Single-flight coalescing of concurrent identical calls.
+
+When several resources or tools need the same upstream data at the same
+moment (morgen://events/today, morgen://events/upcoming and
+morgen://calendars all start with a calendar listing), only the first
+caller actually performs the call; the others await its result.
+Nothing is cached: once the call completes, the next caller starts a
+fresh one.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from functools import partial
+from typing import Any
+
+
+class SingleFlight:
+    """Collapse concurrent calls that share a key into one execution."""
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Future[Any]] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct calls currently executing."""
+        return len(self._calls)
+
+    async def do[T](self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run `fn`, or join the in-flight call already running for `key`.
+
+        The shared call runs as its own task, so one caller being cancelled
+        (e.g. by a tool timeout) does not cancel it for the others.
+        """
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._calls[key] = future
+            future.add_done_callback(partial(self._forget, key))
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: asyncio.Future[Any]) -> None:
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        if not future.cancelled():
+            # Mark the exception retrieved even if every waiter went away.
+            future.exception()
@@ -0,0 +1,220 @@
+"""resources/subscribe support backed by background change polling.
+
+Clients that want to follow morgen://events/today, morgen://tasks or
+morgen://tags used to re-read them on a timer, each read a full upstream
+fetch. SubscriptionHub lets them subscribe instead. While anything is
+subscribed it re-renders each subscribed resource every `interval_s`,
+hashes the content, and sends notifications/resources/updated to the
+subscribers only when the hash changed.
+
+Re-renders take the cheap paths and leave freshness to the stores: tasks
+and tags come from the task mirror and tag index, which pull an
+updatedAfter delta once their 60 s TTL has passed, and events/today reads
+a one-day window through the event store, which refetches it once its
+60 s coverage expires. A task delta costs 10 of the 300 points Morgen
+allows per 15 minutes, so polls are 5 minutes apart by default, and a
+poll is postponed (with growing delays, up to MAX_BACKOFF intervals)
+while the client's rate budget is below BACKGROUND_RESERVE.
+"""
+
+import asyncio
+import hashlib
+import weakref
+from collections.abc import Awaitable, Callable
+from typing import Any, Protocol
+
+from fastmcp import FastMCP
+from fastmcp.exceptions import ResourceError
+from fastmcp.utilities.logging import get_logger
+from mcp.server.lowlevel import NotificationOptions
+from mcp.types import ServerCapabilities
+from pydantic import AnyUrl
+
+from morgenmcp.client import get_client
+from morgenmcp.ratelimit import BACKGROUND_RESERVE
+from morgenmcp.resources import res_events_today, res_tags, res_tasks
+
+logger = get_logger(__name__)
+
+DEFAULT_POLL_S = 300.0
+MAX_BACKOFF = 4
+
+type Reader = Callable[[], Awaitable[str]]
+
+READERS: dict[str, Reader] = {
+    "morgen://events/today": res_events_today,
+    "morgen://tasks": res_tasks,
+    "morgen://tags": res_tags,
+}
+
+
+class Subscriber(Protocol):
+    """What the hub needs from a session: a way to send resources/updated."""
+
+    async def send_resource_updated(self, uri: AnyUrl) -> None: ...
+
+
+def _available_points() -> float:
+    return get_client().rate_limiter.available
+
+
+def _digest(content: str) -> str:
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+class SubscriptionHub:
+    """Subscribed sessions per resource URI, plus the poller that serves them."""
+
+    def __init__(
+        self,
+        readers: dict[str, Reader] | None = None,
+        interval_s: float = DEFAULT_POLL_S,
+        on_change: Callable[[str], Awaitable[None]] | None = None,
+        available: Callable[[], float] = _available_points,
+    ):
+        """Initialize the hub.
+
+        Args:
+            readers: Subscribable URIs and how to render each. Defaults to
+                READERS.
+            interval_s: Seconds between polls while anything is subscribed.
+            on_change: Awaited with the URI before subscribers are notified
+                of a change, e.g. to drop a cached copy of the resource.
+            available: Rate-limit points currently available; polls wait
+                while this is below BACKGROUND_RESERVE.
+        """
+        self.readers = READERS if readers is None else readers
+        self.interval_s = interval_s
+        self._on_change = on_change
+        self._available = available
+        self._subscribers: dict[str, weakref.WeakSet[Subscriber]] = {}
+        self._digests: dict[str, str] = {}
+
+    def subscribed(self) -> list[str]:
+        """URIs that currently have at least one live subscriber."""
+        return [uri for uri, sessions in self._subscribers.items() if sessions]
+
+    async def subscribe(self, uri: str, session: Subscriber) -> None:
+        """Add a subscriber, rendering the resource first if it is new.
+
+        Raises:
+            ResourceError: If the URI does not support subscriptions.
+        """
+        if uri not in self.readers:
+            raise ResourceError(
+                f"{uri!r} does not support subscriptions; "
+                f"subscribable: {', '.join(sorted(self.readers))}"
+            )
+        self._subscribers.setdefault(uri, weakref.WeakSet()).add(session)
+        if uri not in self._digests:
+            await self._render(uri)
+
+    async def unsubscribe(self, uri: str, session: Subscriber) -> None:
+        """Remove a subscriber; unknown URIs and sessions are ignored."""
+        sessions = self._subscribers.get(uri)
+        if sessions is not None:
+            sessions.discard(session)
+            if not sessions:
+                del self._subscribers[uri]
+                self._digests.pop(uri, None)
+
+    async def poll(self) -> list[str]:
+        """Re-render every subscribed resource and notify on changes.
+
+        Returns:
+            The URIs whose content changed.
+        """
+        uris = self.subscribed()
+        previous = {uri: self._digests.get(uri) for uri in uris}
+        await asyncio.gather(*(self._render(uri) for uri in uris))
+        changed = [
+            uri
+            for uri in uris
+            if previous[uri] is not None and self._digests.get(uri) != previous[uri]
+        ]
+        for uri in changed:
+            if self._on_change is not None:
+                await self._on_change(uri)
+            await self._notify(uri)
+        return changed
+
+    async def run(self) -> None:
+        """Poll every `interval_s` until cancelled, backing off on low budget."""
+        delay = self.interval_s
+        while True:
+            await asyncio.sleep(delay)
+            try:
+                if self.subscribed() and self._available() < BACKGROUND_RESERVE:
+                    delay = min(delay * 2, self.interval_s * MAX_BACKOFF)
+                    logger.info("Rate budget low; next subscription poll in %ds", delay)
+                    continue
+                delay = self.interval_s
+                await self.poll()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("subscription poll error (continuing)")
+
+    async def _render(self, uri: str) -> None:
+        try:
+            content = await self.readers[uri]()
+        except Exception:
+            logger.warning("Polling %s failed; will retry", uri, exc_info=True)
+            return
+        self._digests[uri] = _digest(content)
+
+    async def _notify(self, uri: str) -> None:
+        for session in list(self._subscribers.get(uri, ())):
+            try:
+                await session.send_resource_updated(AnyUrl(uri))
+            except Exception:
+                logger.info("Dropping subscriber of %s (send failed)", uri)
+                await self.unsubscribe(uri, session)
+
+
+def enable_subscriptions(server: FastMCP, hub: SubscriptionHub) -> None:
+    """Route resources/subscribe and resources/unsubscribe to `hub`.
+
+    FastMCP has no public hook for either request, so this goes through
+    _patch_low_level_server().
+    """
+    _patch_low_level_server(server, hub.subscribe, hub.unsubscribe)
+
+
+def _patch_low_level_server(
+    server: FastMCP,
+    subscribe: Callable[[str, Subscriber], Awaitable[None]],
+    unsubscribe: Callable[[str, Subscriber], Awaitable[None]],
+) -> None:
+    """The one place that reaches past FastMCP's public API.
+
+    Relies on FastMCP 3.3 keeping its mcp.server.lowlevel.Server in
+    `server._mcp_server`, and on that server's subscribe_resource() and
+    unsubscribe_resource() decorators and get_capabilities() method from
+    mcp 1.x. get_capabilities() always reports resources.subscribe as
+    False, so it is wrapped to report True. pyproject.toml pins both
+    packages to the ranges this was checked against, and
+    tests/test_subscriptions.py asserts the advertised capability.
+    """
+    low = server._mcp_server
+
+    @low.subscribe_resource()
+    async def _subscribe(uri: AnyUrl) -> None:
+        await subscribe(str(uri), low.request_context.session)
+
+    @low.unsubscribe_resource()
+    async def _unsubscribe(uri: AnyUrl) -> None:
+        await unsubscribe(str(uri), low.request_context.session)
+
+    get_capabilities = low.get_capabilities
+
+    def _get_capabilities(
+        notification_options: NotificationOptions,
+        experimental_capabilities: dict[str, dict[str, Any]],
+    ) -> ServerCapabilities:
+        capabilities = get_capabilities(notification_options, experimental_capabilities)
+        if capabilities.resources is not None:
+            capabilities.resources.subscribe = True
+        return capabilities
+
+    low.get_capabilities = _get_capabilities
@@ -0,0 +1,127 @@
+"""In-process tag index kept current with updatedAfter deltas.
+
+Task output only carries tag IDs, so showing names used to cost a
+/tags/list call per read. TagIndex holds every live tag by ID and by
+case-folded name. The first read does one full sync; later reads pull
+only tags updated since the newest `updated` stamp seen, and reads
+within `ttl_s` of the last sync are answered without any upstream call.
+
+Deletions: unlike /tasks/list, /tags/list deltas carry tombstones
+(deleted=True), so deletions made elsewhere are applied by the next
+delta and the index never needs a periodic full resync.
+
+MorgenClient updates the index directly after tag writes and marks it
+stale, so the next read also pulls the server's copy.
+"""
+
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from types import MappingProxyType
+
+from morgenmcp.freshness import Freshness
+from morgenmcp.models import Tag
+from morgenmcp.pagination import latest, since
+
+DEFAULT_TTL_S = 60.0
+
+type TagFetcher = Callable[[str | None], Awaitable[list[Tag]]]
+
+
+def _name_key(name: str) -> str:
+    return name.strip().casefold()
+
+
+class TagIndex:
+    """Local copy of all live tags, refreshed by incremental syncs."""
+
+    def __init__(
+        self,
+        ttl_s: float = DEFAULT_TTL_S,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the index.
+
+        Args:
+            ttl_s: Seconds a sync is trusted before a read pulls a delta.
+            clock: Monotonic time source (injectable for tests).
+        """
+        self._freshness = Freshness(ttl_s, clock)
+        self._tags: dict[str, Tag] = {}
+        self._by_name: dict[str, Tag] = {}
+        self._names: dict[str, str] = {}
+        self._loaded = False
+        self._cursor: str | None = None
+
+    async def tags(self, fetch: TagFetcher) -> list[Tag]:
+        """Return all live tags, syncing first if the index is stale.
+
+        Args:
+            fetch: Upstream fetch taking an updatedAfter value (None for
+                the full list of live tags).
+        """
+        await self.sync(fetch)
+        return list(self._tags.values())
+
+    async def sync(self, fetch: TagFetcher) -> None:
+        """Bring the index up to date if it is stale; see tags()."""
+        async with self._freshness.lock:
+            ticket = self._freshness.begin()
+            if not self._loaded:
+                fetched = await fetch(None)
+                self._clear()
+                self._loaded = True
+            elif self._freshness.stale(ticket.started_at):
+                fetched = await fetch(since(self._cursor) if self._cursor else None)
+            else:
+                return
+            for tag in fetched:
+                self.put(tag)
+            self._cursor = latest(fetched, self._cursor)
+            self._freshness.finish(ticket)
+
+    def get(self, tag_id: str) -> Tag | None:
+        """The live tag with this ID, as of the last sync."""
+        return self._tags.get(tag_id)
+
+    def find(self, name: str) -> Tag | None:
+        """The live tag with this name (case-insensitive), as of the last sync."""
+        return self._by_name.get(_name_key(name))
+
+    def names(self) -> Mapping[str, str]:
+        """Read-only map of tag ID to name, as of the last sync."""
+        return MappingProxyType(self._names)
+
+    def put(self, tag: Tag) -> None:
+        """Apply one tag as returned upstream; tombstones remove it."""
+        self.discard(tag.id)
+        if tag.deleted:
+            return
+        self._tags[tag.id] = tag
+        if tag.name:
+            self._by_name[_name_key(tag.name)] = tag
+            self._names[tag.id] = tag.name
+
+    def discard(self, tag_id: str) -> None:
+        """Drop a tag known to be deleted."""
+        old = self._tags.pop(tag_id, None)
+        self._names.pop(tag_id, None)
+        if old is not None and old.name:
+            key = _name_key(old.name)
+            if self._by_name.get(key) is old:
+                del self._by_name[key]
+
+    def invalidate(self) -> None:
+        """Pull a delta on the next read."""
+        self._freshness.invalidate()
+
+    def reset(self) -> None:
+        """Forget everything; the next read does a full sync."""
+        self._clear()
+        self._loaded = False
+        self._cursor = None
+        self.invalidate()
+
+    def _clear(self) -> None:
+        self._tags.clear()
+        self._by_name.clear()
+        self._names.clear()
@@ -0,0 +1,107 @@
+"""In-process task mirror kept current with updatedAfter deltas.
+
+/tasks/list costs 10 rate-limit points per call, and the task resources
+used to download the full list on every read only to filter it locally.
+TaskMirror holds every task by ID. The first read does one full sync;
+later reads pull only tasks updated since the newest `updated` stamp seen
+(the server's clock, so local clock skew does not matter), and reads
+within `ttl_s` of the last sync are answered without any upstream call.
+Deltas start slightly before that stamp, as pagination's do.
+
+Deletions: /tasks/list deltas carry no tombstones. Tasks deleted through
+MorgenClient are dropped immediately; tasks deleted elsewhere disappear
+at the next full sync, every `full_sync_s` (15 minutes by default).
+
+MorgenClient marks the mirror stale after every task write, so the next
+read pulls the change. A write that lands while a sync is in flight
+keeps the mirror stale (that sync may have fetched the pre-write state),
+and a task discarded meanwhile is not put back by it.
+"""
+
+import time
+from collections.abc import Awaitable, Callable
+
+from morgenmcp.freshness import Freshness
+from morgenmcp.models import Task
+from morgenmcp.pagination import latest, since
+
+DEFAULT_TTL_S = 60.0
+DEFAULT_FULL_SYNC_S = 900.0
+
+type TaskFetcher = Callable[[str | None], Awaitable[list[Task]]]
+
+
+class TaskMirror:
+    """Local copy of all tasks, refreshed by incremental syncs."""
+
+    def __init__(
+        self,
+        ttl_s: float = DEFAULT_TTL_S,
+        full_sync_s: float = DEFAULT_FULL_SYNC_S,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the mirror.
+
+        Args:
+            ttl_s: How long after a sync reads are served without a delta.
+            full_sync_s: How often the whole list is refetched, which also
+                drops tasks deleted by other clients.
+            clock: Monotonic time source (injectable for tests).
+        """
+        self.full_sync_s = full_sync_s
+        self._freshness = Freshness(ttl_s, clock)
+        self._tasks: dict[str, Task] = {}
+        self._cursor: str | None = None
+        self._full_synced_at: float | None = None
+        self._discarded: set[str] = set()
+
+    async def tasks(self, fetch: TaskFetcher) -> list[Task]:
+        """Return all tasks, syncing first if the mirror is stale.
+
+        Args:
+            fetch: Upstream fetch taking an updatedAfter value (None for
+                the full list).
+        """
+        async with self._freshness.lock:
+            ticket = self._freshness.begin()
+            now = ticket.started_at
+            full = (
+                self._full_synced_at is None
+                or now - self._full_synced_at >= self.full_sync_s
+            )
+            if not full and not self._freshness.stale(now):
+                return list(self._tasks.values())
+            self._discarded.clear()
+            if full or self._cursor is None:
+                # Without a stamp to start from, a delta is the full list.
+                fetched = await fetch(None)
+                self._tasks = {
+                    task.id: task for task in fetched if task.id not in self._discarded
+                }
+                self._cursor = latest(fetched)
+                self._full_synced_at = now
+            else:
+                fetched = await fetch(since(self._cursor))
+                for task in fetched:
+                    if task.id not in self._discarded:
+                        self._tasks[task.id] = task
+                self._cursor = latest(fetched, self._cursor)
+            self._freshness.finish(ticket)
+            return list(self._tasks.values())
+
+    def invalidate(self) -> None:
+        """Pull a delta on the next read."""
+        self._freshness.invalidate()
+
+    def discard(self, task_id: str) -> None:
+        """Drop a task known to be deleted, and pull a delta on the next read."""
+        self._tasks.pop(task_id, None)
+        self._discarded.add(task_id)
+        self.invalidate()
+
+    def reset(self) -> None:
+        """Forget everything; the next read does a full sync."""
+        self._tasks.clear()
+        self._cursor = None
+        self._full_synced_at = None
+        self.invalidate()
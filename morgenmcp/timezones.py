@@ -0,0 +1,116 @@
+"""Shared time zone lookups for event formatting.
+
+ZoneInfo already interns valid keys, but an unknown key searches the tz
+database on every call (~100µs), once per event carrying a zone name
+the tz database does not know. The display tz also used to be resolved
+per call, probing the system zone with datetime.now().astimezone().
+TimeZones keeps one answer per key, including misses, caches the system
+zone for `local_ttl_s` (so a DST switch shows up within that), and
+memoizes "<abbrev> (<IANA>)" labels.
+
+Conversions themselves stay with datetime.astimezone: ZoneInfo already
+does them from its compiled transition table in C, faster than a Python
+lookup table over the same data.
+"""
+
+import os
+import time
+from collections.abc import Callable
+from datetime import datetime, tzinfo
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+DISPLAY_TZ_ENV = "MORGENMCP_DISPLAY_TZ"
+DEFAULT_LOCAL_TTL_S = 60.0
+# Keys come from upstream event data; past this many the memo starts over.
+MAX_ENTRIES = 1024
+
+
+class TimeZones:
+    """Memoized zone, display tz and label lookups."""
+
+    def __init__(
+        self,
+        local_ttl_s: float = DEFAULT_LOCAL_TTL_S,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the lookups.
+
+        Args:
+            local_ttl_s: How long the probed system zone is reused.
+            clock: Monotonic time source (injectable for tests).
+        """
+        self.local_ttl_s = local_ttl_s
+        self._clock = clock
+        self._zones: dict[str, ZoneInfo | None] = {}
+        self._labels: dict[tuple[tzinfo, str | None], str] = {}
+        self._local: tzinfo | None = None
+        self._local_expires = 0.0
+
+    def zone(self, key: str) -> ZoneInfo:
+        """The ZoneInfo for an IANA key.
+
+        Raises:
+            ZoneInfoNotFoundError: If the key is not a known zone (also
+                remembered, so repeated misses are cheap).
+        """
+        try:
+            found = self._zones[key]
+        except KeyError:
+            if len(self._zones) >= MAX_ENTRIES:
+                self._zones.clear()
+            try:
+                found = ZoneInfo(key)
+            except Exception:  # unknown key, or not a valid key at all
+                found = None
+            self._zones[key] = found
+        if found is None:
+            raise ZoneInfoNotFoundError(f"No time zone found with key {key}")
+        return found
+
+    def local(self) -> tzinfo:
+        """The system's current zone, as a fixed offset."""
+        now = self._clock()
+        if self._local is None or now >= self._local_expires:
+            local = datetime.now().astimezone().tzinfo
+            assert local is not None
+            self._local = local
+            self._local_expires = now + self.local_ttl_s
+        return self._local
+
+    def display(self, explicit: str | None = None) -> tzinfo:
+        """Pick the display tz: explicit arg > MORGENMCP_DISPLAY_TZ > system local.
+
+        The env var is read on every call, so changing it takes effect on
+        the next one; an unknown value silently falls through to the
+        system zone.
+        """
+        if explicit:
+            return self.zone(explicit)
+        if env_value := os.environ.get(DISPLAY_TZ_ENV):
+            try:
+                return self.zone(env_value)
+            except ZoneInfoNotFoundError:
+                pass
+        return self.local()
+
+    def label(self, dt: datetime, tz: tzinfo) -> str:
+        """Render '<abbrev> (<IANA>)' or just '<label>' on fixed-offset fallbacks."""
+        abbrev = dt.tzname()
+        key = (tz, abbrev)
+        if (cached := self._labels.get(key)) is None:
+            if len(self._labels) >= MAX_ENTRIES:
+                self._labels.clear()
+            iana = getattr(tz, "key", None) or str(tz)
+            abbrev = abbrev or iana
+            cached = iana if abbrev == iana else f"{abbrev} ({iana})"
+            self._labels[key] = cached
+        return cached
+
+    def clear(self) -> None:
+        """Forget every memoized lookup."""
+        self._zones.clear()
+        self._labels.clear()
+        self._local = None
+
+
+time_zones = TimeZones()
@@ -1,22 +1,26 @@
 """MCP tools for Morgen event operations."""
 
 import asyncio
-import os
+import json
 from collections import defaultdict
+from collections.abc import Callable, Collection, Hashable
 from datetime import datetime, timedelta, tzinfo
 from typing import Any, Literal
-from zoneinfo import ZoneInfo
+from zoneinfo import ZoneInfoNotFoundError
 
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
 
 from morgenmcp.client import get_client
+from morgenmcp.format_cache import FormatCache
 from morgenmcp.models import (
     Event,
     EventCreateRequest,
     EventDeleteRequest,
     EventUpdateRequest,
 )
+from morgenmcp.serialization import Fragment
+from morgenmcp.timezones import time_zones
 from morgenmcp.tools.id_registry import register_id, resolve_id, resolve_ids
 from morgenmcp.tools.id_utils import (
     extract_account_from_calendar,
@@ -29,6 +33,7 @@ from morgenmcp.tools.utils import (
     build_recurrence_rules,
     filter_none_values,
     handle_tool_errors,
+    select_fields,
 )
 from morgenmcp.validators import (
     validate_date_range,
@@ -38,31 +43,51 @@ from morgenmcp.validators import (
     validate_timezone,
 )
 
-_DISPLAY_TZ_ENV = "MORGENMCP_DISPLAY_TZ"
-
 
 def _resolve_display_tz(explicit: str | None) -> tzinfo:
     """Pick the display tz: explicit arg > MORGENMCP_DISPLAY_TZ > system local."""
-    if explicit:
-        return ZoneInfo(explicit)
-    env_value = os.environ.get(_DISPLAY_TZ_ENV)
-    if env_value:
-        try:
-            return ZoneInfo(env_value)
-        except Exception:
-            pass  # bad env var → silently fall through to system tz
-    sys_tz = datetime.now().astimezone().tzinfo
-    assert sys_tz is not None
-    return sys_tz
-
-
-def _tz_label(dt: datetime, tz: tzinfo) -> str:
-    """Render '<abbrev> (<IANA>)' or just '<label>' on fixed-offset fallbacks."""
-    iana = getattr(tz, "key", None) or str(tz)
-    abbrev = dt.tzname() or iana
-    if abbrev == iana:
-        return iana
-    return f"{abbrev} ({iana})"
+    return time_zones.display(explicit)
+
+
+# Formatted output of unchanged events, keyed by (event ID, updated stamp,
+# metadata updated stamp, variant) where the variant carries the display
+# tz / output mode; see _memoized. Values pair the output with the real
+# IDs it exposes.
+_formatted: FormatCache[tuple[Any, ...], tuple[Any, tuple[str, ...]]] = FormatCache()
+
+
+def _memoized[T](
+    event: Event,
+    variant: Hashable,
+    id_fields: Collection[str] | None,
+    build: Callable[[], T],
+) -> T:
+    """Cached `build()` output for `event`, formatting it only on a miss.
+
+    Both the event's and its metadata's updated stamps are in the key,
+    since the full format prints metadata fields too; events with neither
+    are formatted every time, as a change would not show in the key. A
+    hit re-registers the virtual IDs of the `id_fields` (see
+    _EVENT_ID_SOURCES; None for all) the output carries, so they stay
+    resolvable after a registry eviction or clear.
+    """
+    metadata_updated = event.metadata.updated if event.metadata else None
+    if event.updated is None and metadata_updated is None:
+        return build()
+    key = (event.id, event.updated, metadata_updated, variant)
+    if (hit := _formatted.get(key)) is not None:
+        output, real_ids = hit
+        for real_id in real_ids:
+            register_id(real_id)
+        return output
+    output = build()
+    real_ids = tuple(
+        real_id
+        for name, source in _EVENT_ID_SOURCES.items()
+        if (id_fields is None or name in id_fields) and (real_id := source(event))
+    )
+    _formatted.put(key, (output, real_ids))
+    return output
 
 
 def _format_compact_event(event: Event, display_tz: tzinfo) -> str:
@@ -73,6 +98,15 @@ def _format_compact_event(event: Event, display_tz: tzinfo) -> str:
     timezone) are tagged "(floating)" and not converted. All-day events keep
     the existing "<MMM DD> (all-day)" form.
     """
+    return _memoized(
+        event,
+        ("compact", display_tz),
+        ("id",),
+        lambda: _build_compact_event(event, display_tz),
+    )
+
+
+def _build_compact_event(event: Event, display_tz: tzinfo) -> str:
     virtual_id = register_id(event.id)
     title = event.title or "(No title)"
 
@@ -110,8 +144,8 @@ def _format_compact_event(event: Event, display_tz: tzinfo) -> str:
             return f"{start_str}-{end_label} (floating): {title} [{virtual_id}]"
 
         try:
-            source_tz = ZoneInfo(event.time_zone)
-        except Exception:
+            source_tz = time_zones.zone(event.time_zone)
+        except ZoneInfoNotFoundError:
             return f"{event.start} {event.time_zone}: {title} [{virtual_id}]"
 
         start_dt = start_naive.replace(tzinfo=source_tz).astimezone(display_tz)
@@ -122,7 +156,7 @@ def _format_compact_event(event: Event, display_tz: tzinfo) -> str:
         cross = end_dt.date() != start_dt.date()
         end_label = f"{end_dt.strftime('%b %d')} {end_str}" if cross else end_str
         return (
-            f"{start_str}-{end_label} {_tz_label(start_dt, display_tz)}: "
+            f"{start_str}-{end_label} {time_zones.label(start_dt, display_tz)}: "
             f"{title} [{virtual_id}]"
         )
     except ValueError, TypeError:
@@ -152,57 +186,112 @@ def _format_alerts(event: Event) -> list[dict[str, str]] | None:
     return out or None
 
 
-def _format_full_event(event: Event) -> dict[str, Any]:
-    """Format an event in full format with all fields and virtual IDs."""
-    metadata = event.metadata
+def _virtual_room_url(event: Event) -> str | None:
+    derived = event.derived
+    return derived.virtual_room.url if derived and derived.virtual_room else None
+
+
+# Full-format output field -> the real ID it exposes as a virtual ID.
+_EVENT_ID_SOURCES: dict[str, Callable[[Event], str | None]] = {
+    "id": lambda e: e.id,
+    "calendarId": lambda e: e.calendar_id,
+    "accountId": lambda e: e.account_id,
+    "masterEventId": lambda e: e.master_event_id,
+    "taskId": lambda e: e.metadata.task_id if e.metadata else None,
+}
+
+
+def _virtual(name: str) -> Callable[[Event], str | None]:
+    source = _EVENT_ID_SOURCES[name]
+
+    def get(event: Event) -> str | None:
+        real_id = source(event)
+        return register_id(real_id) if real_id else None
+
+    return get
+
+
+# Full-format output field -> how to compute it. Fields are only computed
+# (and their IDs only registered) when selected; see _format_full_event.
+_EVENT_FIELDS: dict[str, Callable[[Event], Any]] = {
+    "id": _virtual("id"),
+    "calendarId": _virtual("calendarId"),
+    "accountId": _virtual("accountId"),
+    "title": lambda e: e.title,
+    "description": lambda e: e.description,
+    "start": lambda e: e.start,
+    "duration": lambda e: e.duration,
+    "timeZone": lambda e: e.time_zone,
+    "isAllDay": lambda e: e.show_without_time,
+    "status": lambda e: e.free_busy_status,
+    "privacy": lambda e: e.privacy,
+    "locations": lambda e: [{"name": loc.name} for loc in (e.locations or {}).values()],
+    "participants": lambda e: [
+        {
+            "name": p.name,
+            "email": p.email,
+            "status": p.participation_status,
+            "isOrganizer": p.roles.owner if p.roles else False,
+        }
+        for p in (e.participants or {}).values()
+    ],
+    "isRecurring": lambda e: e.recurrence_rules is not None,
+    "recurrenceRules": lambda e: (
+        [_format_recurrence_rule(r) for r in (e.recurrence_rules or [])] or None
+    ),
+    "recurrenceId": lambda e: e.recurrence_id,
+    "masterEventId": _virtual("masterEventId"),
+    "alerts": _format_alerts,
+    "useDefaultAlerts": lambda e: e.use_default_alerts or None,
+    "googleColorId": lambda e: e.google_color_id,
+    "categoryId": lambda e: e.metadata.category_id if e.metadata else None,
+    "categoryName": lambda e: e.metadata.category_name if e.metadata else None,
+    "categoryColor": lambda e: e.metadata.category_color if e.metadata else None,
+    "taskId": _virtual("taskId"),
+    "virtualRoomUrl": _virtual_room_url,
+}
+
+
+def _format_full_event(
+    event: Event, fields: Collection[str] | None = None
+) -> dict[str, Any]:
+    """Format an event in full format with virtual IDs.
+
+    Args:
+        event: The event to format.
+        fields: Output fields to include (see select_fields); None
+            includes every field.
+    """
+    selected = frozenset(fields) if fields is not None else None
+    return dict(
+        _memoized(
+            event,
+            ("full", selected),
+            selected,
+            lambda: _build_full_event(event, selected),
+        )
+    )
+
+
+def _format_full_event_json(
+    event: Event, fields: Collection[str] | None = None
+) -> Fragment:
+    """_format_full_event output, JSON-encoded once for resource bodies."""
+    selected = frozenset(fields) if fields is not None else None
+    return _memoized(
+        event,
+        ("json", selected),
+        selected,
+        lambda: Fragment.of(_build_full_event(event, selected)),
+    )
+
+
+def _build_full_event(event: Event, fields: frozenset[str] | None) -> dict[str, Any]:
     return filter_none_values(
         {
-            "id": register_id(event.id),
-            "calendarId": register_id(event.calendar_id),
-            "accountId": register_id(event.account_id),
-            "title": event.title,
-            "description": event.description,
-            "start": event.start,
-            "duration": event.duration,
-            "timeZone": event.time_zone,
-            "isAllDay": event.show_without_time,
-            "status": event.free_busy_status,
-            "privacy": event.privacy,
-            "locations": [
-                {"name": loc.name} for loc in (event.locations or {}).values()
-            ],
-            "participants": [
-                {
-                    "name": p.name,
-                    "email": p.email,
-                    "status": p.participation_status,
-                    "isOrganizer": p.roles.owner if p.roles else False,
-                }
-                for p in (event.participants or {}).values()
-            ],
-            "isRecurring": event.recurrence_rules is not None,
-            "recurrenceRules": [
-                _format_recurrence_rule(r) for r in (event.recurrence_rules or [])
-            ]
-            or None,
-            "recurrenceId": event.recurrence_id,
-            "masterEventId": register_id(event.master_event_id)
-            if event.master_event_id
-            else None,
-            "alerts": _format_alerts(event),
-            "useDefaultAlerts": event.use_default_alerts or None,
-            "googleColorId": event.google_color_id,
-            "categoryId": metadata.category_id if metadata else None,
-            "categoryName": metadata.category_name if metadata else None,
-            "categoryColor": metadata.category_color if metadata else None,
-            "taskId": register_id(metadata.task_id)
-            if metadata and metadata.task_id
-            else None,
-            "virtualRoomUrl": (
-                event.derived.virtual_room.url
-                if event.derived and event.derived.virtual_room
-                else None
-            ),
+            name: get(event)
+            for name, get in _EVENT_FIELDS.items()
+            if fields is None or name in fields
         }
     )
 
@@ -214,6 +303,8 @@ async def list_events(
     calendar_ids: list[str] | None = None,
     compact: bool = False,
     display_timezone: str | None = None,
+    stream: bool = False,
+    fields: list[str] | None = None,
     ctx: Context | None = None,
 ) -> dict:
     """List events from calendars within a time window.
@@ -231,6 +322,13 @@ async def list_events(
             render compact times. Defaults to the MORGENMCP_DISPLAY_TZ env var,
             or the system local timezone if unset. Only affects compact=True
             output; floating events are tagged "(floating)".
+        stream: If True and calendar_ids is omitted, each account's events are
+            also sent as soon as that account's fetch completes, as the JSON
+            message of a progress notification:
+            {"accountId": ..., "events": [...], "count": N}.
+        fields: Optional full-format fields to return, e.g. ["title", "start",
+            "duration"]; "id" is always included. Omit for every field.
+            Cannot be combined with compact=True.
 
     Returns:
         Dictionary with 'events' key containing list of event objects (or strings if compact).
@@ -239,9 +337,18 @@ async def list_events(
     validate_local_datetime(end, "end")
     validate_date_range(start, end)
     validate_timezone(display_timezone)
+    if compact and fields is not None:
+        raise ToolError("fields only applies to full output; omit it or compact")
+    selected = select_fields(fields, _EVENT_FIELDS)
 
     client = get_client()
-    all_events: list[Event] = []
+    display_tz = _resolve_display_tz(display_timezone) if compact else None
+
+    # Format output (IDs are registered during formatting)
+    def format_events(events: list[Event]) -> list[Any]:
+        if display_tz is not None:
+            return [_format_compact_event(event, display_tz) for event in events]
+        return [_format_full_event(event, selected) for event in events]
 
     if calendar_ids is not None:
         # Specific calendars requested - resolve virtual IDs and extract account
@@ -252,62 +359,70 @@ async def list_events(
         # Extract account ID from first calendar (all calendars in a query must be from same account)
         real_account_id = extract_account_from_calendar(real_calendar_ids[0])
 
-        all_events = await client.list_events(
+        events = await client.list_events(
             account_id=real_account_id,
             calendar_ids=real_calendar_ids,
             start=start,
             end=end,
         )
-    else:
-        # Fetch all calendars and query by account
-        calendars = await client.list_calendars()
-
-        # Group calendars by account_id (using real IDs internally)
-        calendars_by_account: dict[str, list[str]] = defaultdict(list)
-        for cal in calendars:
-            calendars_by_account[cal.account_id].append(cal.id)
-
-        # Query events for each account in parallel
-        async def fetch_account_events(acc_id: str, cal_ids: list[str]) -> list[Event]:
-            return await client.list_events(
+        return {"events": format_events(events), "count": len(events)}
+
+    # Fetch all calendars and query by account
+    calendars = await client.list_calendars()
+
+    # Group calendars by account_id (using real IDs internally)
+    calendars_by_account: dict[str, list[str]] = defaultdict(list)
+    for cal in calendars:
+        calendars_by_account[cal.account_id].append(cal.id)
+
+    # Query events for each account in parallel, handling each account as
+    # soon as its fetch completes
+    fetches: dict[asyncio.Future[list[Event]], str] = {
+        asyncio.create_task(
+            client.list_events(
                 account_id=acc_id,
                 calendar_ids=cal_ids,
                 start=start,
                 end=end,
             )
-
-        tasks = [
-            fetch_account_events(acc_id, cal_ids)
-            for acc_id, cal_ids in calendars_by_account.items()
-        ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        account_ids = list(calendars_by_account.keys())
-        for i, result in enumerate(results):
-            if ctx:
-                await ctx.report_progress(i + 1, len(results))
-            if isinstance(result, BaseException):
+        ): acc_id
+        for acc_id, cal_ids in calendars_by_account.items()
+    }
+    formatted: dict[str, list[Any]] = {}
+    try:
+        async for fetch in asyncio.as_completed(fetches):
+            acc_id = fetches[fetch]
+            try:
+                events = fetch.result()
+            except Exception as e:
                 if ctx:
+                    await ctx.report_progress(len(formatted) + 1, len(fetches))
                     await ctx.warning(
-                        f"Failed to fetch events for account {account_ids[i]}: {result}"
+                        f"Failed to fetch events for account {acc_id}: {e}"
                     )
+                formatted[acc_id] = []
                 continue
-            all_events.extend(result)
-
-    # Format output (IDs are registered during formatting)
-    if compact:
-        display_tz = _resolve_display_tz(display_timezone)
-        return {
-            "events": [
-                _format_compact_event(event, display_tz) for event in all_events
-            ],
-            "count": len(all_events),
-        }
-    else:
-        return {
-            "events": [_format_full_event(event) for event in all_events],
-            "count": len(all_events),
-        }
+            formatted[acc_id] = format_events(events)
+            if ctx and stream:
+                partial = {
+                    "accountId": register_id(acc_id),
+                    "events": formatted[acc_id],
+                    "count": len(events),
+                }
+                await ctx.report_progress(
+                    len(formatted), len(fetches), json.dumps(partial)
+                )
+            elif ctx:
+                await ctx.report_progress(len(formatted), len(fetches))
+    finally:
+        for fetch in fetches:
+            fetch.cancel()
+
+    # Final result keeps account order, independent of completion order
+    all_events = [
+        event for acc_id in calendars_by_account for event in formatted[acc_id]
+    ]
+    return {"events": all_events, "count": len(all_events)}
 
 
 @handle_tool_errors
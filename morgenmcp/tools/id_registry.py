@@ -5,17 +5,30 @@ from __future__ import annotations
 import asyncio
 import base64
 import hashlib
+import os
+import sys
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import Any, Protocol
 
 from fastmcp.utilities.logging import get_logger
 
-if TYPE_CHECKING:
-    from key_value.aio.stores.filetree import FileTreeStore
+from morgenmcp.tools.id_store import SQLiteIDStore
 
 logger = get_logger(__name__)
 
 
+class IDStore(Protocol):
+    """A persistent mapping store: SQLiteIDStore or a key_value FileTreeStore."""
+
+    async def put_many(
+        self, keys: Sequence[str], values: Sequence[Mapping[str, Any]]
+    ) -> None: ...
+
+    async def get_many(self, keys: Sequence[str]) -> list[dict[str, Any] | None]: ...
+
+
 class IDNotFoundError(Exception):
     """Raised when a virtual ID cannot be resolved."""
 
@@ -26,19 +39,77 @@ class IDNotFoundError(Exception):
         )
 
 
-# Bidirectional mappings
-_virtual_to_real: dict[str, str] = {}  # "a1b2c3" -> "640a62c9aa5b7e06cf420000"
-_real_to_virtual: dict[str, str] = {}  # "640a62c9aa5b7e06cf420000" -> "a1b2c3"
+# Resident mappings in least-recently-used order. The reverse direction
+# needs no table: a real ID's virtual ID is recomputed by hashing it.
+_virtual_to_real: OrderedDict[str, str] = OrderedDict()  # "a1b2c3d" -> real ID
+
+# With a store that supports on-disk lookup, at most this many mappings stay
+# resident; the least recently used are evicted and re-read on demand.
+# Override with MORGENMCP_ID_CACHE_SIZE.
+_DEFAULT_MAX_RESIDENT = 50_000
+_max_resident: int | None = None
 
 # Persistent store (set during server lifespan, None in tests)
-_store: FileTreeStore | None = None
+_store: IDStore | None = None
 _pending_tasks: set[asyncio.Task[None]] = set()
 
+# Write-behind queue: new mappings are collected and written in batches,
+# either once _BATCH_SIZE accumulate or _FLUSH_DELAY_S after the first one.
+# At most _MAX_UNWRITTEN mappings may be queued or in flight; beyond that
+# new mappings are not persisted (they are still registered in memory, and
+# deterministic virtual IDs mean they are re-persisted on a later listing).
+_BATCH_SIZE = 500
+_FLUSH_DELAY_S = 1.0
+_MAX_UNWRITTEN = 20_000
+
+_queued: dict[str, str] = {}
+_flush_timer: asyncio.TimerHandle | None = None
+_unwritten = 0
+_dropped = 0
+
 
-def set_store(store: FileTreeStore | None) -> None:
-    """Set the persistent store for write-through persistence."""
-    global _store
+def set_store(store: IDStore | None) -> None:
+    """Set the persistent store for write-behind persistence.
+
+    Mappings still queued for the previous store are discarded; call
+    flush_pending() first to keep them. Resident mappings are only capped
+    while a SQLiteIDStore is set, since other stores cannot be read back
+    synchronously.
+    """
+    global _store, _flush_timer, _unwritten, _max_resident
     _store = store
+    _max_resident = _resident_limit() if isinstance(store, SQLiteIDStore) else None
+    _evict()
+    if _flush_timer is not None:
+        _flush_timer.cancel()
+        _flush_timer = None
+    _unwritten -= len(_queued)
+    _queued.clear()
+
+
+def _resident_limit() -> int:
+    raw = os.environ.get("MORGENMCP_ID_CACHE_SIZE")
+    if raw:
+        try:
+            return max(1, int(raw))
+        except ValueError:
+            logger.warning("Ignoring invalid MORGENMCP_ID_CACHE_SIZE=%r", raw)
+    return _DEFAULT_MAX_RESIDENT
+
+
+def _remember(virtual_id: str, real_id: str) -> None:
+    """Make a mapping resident and most recently used."""
+    _virtual_to_real[virtual_id] = sys.intern(real_id)
+    _virtual_to_real.move_to_end(virtual_id)
+    _evict()
+
+
+def _evict() -> None:
+    """Drop least recently used mappings beyond the resident limit."""
+    if _max_resident is None:
+        return
+    while len(_virtual_to_real) > _max_resident:
+        _virtual_to_real.popitem(last=False)
 
 
 # --- Virtual-ID hash contract ---
@@ -104,28 +175,66 @@ def _generate_virtual_id(real_id: str) -> str:
 
 
 def _schedule_persist(virtual_id: str, real_id: str) -> None:
-    """Fire-and-forget async write to the persistent store."""
+    """Queue a mapping for the next batched write to the persistent store."""
+    global _flush_timer, _unwritten, _dropped
     if _store is None:
         return
     try:
         loop = asyncio.get_running_loop()
     except RuntimeError:
         return
-    task = loop.create_task(_persist(virtual_id, real_id))
+    if _unwritten >= _MAX_UNWRITTEN:
+        _dropped += 1
+        return
+
+    _queued[virtual_id] = real_id
+    _unwritten += 1
+    if len(_queued) >= _BATCH_SIZE:
+        _start_flush()
+    elif _flush_timer is None:
+        _flush_timer = loop.call_later(_FLUSH_DELAY_S, _start_flush)
+
+
+def _start_flush() -> None:
+    """Hand the queued mappings to a background batch write."""
+    global _flush_timer, _dropped
+    if _flush_timer is not None:
+        _flush_timer.cancel()
+        _flush_timer = None
+    if _dropped:
+        logger.warning(
+            "ID store is falling behind; %d mappings were not persisted", _dropped
+        )
+        _dropped = 0
+    if not _queued or _store is None:
+        return
+
+    batch = dict(_queued)
+    _queued.clear()
+    task = asyncio.get_running_loop().create_task(_persist(_store, batch))
     _pending_tasks.add(task)
     task.add_done_callback(_pending_tasks.discard)
 
 
-async def _persist(virtual_id: str, real_id: str) -> None:
-    """Write a single mapping to the persistent store."""
+async def _persist(store: IDStore, batch: dict[str, str]) -> None:
+    """Write a batch of mappings to the persistent store."""
+    global _unwritten
     try:
-        await _store.put(virtual_id, {"real_id": real_id})  # type: ignore[union-attr]
+        await store.put_many(
+            list(batch), [{"real_id": real_id} for real_id in batch.values()]
+        )
     except Exception:
-        logger.warning("Failed to persist ID mapping %s", virtual_id, exc_info=True)
+        logger.warning("Failed to persist %d ID mappings", len(batch), exc_info=True)
+    finally:
+        _unwritten -= len(batch)
 
 
 async def flush_pending() -> None:
-    """Await all in-flight persist tasks. Used by tests."""
+    """Write out all queued mappings and await in-flight writes.
+
+    Called on shutdown so nothing registered during the session is lost.
+    """
+    _start_flush()
     if _pending_tasks:
         await asyncio.gather(*_pending_tasks, return_exceptions=True)
 
@@ -133,7 +242,8 @@ async def flush_pending() -> None:
 async def load_from_store(data_dir: Path, collection: str) -> int:
     """Load all persisted mappings into memory.
 
-    Enumerates the store's collection directory and bulk-loads all entries.
+    A SQLiteIDStore is read in one table scan. For a FileTreeStore, the
+    collection directory under `data_dir` is enumerated and bulk-loaded.
 
     Returns:
         Number of mappings loaded.
@@ -141,6 +251,12 @@ async def load_from_store(data_dir: Path, collection: str) -> int:
     if _store is None:
         return 0
 
+    if isinstance(_store, SQLiteIDStore):
+        rows = await _store.load_all()
+        for key, real_id in rows:
+            _remember(key, real_id)
+        return len(rows)
+
     col_path = data_dir / collection
     if not col_path.is_dir():
         return 0
@@ -153,14 +269,32 @@ async def load_from_store(data_dir: Path, collection: str) -> int:
     count = 0
     for key, value in zip(keys, values, strict=True):
         if value is not None and "real_id" in value:
-            real_id = value["real_id"]
-            _virtual_to_real[key] = real_id
-            _real_to_virtual[real_id] = key
+            _remember(key, value["real_id"])
             count += 1
 
     return count
 
 
+def _lookup_persisted(virtual_id: str) -> str | None:
+    """Resolve a virtual ID from the on-disk index, if the store has one.
+
+    This is what lets the server skip load_from_store at startup and evict
+    idle mappings: IDs from earlier sessions, or evicted ones, are found on
+    next use. FileTreeStore has no synchronous lookup, so with it only
+    resident IDs resolve.
+    """
+    queued = _queued.get(virtual_id)
+    if queued is not None:
+        return queued
+    if not isinstance(_store, SQLiteIDStore):
+        return None
+    try:
+        return _store.lookup(virtual_id)
+    except Exception:
+        logger.warning("ID store lookup failed for %s", virtual_id, exc_info=True)
+        return None
+
+
 def register_id(real_id: str) -> str:
     """Register a real ID and return its virtual ID.
 
@@ -172,13 +306,12 @@ def register_id(real_id: str) -> str:
     Returns:
         The 7-character Base64url virtual ID.
     """
-    if real_id in _real_to_virtual:
-        return _real_to_virtual[real_id]
-
     virtual_id = _generate_virtual_id(real_id)
-    _virtual_to_real[virtual_id] = real_id
-    _real_to_virtual[real_id] = virtual_id
+    if _virtual_to_real.get(virtual_id) == real_id:
+        _virtual_to_real.move_to_end(virtual_id)
+        return virtual_id
 
+    _remember(virtual_id, real_id)
     _schedule_persist(virtual_id, real_id)
 
     return virtual_id
@@ -194,11 +327,18 @@ def resolve_id(virtual_id: str) -> str:
         The real Morgen UUID.
 
     Raises:
-        IDNotFoundError: If the virtual ID is not registered.
+        IDNotFoundError: If the virtual ID is neither in memory nor in the
+            persistent store.
     """
-    if virtual_id not in _virtual_to_real:
+    real_id = _virtual_to_real.get(virtual_id)
+    if real_id is not None:
+        _virtual_to_real.move_to_end(virtual_id)
+        return real_id
+    real_id = _lookup_persisted(virtual_id)
+    if real_id is None:
         raise IDNotFoundError(virtual_id)
-    return _virtual_to_real[virtual_id]
+    _remember(virtual_id, real_id)
+    return real_id
 
 
 def resolve_ids(virtual_ids: list[str]) -> list[str]:
@@ -219,7 +359,6 @@ def resolve_ids(virtual_ids: list[str]) -> list[str]:
 def clear_registry() -> None:
     """Clear all ID mappings. Useful for testing."""
     _virtual_to_real.clear()
-    _real_to_virtual.clear()
 
 
 def virtualize_dict(data: dict[str, Any], id_fields: list[str]) -> dict[str, Any]:
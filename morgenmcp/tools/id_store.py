@@ -0,0 +1,196 @@
+"""Single-file SQLite backend for the virtual ID registry.
+
+FileTreeStore writes one small JSON file per virtual ID, so months of use
+leave tens of thousands of files in the data directory and startup has to
+glob and open every one of them. SQLiteIDStore keeps all mappings in one
+database file in WAL mode: writes are batched into a single transaction,
+lookups go through the primary-key index, and startup is either one
+sequential table scan or nothing at all: `lookup` is synchronous and cheap
+enough for the registry to resolve unknown IDs from disk on demand.
+
+It implements the subset of the key_value store API the registry uses
+(`setup`, `put`, `put_many`, `get`, `get_many`), so the two backends are
+interchangeable. `migrate_from_filetree` imports an existing FileTreeStore
+collection once and removes it.
+"""
+
+import asyncio
+import shutil
+import sqlite3
+import threading
+from collections.abc import Callable, Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+from fastmcp.utilities.logging import get_logger
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS id_mappings (
+    virtual_id TEXT PRIMARY KEY NOT NULL,
+    real_id TEXT NOT NULL
+) WITHOUT ROWID
+"""
+
+
+class SQLiteIDStore:
+    """Virtual-to-real ID mappings in a single SQLite database file."""
+
+    def __init__(self, path: Path):
+        """Initialize the store.
+
+        Args:
+            path: Database file. Created, with its parent directory, on setup.
+        """
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+        # Async methods run sqlite3 calls in worker threads while lookup()
+        # runs on the event loop thread; one call at a time per connection.
+        self._lock = threading.Lock()
+
+    async def setup(self) -> None:
+        """Open the database, enable WAL mode and create the table."""
+        if self._conn is not None:
+            return
+        self._conn = await asyncio.to_thread(self._open)
+
+    def _open(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        # WAL + NORMAL survives process crashes; only an OS crash can lose
+        # the last commits, and those mappings are re-derived on next listing.
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(_SCHEMA)
+        conn.commit()
+        return conn
+
+    def _call[T](self, fn: Callable[..., T], *args: Any) -> T:
+        with self._lock:
+            if self._conn is None:
+                raise RuntimeError("SQLiteIDStore is not open")
+            return fn(self._conn, *args)
+
+    async def _run[T](self, fn: Callable[..., T], *args: Any) -> T:
+        return await asyncio.to_thread(self._call, fn, *args)
+
+    async def put(self, key: str, value: Mapping[str, Any]) -> None:
+        """Store one mapping (`value` is `{"real_id": ...}`)."""
+        await self.put_many([key], [value])
+
+    async def put_many(
+        self, keys: Sequence[str], values: Sequence[Mapping[str, Any]]
+    ) -> None:
+        """Store several mappings in one transaction."""
+        rows = [(k, v["real_id"]) for k, v in zip(keys, values, strict=True)]
+        if rows:
+            await self._run(_insert_rows, rows)
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Look up one mapping by virtual ID."""
+        return (await self.get_many([key]))[0]
+
+    async def get_many(self, keys: Sequence[str]) -> list[dict[str, Any] | None]:
+        """Look up several mappings, returning None for unknown keys."""
+        found = await self._run(_select_keys, list(keys))
+        return [{"real_id": found[k]} if k in found else None for k in keys]
+
+    def lookup(self, virtual_id: str) -> str | None:
+        """Synchronously resolve one virtual ID through the primary-key index.
+
+        Returns None for unknown IDs and when the store is closed.
+        """
+        with self._lock:
+            if self._conn is None:
+                return None
+            row = self._conn.execute(
+                "SELECT real_id FROM id_mappings WHERE virtual_id = ?", (virtual_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    async def load_all(self) -> list[tuple[str, str]]:
+        """Return every (virtual_id, real_id) pair in one table scan."""
+        return await self._run(_select_all)
+
+    async def close(self) -> None:
+        """Checkpoint the WAL back into the database file and close it."""
+        await asyncio.to_thread(self._close)
+
+    def _close(self) -> None:
+        with self._lock:
+            conn, self._conn = self._conn, None
+            if conn is not None:
+                _checkpoint_and_close(conn)
+
+
+def _insert_rows(conn: sqlite3.Connection, rows: list[tuple[str, str]]) -> None:
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO id_mappings (virtual_id, real_id) VALUES (?, ?)",
+            rows,
+        )
+
+
+def _select_keys(conn: sqlite3.Connection, keys: list[str]) -> dict[str, str]:
+    found: dict[str, str] = {}
+    # Stay well below SQLite's bound-parameter limit.
+    for i in range(0, len(keys), 500):
+        chunk = keys[i : i + 500]
+        placeholders = ",".join("?" * len(chunk))
+        cursor = conn.execute(
+            "SELECT virtual_id, real_id FROM id_mappings "
+            f"WHERE virtual_id IN ({placeholders})",
+            chunk,
+        )
+        found.update(cursor.fetchall())
+    return found
+
+
+def _select_all(conn: sqlite3.Connection) -> list[tuple[str, str]]:
+    return conn.execute("SELECT virtual_id, real_id FROM id_mappings").fetchall()
+
+
+def _checkpoint_and_close(conn: sqlite3.Connection) -> None:
+    try:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    finally:
+        conn.close()
+
+
+async def migrate_from_filetree(
+    store: SQLiteIDStore, data_dir: Path, collection: str
+) -> int:
+    """Import a FileTreeStore collection into `store`, then delete it.
+
+    A no-op when the collection directory does not exist. The directory is
+    only removed after every readable mapping has been committed, so an
+    interrupted migration simply runs again on the next start.
+
+    Returns:
+        Number of mappings migrated.
+    """
+    col_path = data_dir / collection
+    if not col_path.is_dir():
+        return 0
+
+    from key_value.aio.stores.filetree import FileTreeStore
+
+    legacy = FileTreeStore(data_directory=data_dir, default_collection=collection)
+    await legacy.setup()
+
+    keys = [f.stem for f in col_path.glob("*.json")]
+    values = await legacy.get_many(keys) if keys else []
+    found = [
+        (key, value)
+        for key, value in zip(keys, values, strict=True)
+        if value is not None and "real_id" in value
+    ]
+    await store.put_many([k for k, _ in found], [v for _, v in found])
+
+    shutil.rmtree(col_path)
+    (data_dir / f"{collection}-info.json").unlink(missing_ok=True)
+    logger.info(
+        "Migrated %d ID mappings from %s to %s", len(found), col_path, store.path
+    )
+    return len(found)
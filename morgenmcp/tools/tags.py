@@ -9,6 +9,7 @@ from morgenmcp.models import (
     TagDeleteRequest,
     TagUpdateRequest,
 )
+from morgenmcp.pagination import collect
 from morgenmcp.tools.id_registry import register_id, resolve_id
 from morgenmcp.tools.utils import filter_none_values, handle_tool_errors
 from morgenmcp.validators import validate_hex_color
@@ -30,13 +31,22 @@ def _format_tag(tag: Tag) -> dict:
 async def list_tags(
     updated_after: str | None = None,
     limit: int | None = None,
+    all_pages: bool = False,
+    name: str | None = None,
 ) -> dict:
     """List user tags.
 
+    Without updated_after or limit, tags are served from a local tag index
+    kept current with incremental syncs.
+
     Args:
         updated_after: ISO 8601 datetime; when provided, also returns
             tags marked deleted (deleted=True). Useful for incremental sync.
         limit: Maximum number of tags to return.
+        all_pages: Follow pages past the per-call limit and return every
+            tag. Ignores limit.
+        name: Only the tag with this name (case-insensitive), looked up in
+            the tag index. Ignores the other arguments.
 
     Returns:
         Dictionary with 'tags' key containing list of tag objects, plus 'count'.
@@ -45,7 +55,15 @@ async def list_tags(
         raise ToolError("limit must be a positive integer")
 
     client = get_client()
-    tags = await client.list_tags(limit=limit, updated_after=updated_after)
+    if name is not None:
+        tag = await client.find_tag(name)
+        tags = [tag] if tag else []
+    elif updated_after is None and (all_pages or limit is None):
+        tags = await client.list_all_tags()
+    elif all_pages:
+        tags = await collect(client.iter_tags(updated_after))
+    else:
+        tags = await client.list_tags(limit=limit, updated_after=updated_after)
 
     return {
         "tags": [_format_tag(t) for t in tags],
@@ -1,13 +1,17 @@
 """MCP tools for Morgen task operations."""
 
 import asyncio
+from collections.abc import Callable, Collection, Mapping
+from datetime import datetime
 from typing import Any, Literal
 
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
+from fastmcp.utilities.logging import get_logger
 
 from morgenmcp.client import get_client
 from morgenmcp.models import (
+    MorgenAPIError,
     Task,
     TaskCloseRequest,
     TaskCreateRequest,
@@ -17,8 +21,13 @@ from morgenmcp.models import (
     TaskReopenRequest,
     TaskUpdateRequest,
 )
+from morgenmcp.pagination import collect
 from morgenmcp.tools.id_registry import register_id, resolve_id, resolve_ids
-from morgenmcp.tools.utils import filter_none_values, handle_tool_errors
+from morgenmcp.tools.utils import (
+    filter_none_values,
+    handle_tool_errors,
+    select_fields,
+)
 from morgenmcp.validators import (
     validate_duration,
     validate_local_datetime,
@@ -27,40 +36,112 @@ from morgenmcp.validators import (
     validate_timezone,
 )
 
+logger = get_logger(__name__)
 
-def _format_task(task: Task) -> dict[str, Any]:
-    """Format a task for tool output, virtualizing IDs."""
-    related = task.related_to or {}
-    related_out = {
-        register_id(parent_id): {
-            "relation": rel.relation,
-        }
-        for parent_id, rel in related.items()
+
+def _related_to(task: Task) -> dict[str, dict[str, Any]] | None:
+    related = {
+        register_id(parent_id): {"relation": rel.relation}
+        for parent_id, rel in (task.related_to or {}).items()
+    }
+    return related or None
+
+
+def _tag_names_of(
+    task: Task, tag_names: Mapping[str, str] | None
+) -> dict[str, str] | None:
+    named = {
+        register_id(t): tag_names[t]
+        for t in (task.tags or [])
+        if tag_names and t in tag_names
     }
+    return named or None
+
+
+# Output field -> how to compute it from the task and the tag name map.
+# Fields are only computed (and their IDs only registered) when selected.
+_TASK_FIELDS: dict[str, Callable[[Task, Mapping[str, str] | None], Any]] = {
+    "id": lambda t, names: register_id(t.id),
+    "accountId": lambda t, names: register_id(t.account_id) if t.account_id else None,
+    "integrationId": lambda t, names: t.integration_id,
+    "taskListId": lambda t, names: t.task_list_id,
+    "title": lambda t, names: t.title,
+    "description": lambda t, names: t.description,
+    "due": lambda t, names: t.due,
+    "timeZone": lambda t, names: t.time_zone,
+    "estimatedDuration": lambda t, names: t.estimated_duration,
+    "priority": lambda t, names: t.priority,
+    "progress": lambda t, names: t.progress,
+    "position": lambda t, names: t.position,
+    "relatedTo": lambda t, names: _related_to(t),
+    "tags": lambda t, names: [register_id(tag) for tag in (t.tags or [])] or None,
+    "tagNames": _tag_names_of,
+    "scheduled": lambda t, names: t.derived.scheduled if t.derived else None,
+    "created": lambda t, names: t.created,
+    "updated": lambda t, names: t.updated,
+}
+
+
+def _format_task(
+    task: Task,
+    tag_names: Mapping[str, str] | None = None,
+    fields: Collection[str] | None = None,
+) -> dict[str, Any]:
+    """Format a task for tool output, virtualizing IDs.
 
+    Args:
+        task: The task to format.
+        tag_names: Tag ID to name map (see _tag_names); known names are
+            added as 'tagNames', keyed by tag virtual ID.
+        fields: Output fields to include (see select_fields); None
+            includes every field.
+    """
     return filter_none_values(
         {
-            "id": register_id(task.id),
-            "accountId": register_id(task.account_id) if task.account_id else None,
-            "integrationId": task.integration_id,
-            "taskListId": task.task_list_id,
-            "title": task.title,
-            "description": task.description,
-            "due": task.due,
-            "timeZone": task.time_zone,
-            "estimatedDuration": task.estimated_duration,
-            "priority": task.priority,
-            "progress": task.progress,
-            "position": task.position,
-            "relatedTo": related_out or None,
-            "tags": [register_id(t) for t in (task.tags or [])] or None,
-            "scheduled": task.derived.scheduled if task.derived else None,
-            "created": task.created,
-            "updated": task.updated,
+            name: get(task, tag_names)
+            for name, get in _TASK_FIELDS.items()
+            if fields is None or name in fields
         }
     )
 
 
+async def _tag_names(
+    tasks: list[Task], fields: Collection[str] | None = None
+) -> Mapping[str, str]:
+    """Tag names for _format_task, from the client's tag index.
+
+    Skips the lookup when no task carries tags, or when `fields` leaves
+    out 'tagNames'. A failed tag sync only costs the names, not the task
+    listing.
+    """
+    if fields is not None and "tagNames" not in fields:
+        return {}
+    if not any(task.tags for task in tasks):
+        return {}
+    try:
+        return await get_client().tag_names()
+    except MorgenAPIError:
+        logger.warning("Tag index sync failed; omitting tag names", exc_info=True)
+        return {}
+
+
+_OPEN_PROGRESS_VALUES = {"needs-action", "in-process", None}
+
+
+def _is_open(task: Task) -> bool:
+    return task.progress in _OPEN_PROGRESS_VALUES
+
+
+def _due_datetime(task: Task) -> datetime | None:
+    """The task's due time as a naive datetime, or None if unset/unparseable."""
+    if not task.due:
+        return None
+    try:
+        return datetime.fromisoformat(task.due).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
 def _build_related_to(parent_task_id: str | None) -> dict[str, TaskRelation] | None:
     """Build a relatedTo dict for a single parent task."""
     if not parent_task_id:
@@ -73,6 +154,8 @@ def _build_related_to(parent_task_id: str | None) -> dict[str, TaskRelation] | N
 async def list_tasks(
     limit: int | None = None,
     updated_after: str | None = None,
+    all_pages: bool = False,
+    fields: list[str] | None = None,
 ) -> dict:
     """List Morgen tasks.
 
@@ -81,6 +164,10 @@ async def list_tasks(
             endpoint costs 10 rate-limit points per call regardless of limit.
         updated_after: ISO 8601 datetime; when provided, returns tasks
             updated/created after this timestamp. Useful for incremental sync.
+        all_pages: Follow pages past the 100-task limit and return every
+            task (10 rate-limit points per page). Ignores limit.
+        fields: Optional task fields to return, e.g. ["title", "due"];
+            "id" is always included. Omit for every field.
 
     Returns:
         Dictionary with 'tasks' key containing list of task objects with
@@ -88,16 +175,87 @@ async def list_tasks(
     """
     if limit is not None and (limit < 1 or limit > 100):
         raise ToolError("limit must be between 1 and 100")
+    selected = select_fields(fields, _TASK_FIELDS)
 
     client = get_client()
-    tasks = await client.list_tasks(limit=limit, updated_after=updated_after)
+    if all_pages:
+        tasks = await collect(client.iter_tasks(updated_after))
+    else:
+        tasks = await client.list_tasks(limit=limit, updated_after=updated_after)
 
+    tag_names = await _tag_names(tasks, selected)
     return {
-        "tasks": [_format_task(t) for t in tasks],
+        "tasks": [_format_task(t, tag_names, selected) for t in tasks],
         "count": len(tasks),
     }
 
 
+@handle_tool_errors
+async def query_tasks(
+    status: Literal["open", "closed", "all"] = "open",
+    due_after: str | None = None,
+    due_before: str | None = None,
+    tag_ids: list[str] | None = None,
+    search: str | None = None,
+    limit: int | None = None,
+) -> dict:
+    """Filter all tasks locally, without paging through list_tasks.
+
+    Reads a mirror of every task that is kept current with incremental
+    syncs, so repeated queries cost at most a small upstream delta.
+
+    Args:
+        status: "open" (needs-action / in-process), "closed" (completed,
+            failed or cancelled), or "all". Default "open".
+        due_after: Only tasks due at or after this LocalDateTime.
+        due_before: Only tasks due before this LocalDateTime.
+        tag_ids: Only tasks carrying all of these tag virtual IDs.
+        search: Case-insensitive text to find in the title or description.
+        limit: Max tasks to return (default: all matches).
+
+    Returns:
+        Dictionary with 'tasks' (task objects with virtual IDs), 'count'
+        (tasks returned) and 'matched' (tasks matching before the limit).
+    """
+    if due_after is not None:
+        validate_local_datetime(due_after, "due_after")
+    if due_before is not None:
+        validate_local_datetime(due_before, "due_before")
+    if limit is not None and limit < 1:
+        raise ToolError("limit must be at least 1")
+
+    after = datetime.fromisoformat(due_after) if due_after else None
+    before = datetime.fromisoformat(due_before) if due_before else None
+    required_tags = set(resolve_ids(tag_ids)) if tag_ids else set()
+    needle = search.casefold() if search else None
+
+    def matches(task: Task) -> bool:
+        if status != "all" and _is_open(task) != (status == "open"):
+            return False
+        if after or before:
+            due = _due_datetime(task)
+            if due is None or (after and due < after) or (before and due >= before):
+                return False
+        if required_tags and not required_tags <= set(task.tags or []):
+            return False
+        if needle:
+            text = f"{task.title or ''}\n{task.description or ''}".casefold()
+            if needle not in text:
+                return False
+        return True
+
+    client = get_client()
+    matched = [t for t in await client.list_all_tasks() if matches(t)]
+    selected = matched[:limit] if limit else matched
+
+    tag_names = await _tag_names(selected)
+    return {
+        "tasks": [_format_task(t, tag_names) for t in selected],
+        "count": len(selected),
+        "matched": len(matched),
+    }
+
+
 @handle_tool_errors
 async def get_task(task_id: str) -> dict:
     """Retrieve a single task by virtual ID.
@@ -111,7 +269,7 @@ async def get_task(task_id: str) -> dict:
     real_id = resolve_id(task_id)
     client = get_client()
     task = await client.get_task(real_id)
-    return {"task": _format_task(task)}
+    return {"task": _format_task(task, await _tag_names([task]))}
 
 
 @handle_tool_errors
@@ -2,7 +2,7 @@
 
 import base64
 import json
-from collections.abc import Callable
+from collections.abc import Callable, Collection, Iterable
 from functools import wraps
 from typing import Any
 
@@ -37,6 +37,32 @@ def filter_none_values(d: dict[str, Any]) -> dict[str, Any]:
     return {k: v for k, v in d.items() if v is not None and v != []}
 
 
+def select_fields(
+    fields: Iterable[str] | None, available: Collection[str]
+) -> frozenset[str] | None:
+    """Validate a requested field projection.
+
+    Args:
+        fields: Output field names to keep, or None for every field.
+        available: The field names the formatter can produce.
+
+    Returns:
+        The fields to produce, always including 'id' so results can still
+        be acted on, or None for every field.
+
+    Raises:
+        ValidationError: If a name is not in `available`.
+    """
+    if fields is None:
+        return None
+    selected = frozenset(fields)
+    if unknown := sorted(selected - set(available)):
+        raise ValidationError(
+            f"Unknown field(s) {', '.join(unknown)}; available: {', '.join(available)}"
+        )
+    return selected | {"id"}
+
+
 def handle_tool_errors(func: Callable) -> Callable:
     """Decorator to handle common tool errors consistently.
 
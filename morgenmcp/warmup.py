@@ -0,0 +1,62 @@
+"""Prefetch of the data most reads start from.
+
+Right after startup every store behind MorgenClient is empty, so the first
+morgen://events/today or list_events call pays for the calendar listing
+and a full event fetch. warm_up reads accounts, calendars, this week's
+events (which covers today), all tasks and all tags through the client,
+filling its directory, event store, task mirror and tag index.
+
+It runs once, at startup, when MORGENMCP_WARMUP is set (see
+server._warmup_enabled). It is not repeated: the stores expire their
+copies within minutes, and keeping them warm would mean background
+fetches at that rate whether or not anything reads them. A run is skipped
+while the client's rate budget is below BACKGROUND_RESERVE, e.g. right
+after a restart that followed heavy use.
+"""
+
+import asyncio
+import time
+
+from fastmcp.utilities.logging import get_logger
+
+from morgenmcp.client import get_client
+from morgenmcp.ratelimit import BACKGROUND_RESERVE
+from morgenmcp.resources import fetch_events_in_window, this_week_range
+
+logger = get_logger(__name__)
+
+
+async def warm_up() -> list[str]:
+    """Prefetch hot data into the client's stores; failures are logged only.
+
+    Returns:
+        The names of the steps that failed (none when the run is skipped
+        for lack of rate budget).
+    """
+    client = get_client()
+    if (available := client.rate_limiter.available) < BACKGROUND_RESERVE:
+        logger.info("warm-up skipped: %.0f rate-limit points left", available)
+        return []
+    started = time.monotonic()
+    steps = {
+        "accounts": client.list_accounts(),
+        "calendars": client.list_calendars(),
+        "events": fetch_events_in_window(*this_week_range()),
+        "tasks": client.list_all_tasks(),
+        "tags": client.list_all_tags(),
+    }
+    results = await asyncio.gather(*steps.values(), return_exceptions=True)
+    failed = []
+    for name, result in zip(steps, results, strict=True):
+        if isinstance(result, asyncio.CancelledError):
+            raise result
+        if isinstance(result, BaseException):
+            logger.warning("warm-up: prefetching %s failed: %s", name, result)
+            failed.append(name)
+    logger.debug(
+        "warm-up finished in %.2fs (%d/%d steps ok)",
+        time.monotonic() - started,
+        len(steps) - len(failed),
+        len(steps),
+    )
+    return failed
@@ -1,6 +1,8 @@
 """Shared pytest fixtures and helpers."""
 
 import os
+from collections.abc import Iterable
+from typing import Protocol
 
 import pytest
 
@@ -10,6 +12,58 @@ import pytest
 os.environ.setdefault("MORGEN_API_KEY", "test-placeholder-key")
 
 
+class FakeClock:
+    """Manually advanced monotonic clock, for the stores' `clock` argument."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class _Identified(Protocol):
+    @property
+    def id(self) -> str: ...
+
+
+class FakeUpstream[T: _Identified]:
+    """Mutable item set served like a Morgen list endpoint, for store fetches.
+
+    Called without updatedAfter it returns the live items; with it, the
+    items updated after that stamp, tombstones (deleted=True) included.
+    """
+
+    def __init__(self, items: Iterable[T]) -> None:
+        self.items: dict[str, T] = {item.id: item for item in items}
+        self.calls: list[str | None] = []
+
+    async def __call__(self, updated_after: str | None = None) -> list[T]:
+        self.calls.append(updated_after)
+        if updated_after is None:
+            return [i for i in self.items.values() if not getattr(i, "deleted", False)]
+        return [
+            i
+            for i in self.items.values()
+            if (getattr(i, "updated", None) or "") > updated_after
+        ]
+
+    def put(self, item: T) -> None:
+        """Add `item`, or replace the one with its ID in place."""
+        self.items[item.id] = item
+
+
+@pytest.fixture
+def upstream(upstream_items):
+    """A FakeUpstream over the test module's `upstream_items`."""
+    return FakeUpstream(upstream_items)
+
+
 @pytest.fixture(autouse=True)
 def _disable_persistent_store():
     """Prevent tests from writing to the real persistent store."""
@@ -18,3 +72,13 @@ def _disable_persistent_store():
     set_store(None)
     yield
     set_store(None)
+
+
+@pytest.fixture(autouse=True)
+def _clear_format_cache():
+    """Keep formatted-event output from leaking between tests."""
+    from morgenmcp.tools.events import _formatted
+
+    _formatted.clear()
+    yield
+    _formatted.clear()
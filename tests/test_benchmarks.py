@@ -0,0 +1,75 @@
+"""Smoke tests for the benchmark suite and its fake Morgen API."""
+
+import json
+
+import pytest
+
+from benchmarks.fake_morgen import FakeMorgen, FakeMorgenConfig
+from benchmarks.suite import run_suite
+
+TINY = FakeMorgenConfig(
+    accounts=2,
+    calendars_per_account=2,
+    events_per_calendar=20,
+    tasks=10,
+    tags=3,
+    id_history=20,
+)
+
+
+@pytest.fixture(autouse=True)
+def _restore_client():
+    from morgenmcp import client
+
+    saved = client._client
+    yield
+    client._client = saved
+
+
+class TestFakeMorgen:
+    async def test_serves_windowed_events_with_rate_limit_headers(self):
+        fake = FakeMorgen(TINY)
+        start, end = fake.window(days=fake.config.span_days, offset_days=-7)
+        account = fake.dataset.accounts[0]
+        calendars = [
+            c["id"] for c in fake.dataset.calendars if c["accountId"] == account["id"]
+        ]
+
+        async with fake.client() as client:
+            events = await client.list_events(account["id"], calendars, start, end)
+            day = fake.window(days=1)
+            today = await client.list_events(account["id"], calendars[:1], *day)
+
+        assert len(events) == 2 * TINY.events_per_calendar
+        assert 0 < len(today) < TINY.events_per_calendar
+        # The day window is answered from the client's event store
+        assert fake.requests["/events/list"] == 1
+        info = client.rate_limiter.last_info
+        assert info is not None
+        assert info.remaining == TINY.rate_limit - 1
+
+    async def test_exhausted_budget_returns_429(self):
+        from morgenmcp.models import MorgenAPIError
+        from morgenmcp.retry import RetryPolicy
+
+        fake = FakeMorgen(FakeMorgenConfig(accounts=1, rate_limit=1))
+        async with fake.client(retry_policy=RetryPolicy(max_attempts=1)) as client:
+            await client.list_calendars()
+            with pytest.raises(MorgenAPIError) as exc_info:
+                await client.list_accounts()
+
+        assert exc_info.value.status_code == 429
+
+
+class TestSuite:
+    async def test_runs_every_benchmark_and_emits_json(self):
+        document = await run_suite(TINY, iterations=1)
+
+        names = {r["name"] for r in document["results"]}
+        assert {"list_events.compact.cold", "batch_update_events"} <= names
+        assert all(r["median_s"] >= 0 for r in document["results"])
+        cold = next(
+            r for r in document["results"] if r["name"] == "list_events.full.cold"
+        )
+        assert cold["upstream_requests"] == 1 + TINY.accounts
+        json.dumps(document)
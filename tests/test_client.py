@@ -327,6 +327,42 @@ class TestEventEndpoints:
         assert events[0].id == "evt123"
         assert events[0].title == "Meeting"
 
+    @respx.mock
+    async def test_list_events_decodes_nested_models_from_bytes(self):
+        """The raw body is validated directly, nested models included."""
+        event = {
+            "id": "evt123",
+            "calendarId": "cal456",
+            "accountId": "acc789",
+            "integrationId": "google",
+            "start": "2023-03-01T10:00:00",
+            "duration": "PT1H",
+            "participants": {
+                "p1": {"email": "a@example.com", "roles": {"owner": True}}
+            },
+            "morgen.so:derived": {"virtualRoom": {"url": "https://meet.example"}},
+        }
+        respx.get("https://api.morgen.so/v3/events/list").mock(
+            side_effect=[
+                httpx.Response(200, json={"data": {"events": [event]}}),
+                httpx.Response(200, content=b'{"data": {"events": ['),
+            ]
+        )
+
+        async with MorgenClient(api_key="test_key") as client:
+            args = ("acc789", ["cal456"], "2023-03-01T00:00:00Z")
+            [parsed] = await client._fetch_events(*args, "2023-03-02T00:00:00Z")
+            with pytest.raises(ValueError):
+                await client._fetch_events(*args, "2023-03-03T00:00:00Z")
+
+        assert parsed.participants is not None
+        roles = parsed.participants["p1"].roles
+        assert roles is not None
+        assert roles.owner is True
+        assert parsed.derived is not None
+        assert parsed.derived.virtual_room is not None
+        assert parsed.derived.virtual_room.url == "https://meet.example"
+
     @respx.mock
     async def test_list_events_query_params(self):
         """Test that list_events sends correct query parameters."""
@@ -0,0 +1,146 @@
+"""Tests for the TTL-cached account and calendar directory."""
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from morgenmcp.client import MorgenClient
+from morgenmcp.directory import Directory
+from morgenmcp.models import Account, Calendar
+
+
+def _calendar(calendar_id: str, account_id: str, name: str) -> Calendar:
+    return Calendar.model_validate(
+        {
+            "id": calendar_id,
+            "accountId": account_id,
+            "integrationId": "google",
+            "name": name,
+        }
+    )
+
+
+@pytest.fixture
+def upstream_items():
+    return [
+        _calendar("c1", "a1", "Work"),
+        _calendar("c2", "a1", "Home"),
+    ]
+
+
+class TestDirectory:
+    async def test_listing_is_cached_until_ttl(self, clock, upstream):
+        directory = Directory(ttl_s=300, clock=clock)
+        first = await directory.calendars(upstream)
+        clock.now = 299
+        second = await directory.calendars(upstream)
+        assert len(upstream.calls) == 1
+        assert first == second
+        assert first is not second
+        clock.now = 300
+        await directory.calendars(upstream)
+        assert len(upstream.calls) == 2
+
+    async def test_lookup_is_served_from_the_index(self, clock, upstream):
+        directory = Directory(clock=clock)
+        await directory.calendars(upstream)
+        calendar = await directory.calendar("c2", upstream)
+        assert calendar is not None
+        assert calendar.name == "Home"
+        assert len(upstream.calls) == 1
+
+    async def test_miss_on_cached_listing_refetches_once(self, clock, upstream):
+        directory = Directory(clock=clock)
+        await directory.calendars(upstream)
+        upstream.put(_calendar("c3", "a2", "New"))
+        calendar = await directory.calendar("c3", upstream)
+        assert calendar is not None
+        assert calendar.name == "New"
+        assert len(upstream.calls) == 2
+        assert await directory.calendar("gone", upstream) is None
+        assert len(upstream.calls) == 3
+
+    async def test_miss_on_fresh_fetch_does_not_refetch(self, clock, upstream):
+        directory = Directory(clock=clock)
+        assert await directory.calendar("gone", upstream) is None
+        assert len(upstream.calls) == 1
+
+    async def test_invalidate_calendars_keeps_accounts(self, clock, upstream):
+        directory = Directory(clock=clock)
+        accounts_calls = 0
+
+        async def fetch_accounts() -> list[Account]:
+            nonlocal accounts_calls
+            accounts_calls += 1
+            return [
+                Account.model_validate(
+                    {
+                        "id": "a1",
+                        "providerId": "p",
+                        "integrationId": "google",
+                        "providerUserId": "user@example.com",
+                        "providerUserDisplayName": "User",
+                    }
+                )
+            ]
+
+        await directory.accounts(fetch_accounts)
+        await directory.calendars(upstream)
+        directory.invalidate_calendars()
+        await directory.accounts(fetch_accounts)
+        await directory.calendars(upstream)
+        assert (accounts_calls, len(upstream.calls)) == (1, 2)
+
+    async def test_invalidate_during_a_fetch_is_not_lost(self, clock, upstream):
+        directory = Directory(clock=clock)
+        release = asyncio.Event()
+
+        async def slow() -> list[Calendar]:
+            calendars = await upstream()
+            await release.wait()
+            return calendars
+
+        load = asyncio.create_task(directory.calendars(slow))
+        await asyncio.sleep(0)
+        upstream.put(_calendar("c1", "a1", "Office"))
+        directory.invalidate_calendars()
+        release.set()
+        await load
+
+        calendar = await directory.calendar("c1", upstream)
+        assert calendar is not None
+        assert calendar.name == "Office"
+        assert len(upstream.calls) == 2
+
+
+class TestClientDirectory:
+    @respx.mock
+    async def test_calendar_metadata_write_invalidates(self):
+        route = respx.get("https://api.morgen.so/v3/calendars/list").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "data": {
+                        "calendars": [
+                            {"id": "c1", "accountId": "a1", "integrationId": "google"}
+                        ]
+                    }
+                },
+            )
+        )
+        respx.post("https://api.morgen.so/v3/calendars/update").mock(
+            return_value=httpx.Response(200, json={"data": {}})
+        )
+
+        async with MorgenClient(api_key="k") as client:
+            await client.list_calendars()
+            calendar = await client.get_calendar("c1")
+            assert calendar is not None
+            assert calendar.account_id == "a1"
+            assert route.call_count == 1
+
+            await client.update_calendar_metadata("c1", "a1", busy=False)
+            await client.list_calendars()
+            assert route.call_count == 2
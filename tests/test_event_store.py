@@ -0,0 +1,432 @@
+"""Tests for the incremental, time-indexed event store."""
+
+import asyncio
+from datetime import UTC, datetime
+
+import httpx
+import pytest
+import respx
+
+from morgenmcp.client import MorgenClient
+from morgenmcp.event_store import (
+    EventStore,
+    _parse_duration,
+    _subtract,
+    split_window,
+)
+from morgenmcp.models import Event, EventDeleteRequest
+
+ACC = "acc1"
+CAL_A = "calA"
+CAL_B = "calB"
+
+
+def _event(
+    event_id: str,
+    start: str,
+    duration: str = "PT1H",
+    calendar_id: str = CAL_A,
+    time_zone: str | None = None,
+    all_day: bool = False,
+) -> Event:
+    return Event(
+        id=event_id,
+        calendar_id=calendar_id,
+        account_id=ACC,
+        integration_id="google",
+        title=event_id,
+        start=start,
+        duration=duration,
+        time_zone=time_zone,
+        show_without_time=all_day,
+    )
+
+
+def _at(day: int, hour: int) -> datetime:
+    return datetime(2026, 3, day, hour)
+
+
+def _utc(bound: str) -> datetime:
+    dt = datetime.fromisoformat(bound)
+    return dt if dt.tzinfo is None else dt.astimezone(UTC).replace(tzinfo=None)
+
+
+class FakeUpstream:
+    """Serves events like /events/list, each with a hard-coded UTC span.
+
+    Spans are given explicitly rather than derived with the store's own
+    helpers, so a bug in those cannot also hide in the oracle.
+    """
+
+    def __init__(self, events: list[tuple[Event, datetime, datetime]]) -> None:
+        self.events = events
+        self.calls: list[tuple[list[str], str, str]] = []
+
+    async def __call__(
+        self, account_id: str, calendar_ids: list[str], start: str, end: str
+    ) -> list[Event]:
+        self.calls.append((calendar_ids, start, end))
+        window_start, window_end = _utc(start), _utc(end)
+        return [
+            event
+            for event, event_start, event_end in self.events
+            if event.calendar_id in calendar_ids
+            and event_start < window_end
+            and event_end > window_start
+        ]
+
+    def remove(self, event_id: str) -> None:
+        self.events = [entry for entry in self.events if entry[0].id != event_id]
+
+
+@pytest.fixture
+def upstream():
+    return FakeUpstream(
+        [
+            (_event("mon", "2026-03-02T09:00:00"), _at(2, 9), _at(2, 10)),
+            (_event("tue", "2026-03-03T09:00:00"), _at(3, 9), _at(3, 10)),
+            (_event("wed", "2026-03-04T09:00:00"), _at(4, 9), _at(4, 10)),
+            (
+                _event("thu-b", "2026-03-05T09:00:00", calendar_id=CAL_B),
+                _at(5, 9),
+                _at(5, 10),
+            ),
+            (
+                _event("overnight", "2026-03-02T22:00:00", duration="PT4H"),
+                _at(2, 22),
+                _at(3, 2),
+            ),
+        ]
+    )
+
+
+class TestHelpers:
+    def test_parse_duration(self):
+        assert _parse_duration("PT1H30M").total_seconds() == 5400
+        assert _parse_duration("P1D").total_seconds() == 86400
+        assert _parse_duration("P1W").days == 7
+        assert _parse_duration("garbage").total_seconds() == 0
+
+    def test_subtract(self):
+        def d(day: int) -> datetime:
+            return datetime(2026, 3, day)
+
+        assert _subtract((d(1), d(10)), []) == [(d(1), d(10))]
+        assert _subtract((d(1), d(10)), [(d(3), d(5))]) == [
+            (d(1), d(3)),
+            (d(5), d(10)),
+        ]
+        assert _subtract((d(1), d(10)), [(d(1), d(10))]) == []
+        assert _subtract((d(4), d(6)), [(d(1), d(5)), (d(5), d(8))]) == []
+
+    def test_split_window(self):
+        from datetime import timedelta
+
+        month = timedelta(days=30)
+        assert split_window("2026-01-01T00:00:00", "2026-01-20T00:00:00", month) == [
+            ("2026-01-01T00:00:00", "2026-01-20T00:00:00")
+        ]
+        assert split_window("2026-01-01T00:00:00", "2026-03-15T12:00:00", month) == [
+            ("2026-01-01T00:00:00", "2026-01-31T00:00:00"),
+            ("2026-01-31T00:00:00", "2026-03-02T00:00:00"),
+            ("2026-03-02T00:00:00", "2026-03-15T12:00:00"),
+        ]
+        # Offset bounds: outer ones kept verbatim, inner ones in UTC
+        assert split_window(
+            "2026-01-01T00:00:00+02:00", "2026-02-15T00:00:00+02:00", month
+        ) == [
+            ("2026-01-01T00:00:00+02:00", "2026-01-30T22:00:00Z"),
+            ("2026-01-30T22:00:00Z", "2026-02-15T00:00:00+02:00"),
+        ]
+
+
+class TestEventStore:
+    async def test_cold_window_passes_through(self, clock, upstream):
+        store = EventStore(clock=clock)
+        events = await store.list_events(
+            ACC, [CAL_A], "2026-03-02T00:00:00", "2026-03-03T00:00:00", upstream
+        )
+        assert [e.id for e in events] == ["mon", "overnight"]
+        assert upstream.calls == [
+            ([CAL_A], "2026-03-02T00:00:00", "2026-03-03T00:00:00")
+        ]
+
+    async def test_contained_window_is_served_locally(self, clock, upstream):
+        store = EventStore(clock=clock)
+        await store.list_events(
+            ACC, [CAL_A], "2026-03-02T00:00:00", "2026-03-09T00:00:00", upstream
+        )
+
+        events = await store.list_events(
+            ACC, [CAL_A], "2026-03-03T00:00:00", "2026-03-04T00:00:00", upstream
+        )
+
+        assert [e.id for e in events] == ["overnight", "tue"]
+        assert len(upstream.calls) == 1
+
+    async def test_only_uncovered_range_is_fetched(self, clock, upstream):
+        store = EventStore(clock=clock)
+        await store.list_events(
+            ACC, [CAL_A], "2026-03-02T00:00:00", "2026-03-03T00:00:00", upstream
+        )
+
+        events = await store.list_events(
+            ACC, [CAL_A], "2026-03-02T00:00:00", "2026-03-05T00:00:00", upstream
+        )
+
+        assert [e.id for e in events] == ["mon", "overnight", "tue", "wed"]
+        assert upstream.calls[-1] == (
+            [CAL_A],
+            "2026-03-03T00:00:00",
+            "2026-03-05T00:00:00",
+        )
+
+    async def test_gap_fetch_only_includes_calendars_missing_it(self, clock, upstream):
+        store = EventStore(clock=clock)
+        await store.list_events(
+            ACC, [CAL_A], "2026-03-02T00:00:00", "2026-03-09T00:00:00", upstream
+        )
+
+        events = await store.list_events(
+            ACC, [CAL_A, CAL_B], "2026-03-02T00:00:00", "2026-03-09T00:00:00", upstream
+        )
+
+        assert upstream.calls[-1][0] == [CAL_B]
+        assert {e.id for e in events} == {"mon", "tue", "wed", "thu-b", "overnight"}
+
+    async def test_coverage_expires_after_ttl(self, clock, upstream):
+        store = EventStore(ttl_s=60.0, clock=clock)
+        window = ("2026-03-02T00:00:00", "2026-03-03T00:00:00")
+        await store.list_events(ACC, [CAL_A], *window, upstream)
+
+        clock.now += 61
+        upstream.remove("mon")
+        events = await store.list_events(ACC, [CAL_A], *window, upstream)
+
+        assert len(upstream.calls) == 2
+        assert [e.id for e in events] == ["overnight"]
+
+    async def test_refetch_drops_deleted_events(self, clock, upstream):
+        store = EventStore(ttl_s=60.0, clock=clock)
+        await store.list_events(
+            ACC, [CAL_A], "2026-03-02T00:00:00", "2026-03-05T00:00:00", upstream
+        )
+
+        # After invalidation, the refetched range no longer contains "tue"
+        store.invalidate(ACC, CAL_A)
+        upstream.remove("tue")
+        await store.list_events(
+            ACC, [CAL_A], "2026-03-03T00:00:00", "2026-03-04T00:00:00", upstream
+        )
+        events = await store.list_events(
+            ACC, [CAL_A], "2026-03-03T00:00:00", "2026-03-04T00:00:00", upstream
+        )
+
+        assert [e.id for e in events] == ["overnight"]
+
+    async def test_invalidate_during_a_fetch_is_not_lost(self, clock, upstream):
+        store = EventStore(ttl_s=60.0, clock=clock)
+        window = ("2026-03-02T00:00:00", "2026-03-03T00:00:00")
+        release = asyncio.Event()
+
+        async def slow(*args) -> list[Event]:
+            events = await upstream(*args)
+            await release.wait()
+            return events
+
+        read = asyncio.create_task(store.list_events(ACC, [CAL_A], *window, slow))
+        await asyncio.sleep(0)
+        # A write lands after the window was fetched, before it is stored.
+        upstream.remove("mon")
+        store.invalidate(ACC, CAL_A)
+        release.set()
+        assert "mon" in [e.id for e in await read]
+
+        events = await store.list_events(ACC, [CAL_A], *window, upstream)
+        assert len(upstream.calls) == 2
+        assert [e.id for e in events] == ["overnight"]
+
+    async def test_timed_events_use_their_time_zone(self, clock):
+        # 09:00 in Chicago (CST, UTC-6) is 15:00 UTC
+        upstream = FakeUpstream(
+            [
+                (
+                    _event("chi", "2026-03-02T09:00:00", time_zone="America/Chicago"),
+                    _at(2, 15),
+                    _at(2, 16),
+                )
+            ]
+        )
+        store = EventStore(clock=clock)
+        await store.list_events(
+            ACC, [CAL_A], "2026-03-02T00:00:00", "2026-03-03T00:00:00", upstream
+        )
+
+        afternoon = await store.list_events(
+            ACC, [CAL_A], "2026-03-02T14:00:00", "2026-03-02T16:00:00", upstream
+        )
+        morning = await store.list_events(
+            ACC, [CAL_A], "2026-03-02T08:00:00", "2026-03-02T10:00:00", upstream
+        )
+
+        assert [e.id for e in afternoon] == ["chi"]
+        assert morning == []
+        assert len(upstream.calls) == 1
+
+    async def test_offset_bounds_keep_their_format(self, clock, upstream):
+        store = EventStore(clock=clock)
+        await store.list_events(
+            ACC, [CAL_A], "2026-03-02T00:00:00Z", "2026-03-03T00:00:00Z", upstream
+        )
+        await store.list_events(
+            ACC, [CAL_A], "2026-03-02T00:00:00Z", "2026-03-04T00:00:00Z", upstream
+        )
+        assert upstream.calls[-1][1:] == (
+            "2026-03-03T00:00:00Z",
+            "2026-03-04T00:00:00Z",
+        )
+
+    async def test_zero_ttl_always_refetches(self, clock, upstream):
+        store = EventStore(ttl_s=0, clock=clock)
+        window = ("2026-03-02T00:00:00", "2026-03-03T00:00:00")
+        await store.list_events(ACC, [CAL_A], *window, upstream)
+        await store.list_events(ACC, [CAL_A], *window, upstream)
+        assert len(upstream.calls) == 2
+
+
+class TestClientEventStore:
+    @respx.mock
+    async def test_overlapping_reads_cost_one_upstream_call(self):
+        route = respx.get("https://api.morgen.so/v3/events/list").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "data": {
+                        "events": [
+                            {
+                                "id": "evt1",
+                                "calendarId": CAL_A,
+                                "accountId": ACC,
+                                "integrationId": "google",
+                                "title": "Standup",
+                                "start": "2026-03-03T09:00:00",
+                                "duration": "PT15M",
+                            }
+                        ]
+                    }
+                },
+            )
+        )
+
+        async with MorgenClient(api_key="k") as client:
+            week = await client.list_events(
+                ACC, [CAL_A], "2026-03-02T00:00:00", "2026-03-09T00:00:00"
+            )
+            day = await client.list_events(
+                ACC, [CAL_A], "2026-03-03T00:00:00", "2026-03-04T00:00:00"
+            )
+
+        assert route.call_count == 1
+        assert [e.id for e in week] == [e.id for e in day] == ["evt1"]
+
+    @respx.mock
+    async def test_long_window_is_fetched_in_chunks(self):
+        def event(event_id: str, start: str) -> dict:
+            return {
+                "id": event_id,
+                "calendarId": CAL_A,
+                "accountId": ACC,
+                "integrationId": "google",
+                "title": event_id,
+                "start": start,
+                "duration": "P3D",
+            }
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            chunk_start = request.url.params["start"]
+            events = [event("straddle", "2026-01-30T00:00:00")]
+            if chunk_start.startswith("2026-01-01"):
+                events.insert(0, event("jan", "2026-01-05T09:00:00"))
+            if chunk_start.startswith("2026-03"):
+                events.append(event("mar", "2026-03-10T09:00:00"))
+            return httpx.Response(200, json={"data": {"events": events}})
+
+        route = respx.get("https://api.morgen.so/v3/events/list").mock(
+            side_effect=respond
+        )
+
+        async with MorgenClient(api_key="k", event_chunk_days=30) as client:
+            events = await client.list_events(
+                ACC, [CAL_A], "2026-01-01T00:00:00", "2026-03-15T00:00:00"
+            )
+
+        assert [call.request.url.params["start"] for call in route.calls] == [
+            "2026-01-01T00:00:00",
+            "2026-01-31T00:00:00",
+            "2026-03-02T00:00:00",
+        ]
+        assert [e.id for e in events] == ["jan", "straddle", "mar"]
+
+    @respx.mock
+    async def test_large_calendar_set_is_fanned_out(self):
+        calendar_ids = [f"cal{i}" for i in range(11)]
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            events = [
+                {
+                    "id": f"evt-{cal_id}",
+                    "calendarId": cal_id,
+                    "accountId": ACC,
+                    "integrationId": "google",
+                    "title": cal_id,
+                    "start": "2026-03-03T09:00:00",
+                    "duration": "PT1H",
+                }
+                for cal_id in request.url.params["calendarIds"].split(",")
+            ]
+            return httpx.Response(200, json={"data": {"events": events}})
+
+        route = respx.get("https://api.morgen.so/v3/events/list").mock(
+            side_effect=respond
+        )
+
+        async with MorgenClient(api_key="k", calendars_per_request=5) as client:
+            events = await client.list_events(
+                ACC, calendar_ids, "2026-03-02T00:00:00", "2026-03-09T00:00:00"
+            )
+
+        sent = [call.request.url.params["calendarIds"] for call in route.calls]
+        assert sorted(len(ids.split(",")) for ids in sent) == [3, 4, 4]
+        assert sorted(e.calendar_id for e in events) == sorted(calendar_ids)
+
+    @respx.mock
+    async def test_chunking_can_be_disabled(self):
+        route = respx.get("https://api.morgen.so/v3/events/list").mock(
+            return_value=httpx.Response(200, json={"data": {"events": []}})
+        )
+
+        async with MorgenClient(api_key="k", event_chunk_days=None) as client:
+            await client.list_events(
+                ACC, [CAL_A], "2026-01-01T00:00:00", "2026-06-01T00:00:00"
+            )
+
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_event_write_invalidates_calendar(self):
+        route = respx.get("https://api.morgen.so/v3/events/list").mock(
+            return_value=httpx.Response(200, json={"data": {"events": []}})
+        )
+        respx.post("https://api.morgen.so/v3/events/delete").mock(
+            return_value=httpx.Response(200, json={})
+        )
+        window = ("2026-03-02T00:00:00", "2026-03-03T00:00:00")
+
+        async with MorgenClient(api_key="k") as client:
+            await client.list_events(ACC, [CAL_A], *window)
+            await client.delete_event(
+                EventDeleteRequest(id="evt1", account_id=ACC, calendar_id=CAL_A)
+            )
+            await client.list_events(ACC, [CAL_A], *window)
+
+        assert route.call_count == 2
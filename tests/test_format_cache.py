@@ -0,0 +1,134 @@
+"""Tests for the bounded cache of formatted event output."""
+
+from typing import Any
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from morgenmcp.format_cache import FormatCache
+from morgenmcp.models import Event, EventMetadata
+from morgenmcp.serialization import dumps
+from morgenmcp.tools import events as events_module
+from morgenmcp.tools.events import (
+    _format_compact_event,
+    _format_full_event,
+    _format_full_event_json,
+    _formatted,
+)
+from morgenmcp.tools.id_registry import clear_registry, resolve_id
+
+UTC = ZoneInfo("UTC")
+
+
+@pytest.fixture(autouse=True)
+def _clean_registry():
+    clear_registry()
+    yield
+    clear_registry()
+
+
+def _event(**overrides) -> Event:
+    fields: dict[str, Any] = {
+        "id": "evt-1",
+        "calendar_id": "cal-1",
+        "account_id": "acc-1",
+        "integration_id": "google",
+        "title": "Standup",
+        "start": "2026-03-02T09:00:00",
+        "duration": "PT30M",
+        "time_zone": "UTC",
+        "updated": "2026-03-01T12:00:00Z",
+    } | overrides
+    return Event(**fields)
+
+
+class TestFormatCache:
+    def test_least_recently_used_entry_is_dropped(self):
+        cache: FormatCache[str, int] = FormatCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert (cache.get("a"), cache.get("c")) == (1, 3)
+        assert (cache.hits, cache.misses) == (3, 1)
+
+    def test_zero_entries_disables_caching(self):
+        cache: FormatCache[str, int] = FormatCache(max_entries=0)
+        cache.put("a", 1)
+        assert len(cache) == 0
+        assert cache.get("a") is None
+
+
+class TestFormattedEvents:
+    def test_unchanged_event_is_formatted_once(self, monkeypatch):
+        calls = []
+        build = events_module._build_compact_event
+        monkeypatch.setattr(
+            events_module,
+            "_build_compact_event",
+            lambda e, tz: calls.append(e.id) or build(e, tz),
+        )
+        event = _event()
+        first = _format_compact_event(event, UTC)
+        assert _format_compact_event(event.model_copy(), UTC) == first
+        assert calls == ["evt-1"]
+
+    @pytest.mark.parametrize(
+        "changed",
+        [
+            {"updated": "2026-03-01T13:00:00Z", "title": "Retro"},
+            {"id": "evt-2", "title": "Retro"},
+        ],
+    )
+    def test_key_includes_id_and_updated(self, changed):
+        _format_compact_event(_event(), UTC)
+        assert "Retro" in _format_compact_event(_event(**changed), UTC)
+
+    def test_key_includes_display_tz_and_mode(self):
+        event = _event()
+        utc = _format_compact_event(event, UTC)
+        tokyo = _format_compact_event(event, ZoneInfo("Asia/Tokyo"))
+        assert utc.startswith("09:00") and tokyo.startswith("18:00")
+        assert _format_full_event(event, {"id", "title"}).keys() == {"id", "title"}
+        assert "calendarId" in _format_full_event(event)
+        assert len(_formatted) == 4
+
+    def test_metadata_updated_stamp_is_used(self):
+        _format_compact_event(_event(updated=None), UTC)
+        assert len(_formatted) == 0
+        _format_compact_event(
+            _event(updated=None, metadata=EventMetadata(updated="2026-03-01")), UTC
+        )
+        assert len(_formatted) == 1
+
+    def test_key_includes_metadata_stamp(self):
+        before = EventMetadata(updated="2026-03-01", category_name="Work")
+        after = EventMetadata(updated="2026-03-02", category_name="Personal")
+        assert _format_full_event(_event(metadata=before))["categoryName"] == "Work"
+        full = _format_full_event(_event(metadata=after))
+        assert full["categoryName"] == "Personal"
+
+    def test_hit_keeps_virtual_ids_resolvable(self):
+        event = _event(master_event_id="evt-master")
+        output = _format_full_event(event)
+        clear_registry()
+        assert _format_full_event(event) == output
+        for name, real_id in [
+            ("id", "evt-1"),
+            ("calendarId", "cal-1"),
+            ("accountId", "acc-1"),
+            ("masterEventId", "evt-master"),
+        ]:
+            assert resolve_id(output[name]) == real_id
+
+    def test_full_output_is_a_private_copy(self):
+        event = _event()
+        _format_full_event(event)["title"] = "Edited"
+        assert _format_full_event(event)["title"] == "Standup"
+
+    def test_json_fragment_matches_full_output(self):
+        event = _event()
+        fragment = _format_full_event_json(event, {"title", "start"})
+        assert fragment is _format_full_event_json(event, ["start", "title"])
+        assert fragment.json == dumps(_format_full_event(event, {"title", "start"}))
@@ -0,0 +1,27 @@
+"""Tests for the TTL and invalidation bookkeeping of local stores."""
+
+from morgenmcp.freshness import Freshness
+
+
+class TestFreshness:
+    def test_stale_until_synced_then_for_ttl(self, clock):
+        freshness = Freshness(ttl_s=60, clock=clock)
+        assert freshness.stale(0)
+        freshness.finish(freshness.begin())
+        assert not freshness.stale(59)
+        assert freshness.stale(60)
+
+    def test_invalidate_during_a_sync_keeps_it_stale(self, clock):
+        freshness = Freshness(ttl_s=60, clock=clock)
+        ticket = freshness.begin()
+        freshness.invalidate()
+        assert freshness.overtaken(ticket)
+        freshness.finish(ticket)
+        assert freshness.stale(0)
+
+    def test_sync_counts_from_its_start(self, clock):
+        freshness = Freshness(ttl_s=60, clock=clock)
+        ticket = freshness.begin()
+        clock.now = 30
+        freshness.finish(ticket)
+        assert freshness.stale(60)
@@ -1,5 +1,8 @@
 """Tests for persistent virtual ID registry."""
 
+import asyncio
+from typing import Any
+
 import pytest
 from key_value.aio.stores.filetree import FileTreeStore
 
@@ -12,6 +15,7 @@ from morgenmcp.tools.id_registry import (
     resolve_id,
     set_store,
 )
+from morgenmcp.tools.id_store import SQLiteIDStore, migrate_from_filetree
 
 _COLLECTION = "id_mappings"
 
@@ -139,6 +143,250 @@ class TestPersistenceWithFileTreeStore:
             assert resolve_id(virtual_id) == real_id
 
 
+@pytest.fixture()
+async def sqlite_store(tmp_path):
+    """Create a SQLiteIDStore in a temp directory."""
+    store = SQLiteIDStore(tmp_path / "ids.sqlite3")
+    await store.setup()
+    yield store
+    await store.close()
+
+
+class TestPersistenceWithSQLiteStore:
+    async def test_register_persists_to_store(self, sqlite_store):
+        set_store(sqlite_store)
+
+        real_id = "507f1f77bcf86cd799439011"
+        virtual_id = register_id(real_id)
+        await flush_pending()
+
+        assert await sqlite_store.get(virtual_id) == {"real_id": real_id}
+        assert await sqlite_store.get("missing") is None
+
+    async def test_uses_a_single_file_in_wal_mode(self, sqlite_store, tmp_path):
+        set_store(sqlite_store)
+        for i in range(50):
+            register_id(f"real-{i}")
+        await flush_pending()
+
+        assert {p.name for p in tmp_path.iterdir()} <= {
+            "ids.sqlite3",
+            "ids.sqlite3-wal",
+            "ids.sqlite3-shm",
+        }
+        mode = await sqlite_store._run(
+            lambda conn: conn.execute("PRAGMA journal_mode").fetchone()[0]
+        )
+        assert mode == "wal"
+
+    async def test_cross_session_persistence(self, tmp_path):
+        path = tmp_path / "ids.sqlite3"
+        store1 = SQLiteIDStore(path)
+        await store1.setup()
+        set_store(store1)
+        ids = {f"real-{i}": register_id(f"real-{i}") for i in range(3)}
+        await flush_pending()
+        await store1.close()
+
+        set_store(None)
+        clear_registry()
+
+        store2 = SQLiteIDStore(path)
+        await store2.setup()
+        set_store(store2)
+        try:
+            assert await load_from_store(tmp_path, _COLLECTION) == 3
+            for real_id, virtual_id in ids.items():
+                assert resolve_id(virtual_id) == real_id
+        finally:
+            await store2.close()
+
+    async def test_get_many_preserves_order(self, sqlite_store):
+        await sqlite_store.put_many(
+            ["a", "b"], [{"real_id": "real-a"}, {"real_id": "real-b"}]
+        )
+        assert await sqlite_store.get_many(["b", "x", "a"]) == [
+            {"real_id": "real-b"},
+            None,
+            {"real_id": "real-a"},
+        ]
+
+
+class TestLazyResolution:
+    async def test_resolves_from_disk_without_preload(self, sqlite_store):
+        set_store(sqlite_store)
+        real_id = "640a62c9aa5b7e06cf420000"
+        virtual_id = register_id(real_id)
+        await flush_pending()
+        clear_registry()
+
+        # No load_from_store: the first resolve hits the index, then memory
+        assert resolve_id(virtual_id) == real_id
+        await sqlite_store.close()
+        assert resolve_id(virtual_id) == real_id
+        assert register_id(real_id) == virtual_id
+
+    async def test_unknown_id_still_raises(self, sqlite_store):
+        set_store(sqlite_store)
+        with pytest.raises(IDNotFoundError):
+            resolve_id("nope123")
+
+    async def test_lookup_on_closed_store_returns_none(self, tmp_path):
+        store = SQLiteIDStore(tmp_path / "ids.sqlite3")
+        assert store.lookup("abc") is None
+
+
+class TestResidentLimit:
+    async def test_lru_mappings_are_evicted_and_reloaded(self, monkeypatch, tmp_path):
+        from morgenmcp.tools import id_registry
+
+        monkeypatch.setenv("MORGENMCP_ID_CACHE_SIZE", "3")
+        store = SQLiteIDStore(tmp_path / "ids.sqlite3")
+        await store.setup()
+        set_store(store)
+        try:
+            virtual_ids = [register_id(f"real-{i}") for i in range(5)]
+            await flush_pending()
+
+            assert list(id_registry._virtual_to_real) == virtual_ids[2:]
+            # Evicted IDs come back from disk and become most recently used
+            assert resolve_id(virtual_ids[0]) == "real-0"
+            assert list(id_registry._virtual_to_real) == [
+                virtual_ids[3],
+                virtual_ids[4],
+                virtual_ids[0],
+            ]
+        finally:
+            await store.close()
+
+    async def test_evicted_ids_resolve_before_they_are_flushed(
+        self, monkeypatch, sqlite_store
+    ):
+        monkeypatch.setenv("MORGENMCP_ID_CACHE_SIZE", "1")
+        set_store(sqlite_store)
+
+        first = register_id("real-first")
+        register_id("real-second")
+
+        assert resolve_id(first) == "real-first"
+
+    def test_unbounded_without_a_lookup_store(self, monkeypatch):
+        from morgenmcp.tools import id_registry
+
+        monkeypatch.setenv("MORGENMCP_ID_CACHE_SIZE", "1")
+        set_store(None)
+        for i in range(5):
+            register_id(f"real-{i}")
+
+        assert len(id_registry._virtual_to_real) == 5
+
+    def test_real_ids_are_interned(self):
+        import sys
+
+        from morgenmcp.tools import id_registry
+
+        real_id = "".join(["640a62c9aa5b7e06", "cf420000"])
+        virtual_id = register_id(real_id)
+
+        assert id_registry._virtual_to_real[virtual_id] is sys.intern(real_id)
+
+
+class RecordingStore:
+    """Minimal store that records each put_many batch."""
+
+    def __init__(self) -> None:
+        self.batches: list[dict[str, str]] = []
+
+    async def put_many(self, keys, values) -> None:
+        self.batches.append(
+            {k: v["real_id"] for k, v in zip(keys, values, strict=True)}
+        )
+
+    async def get_many(self, keys) -> list[dict[str, Any] | None]:
+        return [None] * len(keys)
+
+
+class TestWriteBehind:
+    async def test_many_registrations_share_one_write(self):
+        store = RecordingStore()
+        set_store(store)
+
+        for i in range(100):
+            register_id(f"real-{i}")
+        await flush_pending()
+
+        assert len(store.batches) == 1
+        assert len(store.batches[0]) == 100
+
+    async def test_batch_size_triggers_immediate_flush(self, monkeypatch):
+        monkeypatch.setattr("morgenmcp.tools.id_registry._BATCH_SIZE", 10)
+        store = RecordingStore()
+        set_store(store)
+
+        for i in range(25):
+            register_id(f"real-{i}")
+        await asyncio.sleep(0)
+
+        assert [len(b) for b in store.batches] == [10, 10]
+        await flush_pending()
+        assert [len(b) for b in store.batches] == [10, 10, 5]
+
+    async def test_flushes_after_delay(self, monkeypatch):
+        monkeypatch.setattr("morgenmcp.tools.id_registry._FLUSH_DELAY_S", 0.01)
+        store = RecordingStore()
+        set_store(store)
+
+        register_id("507f1f77bcf86cd799439011")
+        assert store.batches == []
+        await asyncio.sleep(0.05)
+
+        assert store.batches == [{"6bieWxP": "507f1f77bcf86cd799439011"}]
+
+    async def test_backlog_is_bounded(self, monkeypatch):
+        monkeypatch.setattr("morgenmcp.tools.id_registry._MAX_UNWRITTEN", 5)
+        store = RecordingStore()
+        set_store(store)
+
+        virtual_ids = [register_id(f"real-{i}") for i in range(8)]
+        await flush_pending()
+
+        # Everything is still resolvable; only persistence was shed
+        assert [resolve_id(v) for v in virtual_ids] == [f"real-{i}" for i in range(8)]
+        assert sum(len(b) for b in store.batches) == 5
+
+        register_id("real-late")
+        await flush_pending()
+        assert "real-late" in store.batches[-1].values()
+
+    async def test_failed_write_is_logged_not_raised(self):
+        class FailingStore(RecordingStore):
+            async def put_many(self, keys, values) -> None:
+                raise OSError("disk full")
+
+        set_store(FailingStore())
+        register_id("507f1f77bcf86cd799439011")
+        await flush_pending()
+
+
+class TestFileTreeMigration:
+    async def test_migrates_and_removes_legacy_directory(
+        self, store, sqlite_store, tmp_path
+    ):
+        await store.setup()
+        for i in range(3):
+            await store.put(f"vid{i}", {"real_id": f"real-{i}"})
+
+        migrated = await migrate_from_filetree(sqlite_store, tmp_path, _COLLECTION)
+
+        assert migrated == 3
+        assert not (tmp_path / _COLLECTION).exists()
+        assert not (tmp_path / f"{_COLLECTION}-info.json").exists()
+        assert await sqlite_store.get("vid1") == {"real_id": "real-1"}
+
+    async def test_missing_legacy_directory_is_a_no_op(self, sqlite_store, tmp_path):
+        assert await migrate_from_filetree(sqlite_store, tmp_path, _COLLECTION) == 0
+
+
 class TestWithoutStore:
     def test_register_works_without_store(self):
         """In-memory registration works when no store is configured."""
@@ -7,8 +7,9 @@ from unittest.mock import AsyncMock, patch
 import pytest
 from fastmcp import Client
 from fastmcp.client.logging import LogMessage
+from mcp.types import TextResourceContents
 
-from morgenmcp.models import Calendar, MorgenAPIError
+from morgenmcp.models import Calendar, MorgenAPIError, Task
 from morgenmcp.server import mcp
 from morgenmcp.tools.id_registry import clear_registry
 
@@ -45,6 +46,7 @@ class TestMCPServer:
                 "morgen_batch_update_events",
                 # Tasks
                 "morgen_list_tasks",
+                "morgen_query_tasks",
                 "morgen_get_task",
                 "morgen_create_task",
                 "morgen_update_task",
@@ -71,6 +73,7 @@ class TestMCPServer:
                 "morgen_list_calendars",
                 "morgen_list_events",
                 "morgen_list_tasks",
+                "morgen_query_tasks",
                 "morgen_get_task",
                 "morgen_list_tags",
             ]:
@@ -278,13 +281,47 @@ class TestMCPServer:
                 "morgen://tasks",
                 "morgen://tasks/today",
                 "morgen://tags",
+                "morgen://metrics",
+                "morgen://metrics/prometheus",
             }
             assert template_uris == {
                 "morgen://account/{account_id}",
                 "morgen://calendar/{calendar_id}",
-                "morgen://calendar/{calendar_id}/events",
+                "morgen://calendar/{calendar_id}/events{?fields}",
+                "morgen://events/today{?fields}",
+                "morgen://events/this-week{?fields}",
+                "morgen://events/upcoming{?fields}",
+                "morgen://tasks{?fields}",
+                "morgen://tasks/today{?fields}",
             }
 
+    async def test_resources_have_readonly_annotation(self):
+        """Resources and templates are annotated read-only and idempotent."""
+        async with Client(mcp) as client:
+            resources = await client.list_resources()
+            templates = await client.list_resource_templates()
+            for entry in [*resources, *templates]:
+                hints = entry.annotations.model_dump(exclude_none=True)
+                assert hints == {"readOnlyHint": True, "idempotentHint": True}
+
+    async def test_read_projected_resource_through_protocol(self):
+        """A ?fields= query reaches the resource through its template."""
+        with patch("morgenmcp.resources.get_client") as mock:
+            client_mock = AsyncMock()
+            client_mock.list_all_tasks.return_value = [
+                Task(id="t-proj-1", title="A", progress="needs-action")
+            ]
+            mock.return_value = client_mock
+
+            async with Client(mcp) as client:
+                projected = await client.read_resource("morgen://tasks?fields=title")
+                full = await client.read_resource("morgen://tasks")
+
+        assert isinstance(projected[0], TextResourceContents)
+        assert isinstance(full[0], TextResourceContents)
+        assert set(json.loads(projected[0].text)["tasks"][0]) == {"id", "title"}
+        assert "progress" in json.loads(full[0].text)["tasks"][0]
+
     async def test_read_resource_through_protocol(self):
         """A resource can be read through the full MCP protocol stack."""
         with patch("morgenmcp.resources.get_client") as mock:
@@ -408,14 +445,14 @@ class TestResponseCaching:
         """Two reads of the same resource URI hit the underlying client once."""
         with patch("morgenmcp.resources.get_client") as mock:
             client_mock = AsyncMock()
-            client_mock.list_tags.return_value = []
+            client_mock.list_all_tags.return_value = []
             mock.return_value = client_mock
 
             async with Client(mcp) as client:
                 await client.read_resource("morgen://tags")
                 await client.read_resource("morgen://tags")
 
-            assert client_mock.list_tags.await_count == 1
+            assert client_mock.list_all_tags.await_count == 1
 
     async def test_different_args_bypass_cache(self):
         """Different arguments produce different cache keys (no false hits)."""
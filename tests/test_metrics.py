@@ -0,0 +1,175 @@
+"""Tests for per-endpoint Morgen API metrics."""
+
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+import respx
+from fastmcp import Client
+from mcp.types import TextResourceContents
+
+from morgenmcp.client import MorgenClient
+from morgenmcp.metrics import TRANSPORT_ERROR, ClientMetrics
+from morgenmcp.models import RateLimitInfo
+from morgenmcp.retry import RetryPolicy
+
+
+class TestClientMetrics:
+    def test_percentiles_and_counts(self):
+        metrics = ClientMetrics()
+        for ms in range(1, 101):
+            metrics.record("/events/list", 200, ms / 1000, size=100)
+        metrics.record("/events/list", 503, 0.5)
+
+        snapshot = metrics.snapshot()["endpoints"]["/events/list"]
+        assert snapshot["requests"] == 101
+        assert snapshot["statusCodes"] == {"200": 100, "503": 1}
+        assert snapshot["bytesReceived"] == 10_000
+        assert snapshot["latency"]["p50Ms"] == 51.0
+        assert snapshot["latency"]["p99Ms"] == 100.0
+        assert snapshot["latency"]["maxMs"] == 500.0
+
+    def test_rate_limit_history(self):
+        now = [1000.0]
+        metrics = ClientMetrics(clock=lambda: now[0])
+        assert metrics.snapshot()["rateLimit"] is None
+
+        metrics.observe_rate_limit(
+            RateLimitInfo(limit=300, remaining=290, reset_seconds=60)
+        )
+        now[0] += 5
+        metrics.observe_rate_limit(
+            RateLimitInfo(limit=300, remaining=280, reset_seconds=55)
+        )
+
+        rate_limit = metrics.snapshot()["rateLimit"]
+        assert rate_limit["remaining"] == 280
+        assert rate_limit["history"] == [
+            {"at": 1000, "remaining": 290},
+            {"at": 1005, "remaining": 280},
+        ]
+
+    def test_summary_line(self):
+        metrics = ClientMetrics()
+        assert metrics.summary() == "api_requests=0 api_errors=0"
+
+        metrics.record("/tasks/list", 200, 0.2)
+        metrics.record("/calendars/list", 200, 0.01)
+        metrics.record("/calendars/list", TRANSPORT_ERROR, 0.01)
+        metrics.observe_rate_limit(
+            RateLimitInfo(limit=300, remaining=12, reset_seconds=9)
+        )
+
+        assert metrics.summary() == (
+            "api_requests=3 api_errors=1 slowest=/tasks/list:200ms ratelimit=12/300"
+        )
+
+    def test_prometheus_histogram_is_cumulative(self):
+        metrics = ClientMetrics()
+        metrics.record("/tags/list", 200, 0.07, size=42)
+        metrics.record("/tags/list", 200, 3.0)
+        metrics.observe_rate_limit(
+            RateLimitInfo(limit=300, remaining=7, reset_seconds=9)
+        )
+
+        text = metrics.to_prometheus()
+        lines = text.splitlines()
+        assert (
+            'morgen_api_requests_total{endpoint="/tags/list",status="200"} 2' in lines
+        )
+        assert (
+            'morgen_api_request_duration_seconds_bucket{endpoint="/tags/list",le="0.05"} 0'
+            in lines
+        )
+        assert (
+            'morgen_api_request_duration_seconds_bucket{endpoint="/tags/list",le="0.1"} 1'
+            in lines
+        )
+        assert (
+            'morgen_api_request_duration_seconds_bucket{endpoint="/tags/list",le="+Inf"} 2'
+            in lines
+        )
+        assert 'morgen_api_response_bytes_total{endpoint="/tags/list"} 42' in lines
+        assert "morgen_api_rate_limit_remaining 7" in lines
+        assert text.endswith("\n")
+
+
+class TestClientInstrumentation:
+    @respx.mock
+    async def test_requests_are_recorded_per_endpoint(self):
+        body = {"data": {"calendars": []}}
+        respx.get("https://api.morgen.so/v3/calendars/list").mock(
+            return_value=httpx.Response(
+                200,
+                json=body,
+                headers={
+                    "RateLimit-Limit": "300",
+                    "RateLimit-Remaining": "299",
+                    "RateLimit-Reset": "900",
+                },
+            )
+        )
+
+        async with MorgenClient(api_key="k") as client:
+            await client.list_calendars()
+            snapshot = client.metrics.snapshot()
+
+        calendars = snapshot["endpoints"]["/calendars/list"]
+        assert calendars["requests"] == 1
+        assert calendars["statusCodes"] == {"200": 1}
+        assert calendars["bytesReceived"] == len(httpx.Response(200, json=body).content)
+        assert snapshot["rateLimit"]["remaining"] == 299
+
+    @respx.mock
+    async def test_failed_attempts_are_recorded(self, monkeypatch):
+        async def _no_sleep(_: float) -> None:
+            return None
+
+        monkeypatch.setattr("morgenmcp.client.asyncio.sleep", _no_sleep)
+        respx.get("https://api.morgen.so/v3/tags/list").mock(
+            side_effect=[
+                httpx.ConnectError("down"),
+                httpx.Response(503),
+                httpx.Response(200, json=[]),
+            ]
+        )
+
+        policy = RetryPolicy(max_attempts=3, rng=lambda: 0.0)
+        async with MorgenClient(api_key="k", retry_policy=policy) as client:
+            await client.list_tags()
+            statuses = client.metrics.endpoints["/tags/list"].statuses
+
+        assert statuses == {TRANSPORT_ERROR: 1, "503": 1, "200": 1}
+
+
+class TestMetricsResource:
+    @pytest.fixture
+    def metrics(self):
+        metrics = ClientMetrics()
+        with patch("morgenmcp.resources.get_client") as mock:
+            mock.return_value.metrics = metrics
+            yield metrics
+
+    async def test_metrics_resource_is_not_cached(self, metrics):
+        from morgenmcp.server import mcp
+
+        async with Client(mcp) as client:
+            first = await client.read_resource("morgen://metrics")
+            metrics.record("/events/list", 200, 0.1)
+            second = await client.read_resource("morgen://metrics")
+
+        assert isinstance(first[0], TextResourceContents)
+        assert isinstance(second[0], TextResourceContents)
+        assert json.loads(first[0].text)["endpoints"] == {}
+        assert json.loads(second[0].text)["endpoints"]["/events/list"]["requests"] == 1
+
+    async def test_prometheus_resource(self, metrics):
+        from morgenmcp.server import mcp
+
+        metrics.record("/events/list", 200, 0.1)
+        async with Client(mcp) as client:
+            contents = await client.read_resource("morgen://metrics/prometheus")
+
+        assert isinstance(contents[0], TextResourceContents)
+        assert "morgen_api_requests_total" in contents[0].text
@@ -0,0 +1,169 @@
+"""Tests for updatedAfter cursor pagination."""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+import respx
+
+from morgenmcp.client import MorgenClient
+from morgenmcp.models import Tag, Task
+from morgenmcp.pagination import collect, paginate, since
+
+
+def _stamp(i: int) -> str:
+    return f"2026-04-01T10:{i // 60:02d}:{i % 60:02d}Z"
+
+
+class FakeList:
+    """Serves items oldest-update first, filtered like /tasks/list."""
+
+    def __init__(self, stamps: list[str], max_limit: int | None = None) -> None:
+        self.max_limit = max_limit
+        self.items = [
+            Task(id=f"t{i}", title=f"T{i}", updated=stamp)
+            for i, stamp in enumerate(stamps)
+        ]
+        self.calls: list[tuple[str | None, int]] = []
+
+    async def __call__(self, updated_after: str | None, limit: int) -> list[Task]:
+        self.calls.append((updated_after, limit))
+        return [
+            t
+            for t in self.items
+            if updated_after is None or (t.updated or "") > updated_after
+        ][: min(limit, self.max_limit or limit)]
+
+
+class TestSince:
+    def test_backs_off_one_second(self):
+        assert since("2026-04-01T10:00:00Z") == "2026-04-01T09:59:59Z"
+
+    def test_unparseable_stamp_is_kept(self):
+        assert since("yesterday") == "yesterday"
+
+
+class TestPaginate:
+    async def test_walks_every_page(self):
+        upstream = FakeList([_stamp(i) for i in range(25)])
+        pages = [page async for page in paginate(upstream, page_size=10)]
+        # Each page after the first re-fetches the boundary second.
+        assert [len(p) for p in pages] == [10, 9, 6]
+        items = [t.id for page in pages for t in page]
+        assert items == [f"t{i}" for i in range(25)]
+        assert upstream.calls[1] == (since(_stamp(9)), 10)
+
+    async def test_items_sharing_a_stamp_are_not_lost_or_repeated(self):
+        # Three items share the stamp at the page boundary.
+        stamps = [_stamp(i) for i in range(4)] + [_stamp(4)] * 3 + [_stamp(5)]
+        upstream = FakeList(stamps)
+        items = await collect(paginate(upstream, page_size=5))
+        assert [t.id for t in items] == [f"t{i}" for i in range(8)]
+
+    async def test_page_of_repeats_moves_past_the_stamp(self):
+        # More same-second items than fit in a page: the walk must end.
+        upstream = FakeList([_stamp(0)] * 6 + [_stamp(1)])
+        items = await collect(paginate(upstream, page_size=3))
+        assert len({t.id for t in items}) == len(items)
+        assert "t6" in {t.id for t in items}
+        assert len(upstream.calls) < 10
+
+    @pytest.mark.parametrize("same", [150, 450])
+    async def test_bulk_import_within_one_second_is_fully_walked(self, same):
+        # More items share one stamp than fit in a page (or in two).
+        upstream = FakeList([_stamp(0)] * same + [_stamp(1)])
+        with patch("morgenmcp.pagination.logger") as logger:
+            items = await collect(paginate(upstream))
+        assert [t.id for t in items] == [f"t{i}" for i in range(same + 1)]
+        logger.warning.assert_not_called()
+
+    async def test_capped_limit_skips_with_a_warning(self):
+        upstream = FakeList([_stamp(0)] * 150 + [_stamp(1)], max_limit=100)
+        with patch("morgenmcp.pagination.logger") as logger:
+            items = await collect(paginate(upstream))
+        assert len({t.id for t in items}) == len(items) == 101
+        assert items[-1].id == "t150"
+        logger.warning.assert_called_once()
+
+    async def test_starts_from_updated_after(self):
+        upstream = FakeList([_stamp(i) for i in range(5)])
+        items = await collect(paginate(upstream, _stamp(2), page_size=10))
+        assert [t.id for t in items] == ["t3", "t4"]
+        assert upstream.calls == [(_stamp(2), 10)]
+
+    async def test_next_page_is_prefetched(self):
+        upstream = FakeList([_stamp(i) for i in range(20)])
+        pages = paginate(upstream, page_size=10)
+        await anext(pages)
+        await asyncio.sleep(0)
+        assert len(upstream.calls) == 2
+        await pages.aclose()
+
+    async def test_closing_early_cancels_the_prefetch(self):
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def fetch(updated_after, limit):
+            if updated_after is None:
+                return [Task(id=f"t{i}", updated=_stamp(i)) for i in range(limit)]
+            started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return []
+
+        pages = paginate(fetch, page_size=2)
+        await anext(pages)
+        await started.wait()
+        await pages.aclose()
+        await asyncio.sleep(0)
+        assert cancelled.is_set()
+
+
+class TestClientIterators:
+    @pytest.fixture
+    def client(self):
+        return MorgenClient(api_key="test-key")
+
+    @respx.mock
+    async def test_iter_tasks_follows_pages(self, client):
+        def tasks_page(request):
+            after = request.url.params.get("updatedAfter")
+            data = [
+                {"id": f"t{i}", "title": f"T{i}", "updated": _stamp(i)}
+                for i in range(150)
+                if after is None or _stamp(i) > after
+            ][: int(request.url.params["limit"])]
+            return httpx.Response(200, json={"data": {"tasks": data}})
+
+        route = respx.get("https://api.morgen.so/v3/tasks/list").mock(
+            side_effect=tasks_page
+        )
+        tasks = await collect(client.iter_tasks())
+        assert len(tasks) == 150
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_iter_tags_drops_tombstones_of_a_full_walk(self, client):
+        tags = [
+            {"id": f"g{i}", "name": f"G{i}", "updated": _stamp(i), "deleted": i == 1}
+            for i in range(3)
+        ]
+
+        def tags_page(request):
+            # Later pages of a full walk carry an updatedAfter cursor, so
+            # they can include tombstones too.
+            after = request.url.params.get("updatedAfter")
+            return httpx.Response(
+                200, json=[t for t in tags if after is None or t["updated"] > after]
+            )
+
+        respx.get("https://api.morgen.so/v3/tags/list").mock(side_effect=tags_page)
+        live = await collect(client.iter_tags())
+        assert [t.id for t in live] == ["g0", "g2"]
+        delta = await collect(client.iter_tags(_stamp(0)))
+        assert [(t.id, t.deleted) for t in delta] == [("g1", True), ("g2", False)]
+        assert all(isinstance(t, Tag) for t in delta)
@@ -0,0 +1,153 @@
+"""Tests for the client-side rate limiter."""
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from morgenmcp.client import MorgenClient
+from morgenmcp.models import MorgenAPIError, RateLimitInfo
+from morgenmcp.ratelimit import DEFAULT_COST, RateLimiter
+
+
+@pytest.fixture
+def fake_sleep(monkeypatch, clock):
+    """Replace asyncio.sleep in the limiter with one that advances the clock."""
+    sleeps: list[float] = []
+
+    async def _sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        clock.now += seconds
+
+    monkeypatch.setattr("morgenmcp.ratelimit.asyncio.sleep", _sleep)
+    return sleeps
+
+
+class TestEndpointCosts:
+    def test_tasks_list_costs_ten(self):
+        assert RateLimiter().cost("/tasks/list") == 10
+
+    def test_unknown_endpoint_costs_default(self):
+        assert RateLimiter().cost("/events/list") == DEFAULT_COST
+
+    def test_costs_override(self):
+        limiter = RateLimiter(costs={"/events/list": 3})
+        assert limiter.cost("/events/list") == 3
+        assert limiter.cost("/tasks/list") == 10
+
+
+class TestRateLimiter:
+    async def test_acquire_spends_points(self, clock):
+        limiter = RateLimiter(limit=20, clock=clock)
+        await limiter.acquire("/tasks/list")
+        assert limiter.available == 10
+
+    async def test_acquire_waits_for_refill(self, clock, fake_sleep):
+        # 10 points per 100s -> 0.1 points/s
+        limiter = RateLimiter(limit=10, window_s=100.0, clock=clock)
+        for _ in range(10):
+            await limiter.acquire("/calendars/list")
+        assert fake_sleep == []
+
+        await limiter.acquire("/calendars/list")
+        assert fake_sleep == [pytest.approx(10.0)]
+
+    async def test_server_remaining_caps_local_estimate(self, clock):
+        limiter = RateLimiter(limit=300, clock=clock)
+        limiter.observe(RateLimitInfo(limit=300, remaining=5, reset_seconds=60))
+        assert limiter.available == 5
+        assert limiter.last_info is not None
+        assert limiter.last_info.remaining == 5
+
+    async def test_server_window_refills_on_reset(self, clock, fake_sleep):
+        limiter = RateLimiter(limit=300, clock=clock)
+        limiter.observe(RateLimitInfo(limit=300, remaining=0, reset_seconds=20))
+
+        await limiter.acquire("/calendars/list")
+
+        assert fake_sleep == [pytest.approx(20.0)]
+        assert limiter.available == 299
+
+    async def test_server_limit_replaces_default_capacity(self, clock):
+        limiter = RateLimiter(limit=300, clock=clock)
+        limiter.observe(RateLimitInfo(limit=100, remaining=100, reset_seconds=0))
+        clock.now += 1
+        assert limiter.available == 100
+
+    async def test_fails_fast_beyond_max_wait(self, clock, fake_sleep):
+        limiter = RateLimiter(limit=300, max_wait_s=30.0, clock=clock)
+        limiter.observe(RateLimitInfo(limit=300, remaining=0, reset_seconds=600))
+
+        with pytest.raises(MorgenAPIError) as exc_info:
+            await limiter.acquire("/calendars/list")
+
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.rate_limit_info is not None
+        assert fake_sleep == []
+
+    async def test_concurrent_burst_is_paced(self, clock, fake_sleep):
+        limiter = RateLimiter(limit=5, window_s=5.0, clock=clock)
+
+        await asyncio.gather(*(limiter.acquire("/events/delete") for _ in range(8)))
+
+        # First 5 go immediately, the remaining 3 wait one refill each
+        assert len(fake_sleep) == 3
+        assert sum(fake_sleep) == pytest.approx(3.0)
+
+
+class TestClientIntegration:
+    @respx.mock
+    async def test_response_headers_feed_limiter(self):
+        respx.get("https://api.morgen.so/v3/calendars/list").mock(
+            return_value=httpx.Response(
+                200,
+                json={"data": {"calendars": []}},
+                headers={
+                    "RateLimit-Limit": "300",
+                    "RateLimit-Remaining": "42",
+                    "RateLimit-Reset": "120",
+                },
+            )
+        )
+
+        async with MorgenClient(api_key="k") as client:
+            await client.list_calendars()
+
+        assert client.rate_limiter.last_info is not None
+        assert client.rate_limiter.last_info.remaining == 42
+        assert client.rate_limiter.available == 42
+
+    @respx.mock
+    async def test_error_response_headers_feed_limiter(self):
+        respx.get("https://api.morgen.so/v3/tags/list").mock(
+            return_value=httpx.Response(
+                403,
+                headers={
+                    "RateLimit-Limit": "300",
+                    "RateLimit-Remaining": "7",
+                    "RateLimit-Reset": "120",
+                },
+            )
+        )
+
+        async with MorgenClient(api_key="k") as client:
+            with pytest.raises(MorgenAPIError):
+                await client.list_tags()
+
+        assert client.rate_limiter.available == 7
+
+    @respx.mock
+    async def test_exhausted_budget_blocks_request(self):
+        route = respx.get("https://api.morgen.so/v3/tasks/list").mock(
+            return_value=httpx.Response(200, json={"data": {"tasks": []}})
+        )
+        limiter = RateLimiter(limit=300)
+        limiter.observe(RateLimitInfo(limit=300, remaining=3, reset_seconds=900))
+
+        async with MorgenClient(api_key="k", rate_limiter=limiter) as client:
+            with pytest.raises(MorgenAPIError) as exc_info:
+                await client.list_tasks()
+
+        assert exc_info.value.status_code == 429
+        assert not route.called
@@ -12,7 +12,6 @@ from morgenmcp.models import Account, Calendar, Event, Tag, Task
 from morgenmcp.resources import (
     _LOCAL_DT_FMT,
     _is_open,
-    _this_week_range,
     _today_range,
     _upcoming_range,
     res_account,
@@ -27,6 +26,7 @@ from morgenmcp.resources import (
     res_tags,
     res_tasks,
     res_tasks_today,
+    this_week_range,
 )
 from morgenmcp.tools.id_registry import clear_registry, register_id
 
@@ -133,7 +133,7 @@ class TestTimeRanges:
         assert start.date() == date.today()
 
     def test_this_week_range_is_seven_days_starting_monday(self):
-        start_s, end_s = _this_week_range()
+        start_s, end_s = this_week_range()
         start = datetime.strptime(start_s, _LOCAL_DT_FMT)
         end = datetime.strptime(end_s, _LOCAL_DT_FMT)
         assert start.weekday() == 0  # Monday
@@ -176,14 +176,14 @@ class TestAccountResources:
 
     @pytest.mark.asyncio
     async def test_res_account_found(self, mock_client, sample_account, account_id):
-        mock_client.list_accounts.return_value = [sample_account]
+        mock_client.get_account.return_value = sample_account
         virtual_id = register_id(account_id)
         body = json.loads(await res_account(virtual_id))
         assert body["account"]["email"] == "user@example.com"
 
     @pytest.mark.asyncio
     async def test_res_account_missing_raises(self, mock_client, sample_account):
-        mock_client.list_accounts.return_value = [sample_account]
+        mock_client.get_account.return_value = None
         # Register a different real ID so resolve_id succeeds but lookup misses
         virtual_id = register_id("0123456789abcdef01234567")
         with pytest.raises(ResourceError, match="not found"):
@@ -205,14 +205,15 @@ class TestCalendarResources:
 
     @pytest.mark.asyncio
     async def test_res_calendar_found(self, mock_client, sample_calendar, calendar_id):
-        mock_client.list_calendars.return_value = [sample_calendar]
+        mock_client.get_calendar.return_value = sample_calendar
         virtual_id = register_id(calendar_id)
         body = json.loads(await res_calendar(virtual_id))
         assert body["calendar"]["name"] == "Personal"
+        mock_client.get_calendar.assert_awaited_once_with(calendar_id)
 
     @pytest.mark.asyncio
     async def test_res_calendar_missing_raises(self, mock_client):
-        mock_client.list_calendars.return_value = []
+        mock_client.get_calendar.return_value = None
         virtual_id = register_id(_make_calendar_id("x" * 24, "missing@example.com"))
         with pytest.raises(ResourceError, match="not found"):
             await res_calendar(virtual_id)
@@ -250,6 +251,27 @@ class TestEventWindowResources:
         # exactly one fan-out (one account)
         assert mock_client.list_events.await_count == 1
 
+    @pytest.mark.asyncio
+    async def test_res_events_today_fields_returns_projected_objects(
+        self, mock_client, sample_calendar, sample_event
+    ):
+        mock_client.list_calendars.return_value = [sample_calendar]
+        mock_client.list_events.return_value = [sample_event]
+        body = json.loads(await res_events_today(fields="title, start"))
+        assert body["events"] == [
+            {
+                "id": register_id(sample_event.id),
+                "title": "Standup",
+                "start": "2026-05-03T09:00:00",
+            }
+        ]
+
+    @pytest.mark.asyncio
+    async def test_res_events_unknown_field_raises_before_fetching(self, mock_client):
+        with pytest.raises(ResourceError, match="Unknown field"):
+            await res_events_upcoming(fields="title,colour")
+        mock_client.list_calendars.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_res_events_this_week_window_is_seven_days(
         self, mock_client, sample_calendar
@@ -309,7 +331,7 @@ class TestEventWindowResources:
 class TestTaskResources:
     @pytest.mark.asyncio
     async def test_res_tasks_filters_completed(self, mock_client):
-        mock_client.list_tasks.return_value = [
+        mock_client.list_all_tasks.return_value = [
             Task(id="t1", title="open A", progress="needs-action"),
             Task(id="t2", title="done", progress="completed"),
             Task(id="t3", title="open B", progress=None),
@@ -320,13 +342,22 @@ class TestTaskResources:
         titles = {t["title"] for t in body["tasks"]}
         assert titles == {"open A", "open B"}
 
+    @pytest.mark.asyncio
+    async def test_res_tasks_fields_projection(self, mock_client):
+        mock_client.list_all_tasks.return_value = [
+            Task(id="t1", title="open A", progress="needs-action", tags=["g1"]),
+        ]
+        body = json.loads(await res_tasks(fields="title"))
+        assert body["tasks"] == [{"id": register_id("t1"), "title": "open A"}]
+        mock_client.tag_names.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_res_tasks_today_filters_by_due_date(self, mock_client):
         today_iso = datetime.now().replace(hour=12).strftime("%Y-%m-%dT%H:%M:%S")
         tomorrow_iso = (datetime.now() + timedelta(days=1)).strftime(
             "%Y-%m-%dT%H:%M:%S"
         )
-        mock_client.list_tasks.return_value = [
+        mock_client.list_all_tasks.return_value = [
             Task(id="t1", title="today", progress="needs-action", due=today_iso),
             Task(id="t2", title="tomorrow", progress="needs-action", due=tomorrow_iso),
             Task(id="t3", title="no due", progress="needs-action"),
@@ -344,7 +375,7 @@ class TestTaskResources:
 class TestTagResources:
     @pytest.mark.asyncio
     async def test_res_tags_returns_list(self, mock_client):
-        mock_client.list_tags.return_value = [
+        mock_client.list_all_tags.return_value = [
             Tag(id="tag-uuid-1", name="errands", color="#abc"),
             Tag(id="tag-uuid-2", name="reading"),
         ]
@@ -0,0 +1,219 @@
+"""Tests for write-aware response cache invalidation."""
+
+import base64
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastmcp import Client
+from fastmcp.server.middleware.caching import (
+    _get_auth_partition_key,
+    _make_read_resource_cache_key,
+)
+from mcp.types import ReadResourceRequestParams
+from pydantic import AnyUrl
+
+from morgenmcp.models import Tag, Task
+from morgenmcp.response_cache import (
+    WRITE_TOOL_KEYS,
+    DependencyCachingMiddleware,
+    _affected,
+    _event_keys,
+    resource_dependencies,
+)
+from morgenmcp.server import _CACHEABLE_READ_TOOLS, _response_cache, mcp
+from morgenmcp.tools.id_registry import clear_registry, register_id
+
+
+def _b64(parts: list[str]) -> str:
+    raw = json.dumps(parts, separators=(",", ":")).encode()
+    return base64.b64encode(raw).decode().rstrip("=")
+
+
+@pytest.fixture(autouse=True)
+def _use_tmp_data_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("MORGENMCP_DATA_DIR", str(tmp_path))
+    clear_registry()
+    yield
+    clear_registry()
+
+
+class TestDependencyKeys:
+    def test_resource_dependencies(self):
+        assert resource_dependencies("morgen://tags") == {"tags"}
+        assert resource_dependencies("morgen://tasks/today") == {"tasks", "tags"}
+        assert resource_dependencies("morgen://calendar/abc1234") == {
+            "calendar:abc1234"
+        }
+        assert resource_dependencies("morgen://calendar/abc1234/events") == {
+            "events:abc1234"
+        }
+        assert resource_dependencies("morgen://events/today") == {"events"}
+        assert resource_dependencies("morgen://tasks?fields=title") == {
+            "tasks",
+            "tags",
+        }
+        assert resource_dependencies("morgen://server") == frozenset()
+        assert resource_dependencies("morgen://unknown") is None
+
+    def test_event_write_targets_its_calendar(self):
+        account, email = "a" * 24, "cal@example.com"
+        calendar_vid = register_id(_b64([account, email]))
+        event_vid = register_id(_b64([email, "uid-1", account]))
+        assert _event_keys(event_vid) == {"events", f"events:{calendar_vid}"}
+
+    def test_unknown_event_touches_every_calendar(self):
+        touched = frozenset(_event_keys("nope123"))
+        assert _affected(frozenset({"events:abc1234"}), touched)
+
+    def test_other_calendar_is_unaffected(self):
+        touched = frozenset({"events", "events:abc1234"})
+        assert not _affected(frozenset({"events:xyz7890"}), touched)
+        assert _affected(frozenset({"events"}), touched)
+
+    async def test_every_write_tool_declares_its_keys(self):
+        async with Client(mcp) as client:
+            tools = await client.list_tools()
+        assert all(t.annotations is not None for t in tools)
+        writes = {
+            t.name for t in tools if t.annotations and not t.annotations.readOnlyHint
+        }
+        assert writes == set(WRITE_TOOL_KEYS)
+        assert not writes & set(_CACHEABLE_READ_TOOLS)
+
+
+class TestFastMCPInternals:
+    """ResponseCachingMiddleware internals that DependencyCachingMiddleware uses.
+
+    None of them is public API; these fail if a fastmcp release drops one.
+    """
+
+    def test_middleware_attributes(self):
+        middleware = DependencyCachingMiddleware()
+        assert middleware._call_tool_settings.get("enabled") is not False
+        assert middleware._read_resource_settings.get("enabled") is not False
+        assert middleware._matches_tool_cache_settings(tool_name="morgen_list_tags")
+        assert callable(middleware._call_tool_cache.delete)
+        assert callable(middleware._read_resource_cache.delete)
+
+    async def test_keys_address_the_parent_cache(self):
+        params = ReadResourceRequestParams(uri=AnyUrl("morgen://tags"))
+        key = _make_read_resource_cache_key(
+            msg=params, auth_key=_get_auth_partition_key()
+        )
+        await _response_cache.invalidate(None)
+        with patch("morgenmcp.resources.get_client") as mock:
+            mock.return_value.list_all_tags = AsyncMock(
+                return_value=[Tag(id="g-int-1", name="Work")]
+            )
+            async with Client(mcp) as client:
+                await client.read_resource("morgen://tags")
+
+        assert await _response_cache._read_resource_cache.get(key=key) is not None
+        await _response_cache.invalidate_resource("morgen://tags")
+        assert await _response_cache._read_resource_cache.get(key=key) is None
+
+
+class TestInvalidation:
+    """Runs against the server's shared cache; each test uses its own keys."""
+
+    async def test_task_write_refreshes_task_reads(self):
+        with patch("morgenmcp.tools.tasks.get_client") as mock:
+            client_mock = AsyncMock()
+            client_mock.list_tasks.return_value = [Task(id="t-inv-1", title="A")]
+            client_mock.tag_names.return_value = {}
+            mock.return_value = client_mock
+            task_vid = register_id("t-inv-1")
+
+            async with Client(mcp) as client:
+                args = {"updated_after": "2026-01-01T00:00:01Z"}
+                await client.call_tool("morgen_list_tasks", args)
+                await client.call_tool("morgen_list_tasks", args)
+                assert client_mock.list_tasks.await_count == 1
+
+                await client.call_tool(
+                    "morgen_update_task", {"task_id": task_vid, "title": "B"}
+                )
+                await client.call_tool("morgen_list_tasks", args)
+
+            assert client_mock.list_tasks.await_count == 2
+
+    async def test_event_write_only_refreshes_its_calendar(self):
+        account = "b" * 24
+        cal_a = register_id(_b64([account, "a@example.com"]))
+        cal_b = register_id(_b64([account, "b@example.com"]))
+        event_in_b = register_id(_b64(["b@example.com", "uid-2", account]))
+
+        with patch("morgenmcp.tools.events.get_client") as mock:
+            client_mock = AsyncMock()
+            client_mock.list_events.return_value = []
+            mock.return_value = client_mock
+            window = {"start": "2026-07-01T00:00:00", "end": "2026-07-02T00:00:00"}
+
+            async with Client(mcp) as client:
+                await client.call_tool(
+                    "morgen_list_events", window | {"calendar_ids": [cal_a]}
+                )
+                await client.call_tool("morgen_delete_event", {"event_id": event_in_b})
+                await client.call_tool(
+                    "morgen_list_events", window | {"calendar_ids": [cal_a]}
+                )
+                assert client_mock.list_events.await_count == 1
+
+                await client.call_tool(
+                    "morgen_list_events", window | {"calendar_ids": [cal_b]}
+                )
+                await client.call_tool("morgen_delete_event", {"event_id": event_in_b})
+                await client.call_tool(
+                    "morgen_list_events", window | {"calendar_ids": [cal_b]}
+                )
+
+            assert client_mock.list_events.await_count == 3
+
+    async def test_tag_write_refreshes_task_resource(self):
+        with (
+            patch("morgenmcp.resources.get_client") as res_mock,
+            patch("morgenmcp.tools.tags.get_client") as tag_mock,
+        ):
+            client_mock = AsyncMock()
+            client_mock.list_all_tasks.return_value = []
+            res_mock.return_value = client_mock
+            tag_mock.return_value = client_mock
+            tag_vid = register_id("tag-inv-1")
+
+            async with Client(mcp) as client:
+                await client.read_resource("morgen://tasks/today")
+                await client.read_resource("morgen://tasks/today")
+                assert client_mock.list_all_tasks.await_count == 1
+
+                await client.call_tool(
+                    "morgen_update_tag", {"tag_id": tag_vid, "name": "Renamed"}
+                )
+                await client.read_resource("morgen://tasks/today")
+
+            assert client_mock.list_all_tasks.await_count == 2
+
+    async def test_day_relative_resource_expires_at_local_midnight(
+        self, clock, monkeypatch
+    ):
+        monkeypatch.setattr(_response_cache, "_clock", clock)
+        monkeypatch.setattr(
+            _response_cache, "_local_now", lambda: datetime(2026, 7, 1, 23, 59, 30)
+        )
+        with patch("morgenmcp.resources.get_client") as res_mock:
+            client_mock = AsyncMock()
+            client_mock.list_all_tasks.return_value = []
+            res_mock.return_value = client_mock
+
+            await _response_cache.invalidate(None)
+            async with Client(mcp) as client:
+                await client.read_resource("morgen://tasks/today")
+                clock.now = 29
+                await client.read_resource("morgen://tasks/today")
+                assert client_mock.list_all_tasks.await_count == 1
+
+                clock.now = 30
+                await client.read_resource("morgen://tasks/today")
+
+            assert client_mock.list_all_tasks.await_count == 2
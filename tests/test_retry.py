@@ -0,0 +1,214 @@
+"""Tests for retrying transient Morgen API failures."""
+
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import httpx
+import pytest
+import respx
+
+from morgenmcp.client import MorgenClient
+from morgenmcp.models import (
+    EventCreateRequest,
+    MorgenAPIError,
+    TaskCloseRequest,
+    TaskUpdateRequest,
+)
+from morgenmcp.retry import RetryBudget, RetryPolicy, parse_retry_after
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record client backoff sleeps instead of actually sleeping."""
+    recorded: list[float] = []
+
+    async def _sleep(seconds: float) -> None:
+        recorded.append(seconds)
+
+    monkeypatch.setattr("morgenmcp.client.asyncio.sleep", _sleep)
+    return recorded
+
+
+def _client(**policy_kwargs) -> MorgenClient:
+    policy_kwargs.setdefault("rng", lambda: 0.5)
+    return MorgenClient(api_key="k", retry_policy=RetryPolicy(**policy_kwargs))
+
+
+class TestParseRetryAfter:
+    def test_delta_seconds(self):
+        response = httpx.Response(503, headers={"Retry-After": "7"})
+        assert parse_retry_after(response) == 7.0
+
+    def test_http_date(self):
+        when = datetime.now(UTC) + timedelta(seconds=20)
+        response = httpx.Response(
+            503, headers={"Retry-After": format_datetime(when, usegmt=True)}
+        )
+        delay = parse_retry_after(response)
+        assert delay is not None
+        assert 18.0 <= delay <= 20.0
+
+    def test_missing_or_garbage(self):
+        assert parse_retry_after(httpx.Response(503)) is None
+        bad = httpx.Response(503, headers={"Retry-After": "soon"})
+        assert parse_retry_after(bad) is None
+
+    def test_past_date_clamps_to_zero(self):
+        response = httpx.Response(
+            503, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+        )
+        assert parse_retry_after(response) == 0.0
+
+
+class TestRetryPolicy:
+    def test_backoff_is_jittered_exponential(self):
+        policy = RetryPolicy(base_delay_s=1.0, max_delay_s=5.0, rng=lambda: 0.5)
+        assert policy.backoff(0) == 0.5
+        assert policy.backoff(1) == 1.0
+        assert policy.backoff(2) == 2.0
+        assert policy.backoff(5) == 2.5  # capped at max_delay_s
+
+    def test_retry_after_is_a_floor(self):
+        policy = RetryPolicy(base_delay_s=1.0, rng=lambda: 0.0)
+        assert policy.next_delay(0, retry_after=3.0) == 3.0
+
+    def test_long_retry_after_gives_up(self):
+        policy = RetryPolicy(max_retry_after_s=30.0)
+        assert policy.next_delay(0, retry_after=300.0) is None
+
+    def test_attempts_exhausted(self):
+        policy = RetryPolicy(max_attempts=2)
+        assert policy.next_delay(0) is not None
+        assert policy.next_delay(1) is None
+
+    def test_budget_bounds_retries(self):
+        budget = RetryBudget(capacity=2.0, ratio=0.5)
+        policy = RetryPolicy(budget=budget)
+        assert policy.next_delay(0) is not None
+        assert policy.next_delay(0) is not None
+        assert policy.next_delay(0) is None
+
+        budget.deposit()
+        budget.deposit()
+        assert policy.next_delay(0) is not None
+
+
+class TestClientRetries:
+    @respx.mock
+    async def test_get_retries_on_503(self, sleeps):
+        route = respx.get("https://api.morgen.so/v3/calendars/list").mock(
+            side_effect=[
+                httpx.Response(503),
+                httpx.Response(200, json={"data": {"calendars": []}}),
+            ]
+        )
+
+        async with _client() as client:
+            calendars = await client.list_calendars()
+
+        assert calendars == []
+        assert route.call_count == 2
+        assert len(sleeps) == 1
+
+    @respx.mock
+    async def test_honors_retry_after_on_429(self, sleeps):
+        respx.get("https://api.morgen.so/v3/tags/list").mock(
+            side_effect=[
+                httpx.Response(429, headers={"Retry-After": "4"}),
+                httpx.Response(200, json=[]),
+            ]
+        )
+
+        async with _client(base_delay_s=0.1) as client:
+            await client.list_tags()
+
+        assert sleeps == [4.0]
+
+    @respx.mock
+    async def test_gives_up_after_max_attempts(self, sleeps):
+        route = respx.get("https://api.morgen.so/v3/calendars/list").mock(
+            return_value=httpx.Response(502, text="Bad Gateway")
+        )
+
+        async with _client(max_attempts=3) as client:
+            with pytest.raises(MorgenAPIError) as exc_info:
+                await client.list_calendars()
+
+        assert exc_info.value.status_code == 502
+        assert route.call_count == 3
+        assert len(sleeps) == 2
+
+    @respx.mock
+    async def test_retries_transport_errors(self, sleeps):
+        route = respx.get("https://api.morgen.so/v3/calendars/list").mock(
+            side_effect=[
+                httpx.ConnectTimeout("slow"),
+                httpx.Response(200, json={"data": {"calendars": []}}),
+            ]
+        )
+
+        async with _client() as client:
+            await client.list_calendars()
+
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_client_errors_are_not_retried(self, sleeps):
+        route = respx.get("https://api.morgen.so/v3/calendars/list").mock(
+            return_value=httpx.Response(400, json={"message": "bad"})
+        )
+
+        async with _client() as client:
+            with pytest.raises(MorgenAPIError):
+                await client.list_calendars()
+
+        assert route.call_count == 1
+        assert sleeps == []
+
+    @respx.mock
+    async def test_idempotent_writes_are_retried(self, sleeps):
+        update = respx.post("https://api.morgen.so/v3/tasks/update").mock(
+            side_effect=[httpx.Response(500), httpx.Response(204)]
+        )
+        close = respx.post("https://api.morgen.so/v3/tasks/close").mock(
+            side_effect=[httpx.Response(503), httpx.Response(204)]
+        )
+
+        async with _client() as client:
+            await client.update_task(TaskUpdateRequest(id="t1", title="X"))
+            await client.close_task(TaskCloseRequest(id="t1"))
+
+        assert update.call_count == 2
+        assert close.call_count == 2
+
+    @respx.mock
+    async def test_create_is_never_retried(self, sleeps):
+        route = respx.post("https://api.morgen.so/v3/events/create").mock(
+            return_value=httpx.Response(503)
+        )
+        request = EventCreateRequest(
+            account_id="acc",
+            calendar_id="cal",
+            title="Once",
+            start="2026-01-01T10:00:00",
+            duration="PT1H",
+        )
+
+        async with _client() as client:
+            with pytest.raises(MorgenAPIError):
+                await client.create_event(request)
+
+        assert route.call_count == 1
+        assert sleeps == []
+
+    @respx.mock
+    async def test_exhausted_budget_surfaces_error(self, sleeps):
+        route = respx.get("https://api.morgen.so/v3/calendars/list").mock(
+            return_value=httpx.Response(503)
+        )
+
+        async with _client(budget=RetryBudget(capacity=0.0)) as client:
+            with pytest.raises(MorgenAPIError):
+                await client.list_calendars()
+
+        assert route.call_count == 1
@@ -0,0 +1,44 @@
+"""Tests for compact JSON encoding with pre-encoded fragments."""
+
+import json
+
+import pytest
+
+from morgenmcp import serialization
+from morgenmcp.serialization import Fragment, dumps
+
+
+@pytest.fixture(params=["stdlib", "orjson"])
+def encoder(request, monkeypatch):
+    if request.param == "orjson":
+        monkeypatch.setattr(serialization, "orjson", pytest.importorskip("orjson"))
+    else:
+        monkeypatch.setattr(serialization, "orjson", None)
+    return request.param
+
+
+class TestDumps:
+    def test_output_is_compact_and_unescaped(self, encoder):
+        assert dumps({"a": [1, None, True], "b": "Café ☕"}) == (
+            '{"a":[1,null,true],"b":"Café ☕"}'
+        )
+
+    def test_fragments_are_embedded_verbatim(self, encoder):
+        item = Fragment.of({"id": "x", "title": "Standup"})
+        text = dumps({"events": [item, "09:00 Review", item], "count": 3})
+        assert json.loads(text) == {
+            "events": [
+                {"id": "x", "title": "Standup"},
+                "09:00 Review",
+                {"id": "x", "title": "Standup"},
+            ],
+            "count": 3,
+        }
+
+    def test_strings_that_look_like_placeholders_survive(self, encoder):
+        value = {"text": "\x00deadbeef:0\x00", "frag": Fragment('"ok"')}
+        assert json.loads(dumps(value)) == {"text": "\x00deadbeef:0\x00", "frag": "ok"}
+
+    def test_unsupported_types_raise(self, encoder):
+        with pytest.raises(TypeError):
+            dumps({"when": object()})
@@ -0,0 +1,156 @@
+"""Tests for single-flight coalescing of identical in-flight calls."""
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from morgenmcp.client import MorgenClient
+from morgenmcp.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    async def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight()
+        calls = 0
+        release = asyncio.Event()
+
+        async def fetch() -> int:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return 42
+
+        waiters = [asyncio.create_task(flight.do("k", fetch)) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert flight.in_flight == 1
+        release.set()
+
+        assert await asyncio.gather(*waiters) == [42] * 5
+        assert calls == 1
+        assert flight.in_flight == 0
+
+    async def test_sequential_calls_are_not_cached(self):
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await flight.do("k", fetch) == 1
+        assert await flight.do("k", fetch) == 2
+
+    async def test_different_keys_run_separately(self):
+        flight = SingleFlight()
+
+        async def fetch_a() -> str:
+            return "a"
+
+        async def fetch_b() -> str:
+            return "b"
+
+        results = await asyncio.gather(flight.do("a", fetch_a), flight.do("b", fetch_b))
+        assert results == ["a", "b"]
+
+    async def test_errors_propagate_to_every_waiter(self):
+        flight = SingleFlight()
+
+        async def fetch() -> None:
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            flight.do("k", fetch), flight.do("k", fetch), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert flight.in_flight == 0
+
+    async def test_cancelled_waiter_does_not_cancel_shared_call(self):
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch() -> str:
+            await release.wait()
+            return "done"
+
+        first = asyncio.create_task(flight.do("k", fetch))
+        second = asyncio.create_task(flight.do("k", fetch))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        release.set()
+
+        assert await second == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+
+class TestClientCoalescing:
+    @respx.mock
+    async def test_concurrent_list_calendars_hit_upstream_once(self):
+        route = respx.get("https://api.morgen.so/v3/calendars/list").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "data": {
+                        "calendars": [
+                            {
+                                "id": "cal1",
+                                "accountId": "acc1",
+                                "integrationId": "google",
+                            }
+                        ]
+                    }
+                },
+            )
+        )
+
+        async with MorgenClient(api_key="k") as client:
+            results = await asyncio.gather(
+                client.list_calendars(),
+                client.list_calendars(),
+                client.list_calendars(),
+            )
+
+        assert route.call_count == 1
+        assert [len(r) for r in results] == [1, 1, 1]
+        # Each caller gets its own list, sharing the parsed models
+        assert results[0] is not results[1]
+        assert results[0][0] is results[1][0]
+
+    @respx.mock
+    async def test_different_params_are_not_coalesced(self):
+        route = respx.get("https://api.morgen.so/v3/events/list").mock(
+            return_value=httpx.Response(200, json={"data": {"events": []}})
+        )
+
+        async with MorgenClient(api_key="k") as client:
+            await asyncio.gather(
+                client.list_events(
+                    "acc", ["cal"], "2026-01-01T00:00:00", "2026-01-02T00:00:00"
+                ),
+                client.list_events(
+                    "acc", ["cal"], "2026-01-02T00:00:00", "2026-01-03T00:00:00"
+                ),
+            )
+
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_writes_are_not_coalesced(self):
+        from morgenmcp.models import TagDeleteRequest
+
+        route = respx.post("https://api.morgen.so/v3/tags/delete").mock(
+            return_value=httpx.Response(204)
+        )
+
+        async with MorgenClient(api_key="k") as client:
+            await asyncio.gather(
+                client.delete_tag(TagDeleteRequest(id="t1")),
+                client.delete_tag(TagDeleteRequest(id="t1")),
+            )
+
+        assert route.call_count == 2
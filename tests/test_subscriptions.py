@@ -0,0 +1,175 @@
+"""Tests for resource subscriptions and change polling."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import mcp.types
+import pytest
+from fastmcp import Client
+from fastmcp.client.messages import MessageHandler
+from fastmcp.exceptions import ResourceError
+from pydantic import AnyUrl
+
+from morgenmcp.models import Tag
+from morgenmcp.server import _subscriptions
+from morgenmcp.server import mcp as server
+from morgenmcp.subscriptions import SubscriptionHub
+from morgenmcp.tools.id_registry import clear_registry
+
+
+class FakeSession:
+    def __init__(self, fail: bool = False) -> None:
+        self.updated: list[str] = []
+        self.fail = fail
+
+    async def send_resource_updated(self, uri: AnyUrl) -> None:
+        if self.fail:
+            raise ConnectionError("gone")
+        self.updated.append(str(uri))
+
+
+class FakeReader:
+    def __init__(self, content: str = "v1") -> None:
+        self.content: str | Exception = content
+        self.calls = 0
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        if isinstance(self.content, Exception):
+            raise self.content
+        return self.content
+
+
+@pytest.fixture
+def reader():
+    return FakeReader()
+
+
+@pytest.fixture
+def hub(reader):
+    return SubscriptionHub(readers={"morgen://tags": reader})
+
+
+class TestSubscriptionHub:
+    async def test_unsupported_uri_is_rejected(self, hub):
+        with pytest.raises(ResourceError, match="does not support subscriptions"):
+            await hub.subscribe("morgen://calendars", FakeSession())
+
+    async def test_unchanged_content_sends_nothing(self, hub, reader):
+        session = FakeSession()
+        await hub.subscribe("morgen://tags", session)
+        assert await hub.poll() == []
+        assert session.updated == []
+        assert reader.calls == 2
+
+    async def test_change_notifies_every_subscriber(self, reader):
+        on_change = AsyncMock()
+        hub = SubscriptionHub(readers={"morgen://tags": reader}, on_change=on_change)
+        first, second = FakeSession(), FakeSession()
+        await hub.subscribe("morgen://tags", first)
+        await hub.subscribe("morgen://tags", second)
+        assert reader.calls == 1
+
+        reader.content = "v2"
+        assert await hub.poll() == ["morgen://tags"]
+        assert first.updated == second.updated == ["morgen://tags"]
+        on_change.assert_awaited_once_with("morgen://tags")
+        assert await hub.poll() == []
+
+    async def test_read_errors_keep_the_last_hash(self, hub, reader):
+        session = FakeSession()
+        await hub.subscribe("morgen://tags", session)
+        reader.content = RuntimeError("upstream down")
+        assert await hub.poll() == []
+        reader.content = "v1"
+        assert await hub.poll() == []
+        assert session.updated == []
+
+    async def test_nothing_is_polled_without_subscribers(self, hub, reader):
+        session = FakeSession()
+        await hub.subscribe("morgen://tags", session)
+        await hub.unsubscribe("morgen://tags", session)
+        await hub.poll()
+        assert reader.calls == 1
+        assert hub.subscribed() == []
+
+    async def test_failed_sends_drop_the_subscriber(self, hub, reader):
+        dead, alive = FakeSession(fail=True), FakeSession()
+        await hub.subscribe("morgen://tags", dead)
+        await hub.subscribe("morgen://tags", alive)
+        reader.content = "v2"
+        await hub.poll()
+        reader.content = "v3"
+        await hub.poll()
+        assert alive.updated == ["morgen://tags", "morgen://tags"]
+        assert dead not in hub._subscribers["morgen://tags"]
+
+    async def test_low_budget_backs_off(self, reader):
+        budget = [50.0, 50.0, 50.0, 300.0, 300.0]
+        delays: list[float] = []
+
+        async def sleep(delay: float) -> None:
+            if not budget:
+                raise asyncio.CancelledError
+            delays.append(delay)
+
+        hub = SubscriptionHub(
+            readers={"morgen://tags": reader},
+            interval_s=10,
+            available=lambda: budget.pop(0),
+        )
+        session = FakeSession()
+        await hub.subscribe("morgen://tags", session)
+        with (
+            patch("morgenmcp.subscriptions.asyncio.sleep", sleep),
+            pytest.raises(asyncio.CancelledError),
+        ):
+            await hub.run()
+        assert delays == [10, 20, 40, 40, 10]
+        assert reader.calls == 3
+
+
+class _Recorder(MessageHandler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.updated: list[str] = []
+
+    async def on_resource_updated(
+        self, message: mcp.types.ResourceUpdatedNotification
+    ) -> None:
+        self.updated.append(str(message.params.uri))
+
+
+class TestServerSubscriptions:
+    @pytest.fixture(autouse=True)
+    def _isolate(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("MORGENMCP_DATA_DIR", str(tmp_path))
+        clear_registry()
+        yield
+        clear_registry()
+
+    async def test_subscribe_capability_is_advertised(self):
+        async with Client(server) as client:
+            assert client.initialize_result is not None
+            resources = client.initialize_result.capabilities.resources
+        assert resources is not None
+        assert resources.subscribe is True
+        assert resources.listChanged is not None
+
+    async def test_subscribe_and_notify_over_mcp(self):
+        client_mock = MagicMock()
+        client_mock.list_all_tags = AsyncMock(return_value=[Tag(id="g1", name="Work")])
+        recorder = _Recorder()
+        with patch("morgenmcp.resources.get_client", return_value=client_mock):
+            async with Client(server, message_handler=recorder) as client:
+                await client.session.subscribe_resource(AnyUrl("morgen://tags"))
+                client_mock.list_all_tags.return_value = [
+                    Tag(id="g1", name="Work"),
+                    Tag(id="g2", name="Errands"),
+                ]
+                assert await _subscriptions.poll() == ["morgen://tags"]
+                await client.read_resource("morgen://server")  # let it arrive
+                assert recorder.updated == ["morgen://tags"]
+
+                await client.session.unsubscribe_resource(AnyUrl("morgen://tags"))
+            assert _subscriptions.subscribed() == []
@@ -0,0 +1,140 @@
+"""Tests for the incrementally synced tag index."""
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from morgenmcp.client import MorgenClient
+from morgenmcp.models import MorgenAPIError, Tag, TagCreateRequest, TagDeleteRequest
+from morgenmcp.tag_index import TagIndex
+
+
+@pytest.fixture
+def upstream_items():
+    return [
+        Tag(id="g1", name="Work", updated="2026-04-01T10:00:00Z"),
+        Tag(id="g2", name="Home", updated="2026-04-02T10:00:00Z"),
+    ]
+
+
+class TestTagIndex:
+    async def test_first_read_is_a_full_sync(self, clock, upstream):
+        index = TagIndex(clock=clock)
+        tags = await index.tags(upstream)
+        assert [t.id for t in tags] == ["g1", "g2"]
+        assert upstream.calls == [None]
+
+    async def test_lookups_by_id_and_name(self, clock, upstream):
+        index = TagIndex(clock=clock)
+        await index.sync(upstream)
+        work = index.get("g1")
+        assert work is not None
+        assert work.name == "Work"
+        found = index.find("  work ")
+        assert found is not None
+        assert found.id == "g1"
+        assert index.find("Garden") is None
+        assert dict(index.names()) == {"g1": "Work", "g2": "Home"}
+
+    async def test_reads_within_ttl_skip_upstream(self, clock, upstream):
+        index = TagIndex(ttl_s=60, clock=clock)
+        await index.tags(upstream)
+        clock.now = 59
+        await index.tags(upstream)
+        assert upstream.calls == [None]
+
+    async def test_stale_read_applies_delta_and_tombstones(self, clock, upstream):
+        index = TagIndex(ttl_s=60, clock=clock)
+        await index.tags(upstream)
+        upstream.put(
+            Tag(id="g1", updated="2026-04-03T10:00:00Z", name="Work", deleted=True)
+        )
+        upstream.put(Tag(id="g2", updated="2026-04-03T10:00:01Z", name="House"))
+        upstream.put(Tag(id="g3", updated="2026-04-03T10:00:02Z", name="Errands"))
+        clock.now = 60
+        tags = await index.tags(upstream)
+        assert upstream.calls == [None, "2026-04-02T09:59:59Z"]
+        assert {t.name for t in tags} == {"Errands", "House"}
+        assert index.find("home") is None
+        assert index.find("work") is None
+
+    async def test_reset_forces_full_sync(self, clock, upstream):
+        index = TagIndex(clock=clock)
+        await index.tags(upstream)
+        index.reset()
+        await index.tags(upstream)
+        assert upstream.calls == [None, None]
+
+    async def test_invalidate_during_a_sync_is_not_lost(self, clock, upstream):
+        index = TagIndex(ttl_s=60, clock=clock)
+        release = asyncio.Event()
+
+        async def slow(updated_after: str | None) -> list[Tag]:
+            tags = await upstream(updated_after)
+            await release.wait()
+            return tags
+
+        sync = asyncio.create_task(index.sync(slow))
+        await asyncio.sleep(0)
+        upstream.put(Tag(id="g1", updated="2026-04-03T08:00:00Z", name="Office"))
+        index.invalidate()
+        release.set()
+        await sync
+
+        await index.sync(upstream)
+        assert len(upstream.calls) == 2
+        office = index.get("g1")
+        assert office is not None
+        assert office.name == "Office"
+
+
+class TestClientTagIndex:
+    @pytest.fixture
+    def client(self):
+        return MorgenClient(api_key="test-key")
+
+    @respx.mock
+    async def test_writes_update_the_index(self, client):
+        route = respx.get("https://api.morgen.so/v3/tags/list").mock(
+            return_value=httpx.Response(
+                200,
+                json=[{"id": "g1", "name": "Work", "updated": "2026-04-01T10:00:00Z"}],
+            )
+        )
+        respx.post("https://api.morgen.so/v3/tags/create").mock(
+            return_value=httpx.Response(200, json={"id": "g2", "name": "Errands"})
+        )
+        respx.post("https://api.morgen.so/v3/tags/delete").mock(
+            return_value=httpx.Response(200, json={})
+        )
+
+        assert (await client.tag_names()) == {"g1": "Work"}
+        await client.create_tag(TagCreateRequest(name="Errands"))
+        assert (await client.find_tag("errands")).id == "g2"
+
+        await client.delete_tag(TagDeleteRequest(id="g1"))
+        assert client.tag_index.get("g1") is None
+        # The delete marked the index stale; the next read pulls a delta.
+        await client.list_all_tags()
+        assert route.calls[-1].request.url.params["updatedAfter"]
+
+    @respx.mock
+    async def test_failed_delete_keeps_the_tag(self, client):
+        route = respx.get("https://api.morgen.so/v3/tags/list").mock(
+            return_value=httpx.Response(
+                200,
+                json=[{"id": "g1", "name": "Work", "updated": "2026-04-01T10:00:00Z"}],
+            )
+        )
+        respx.post("https://api.morgen.so/v3/tags/delete").mock(
+            return_value=httpx.Response(404, json={"message": "Not found"})
+        )
+
+        await client.tag_names()
+        with pytest.raises(MorgenAPIError):
+            await client.delete_tag(TagDeleteRequest(id="g1"))
+        assert client.tag_index.get("g1") is not None
+        await client.list_all_tags()
+        assert route.call_count == 2
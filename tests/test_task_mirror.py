@@ -0,0 +1,208 @@
+"""Tests for the incrementally synced task mirror."""
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from morgenmcp.client import MorgenClient
+from morgenmcp.models import MorgenAPIError, Task, TaskDeleteRequest, TaskUpdateRequest
+from morgenmcp.task_mirror import TaskMirror
+
+
+@pytest.fixture
+def upstream_items():
+    return [
+        Task(id="a", title="A", updated="2026-04-01T10:00:00Z"),
+        Task(id="b", title="B", updated="2026-04-02T10:00:00Z"),
+    ]
+
+
+class TestTaskMirror:
+    async def test_first_read_is_a_full_sync(self, clock, upstream):
+        mirror = TaskMirror(clock=clock)
+        tasks = await mirror.tasks(upstream)
+        assert [t.id for t in tasks] == ["a", "b"]
+        assert upstream.calls == [None]
+
+    async def test_reads_within_ttl_make_no_call(self, clock, upstream):
+        mirror = TaskMirror(ttl_s=60, clock=clock)
+        await mirror.tasks(upstream)
+        clock.now = 59
+        await mirror.tasks(upstream)
+        assert len(upstream.calls) == 1
+
+    async def test_stale_read_pulls_only_the_delta(self, clock, upstream):
+        mirror = TaskMirror(ttl_s=60, clock=clock)
+        await mirror.tasks(upstream)
+        upstream.put(Task(id="b", updated="2026-04-03T08:00:00Z", title="B renamed"))
+        upstream.put(Task(id="c", updated="2026-04-03T09:00:00Z", title="C"))
+
+        clock.now = 61
+        tasks = await mirror.tasks(upstream)
+
+        assert upstream.calls == [None, "2026-04-02T09:59:59Z"]
+        assert [(t.id, t.title) for t in tasks] == [
+            ("a", "A"),
+            ("b", "B renamed"),
+            ("c", "C"),
+        ]
+
+        clock.now = 122
+        await mirror.tasks(upstream)
+        assert upstream.calls[-1] == "2026-04-03T08:59:59Z"
+
+    @pytest.mark.parametrize("upstream_items", [[]])
+    async def test_empty_upstream_is_cached_for_the_ttl(self, clock, upstream):
+        mirror = TaskMirror(ttl_s=60, clock=clock)
+        for now in (0, 30, 59):
+            clock.now = now
+            assert await mirror.tasks(upstream) == []
+        assert upstream.calls == [None]
+
+        clock.now = 60
+        upstream.put(Task(id="a", updated="2026-04-01T10:00:00Z", title="A"))
+        assert [t.id for t in await mirror.tasks(upstream)] == ["a"]
+        assert upstream.calls == [None, None]
+
+    async def test_full_sync_drops_tasks_deleted_elsewhere(self, clock, upstream):
+        mirror = TaskMirror(ttl_s=60, full_sync_s=900, clock=clock)
+        await mirror.tasks(upstream)
+        del upstream.items["a"]
+
+        clock.now = 61
+        assert {t.id for t in await mirror.tasks(upstream)} == {"a", "b"}
+        clock.now = 900
+        assert {t.id for t in await mirror.tasks(upstream)} == {"b"}
+        assert upstream.calls[-1] is None
+
+    async def test_discard_and_invalidate(self, clock, upstream):
+        mirror = TaskMirror(ttl_s=60, clock=clock)
+        await mirror.tasks(upstream)
+
+        mirror.discard("a")
+        del upstream.items["a"]
+        tasks = await mirror.tasks(upstream)
+
+        assert [t.id for t in tasks] == ["b"]
+        assert len(upstream.calls) == 2
+
+    async def test_invalidate_during_a_sync_is_not_lost(self, clock, upstream):
+        mirror = TaskMirror(ttl_s=60, clock=clock)
+        await mirror.tasks(upstream)
+        clock.now = 61
+        release = asyncio.Event()
+
+        async def slow(updated_after: str | None) -> list[Task]:
+            tasks = await upstream(updated_after)
+            await release.wait()
+            return tasks
+
+        sync = asyncio.create_task(mirror.tasks(slow))
+        await asyncio.sleep(0)
+        # A write lands after the delta was fetched, before it is applied.
+        upstream.put(Task(id="a", updated="2026-04-03T08:00:00Z", title="A renamed"))
+        mirror.invalidate()
+        release.set()
+        await sync
+
+        tasks = await mirror.tasks(upstream)
+        assert len(upstream.calls) == 3
+        assert ("a", "A renamed") in [(t.id, t.title) for t in tasks]
+
+    async def test_discard_during_a_sync_is_not_undone(self, clock, upstream):
+        mirror = TaskMirror(clock=clock)
+        release = asyncio.Event()
+
+        async def slow(updated_after: str | None) -> list[Task]:
+            tasks = await upstream(updated_after)
+            await release.wait()
+            return tasks
+
+        sync = asyncio.create_task(mirror.tasks(slow))
+        await asyncio.sleep(0)
+        mirror.discard("a")
+        release.set()
+        assert [t.id for t in await sync] == ["b"]
+
+
+class TestClientTaskMirror:
+    @respx.mock
+    async def test_writes_mark_the_mirror_stale(self):
+        route = respx.get("https://api.morgen.so/v3/tasks/list").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "data": {
+                        "tasks": [
+                            {
+                                "id": "t1",
+                                "title": "A",
+                                "updated": "2026-04-01T10:00:00Z",
+                            },
+                            {
+                                "id": "t2",
+                                "title": "B",
+                                "updated": "2026-04-01T11:00:00Z",
+                            },
+                        ]
+                    }
+                },
+            )
+        )
+        respx.post("https://api.morgen.so/v3/tasks/update").mock(
+            return_value=httpx.Response(204)
+        )
+        respx.post("https://api.morgen.so/v3/tasks/delete").mock(
+            return_value=httpx.Response(204)
+        )
+
+        async with MorgenClient(api_key="k") as client:
+            await client.list_all_tasks()
+            await client.list_all_tasks()
+            assert route.call_count == 1
+
+            await client.update_task(TaskUpdateRequest(id="t1", title="A2"))
+            await client.list_all_tasks()
+            assert route.call_count == 2
+            assert route.calls.last.request.url.params["updatedAfter"] == (
+                "2026-04-01T10:59:59Z"
+            )
+
+            await client.delete_task(TaskDeleteRequest(id="t1"))
+            route.return_value = httpx.Response(200, json={"data": {"tasks": []}})
+            tasks = await client.list_all_tasks()
+
+        assert [t.id for t in tasks] == ["t2"]
+
+    @respx.mock
+    async def test_failed_delete_forces_a_full_sync(self):
+        route = respx.get("https://api.morgen.so/v3/tasks/list").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "data": {
+                        "tasks": [
+                            {
+                                "id": "t1",
+                                "title": "A",
+                                "updated": "2026-04-01T10:00:00Z",
+                            }
+                        ]
+                    }
+                },
+            )
+        )
+        respx.post("https://api.morgen.so/v3/tasks/delete").mock(
+            return_value=httpx.Response(404, json={"message": "Not found"})
+        )
+
+        async with MorgenClient(api_key="k") as client:
+            await client.list_all_tasks()
+            with pytest.raises(MorgenAPIError):
+                await client.delete_task(TaskDeleteRequest(id="t1"))
+            tasks = await client.list_all_tasks()
+
+        assert [t.id for t in tasks] == ["t1"]
+        assert "updatedAfter" not in route.calls.last.request.url.params
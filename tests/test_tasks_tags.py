@@ -24,6 +24,7 @@ from morgenmcp.tools.tasks import (
     get_task,
     list_tasks,
     move_task,
+    query_tasks,
     reopen_task,
     update_task,
 )
@@ -40,6 +41,7 @@ def _reset_registry():
 def mock_task_client():
     with patch("morgenmcp.tools.tasks.get_client") as mock:
         client = AsyncMock()
+        client.tag_names.return_value = {}
         mock.return_value = client
         yield client
 
@@ -90,6 +92,40 @@ class TestListTasks:
         # tags virtualized
         assert all(len(t) == 7 for t in result["tasks"][0]["tags"])
 
+    async def test_list_tasks_adds_tag_names(self, mock_task_client, sample_task):
+        mock_task_client.list_tasks.return_value = [sample_task]
+        mock_task_client.tag_names.return_value = {"tag_real_id_001": "Work"}
+        result = await list_tasks()
+        task = result["tasks"][0]
+        assert task["tagNames"] == {register_id("tag_real_id_001"): "Work"}
+        assert len(task["tags"]) == 2
+
+    async def test_list_tasks_survives_tag_sync_failure(
+        self, mock_task_client, sample_task
+    ):
+        mock_task_client.list_tasks.return_value = [sample_task]
+        mock_task_client.tag_names.side_effect = MorgenAPIError("nope", status_code=500)
+        result = await list_tasks()
+        assert result["count"] == 1
+        assert "tagNames" not in result["tasks"][0]
+
+    async def test_list_tasks_without_tags_skips_tag_sync(self, mock_task_client):
+        mock_task_client.list_tasks.return_value = [Task(id="t1", title="Plain")]
+        await list_tasks()
+        mock_task_client.tag_names.assert_not_awaited()
+
+    async def test_list_tasks_fields_projection(self, mock_task_client, sample_task):
+        mock_task_client.list_tasks.return_value = [sample_task]
+        result = await list_tasks(fields=["title", "due"])
+        assert set(result["tasks"][0]) == {"id", "title", "due"}
+        # tagNames not requested: no tag index lookup.
+        mock_task_client.tag_names.assert_not_awaited()
+
+    async def test_list_tasks_fields_rejects_unknown_names(self, mock_task_client):
+        with pytest.raises(ToolError, match="Unknown field.*deadline"):
+            await list_tasks(fields=["deadline"])
+        mock_task_client.list_tasks.assert_not_awaited()
+
     async def test_list_tasks_passes_filter_args(self, mock_task_client):
         mock_task_client.list_tasks.return_value = []
         await list_tasks(limit=50, updated_after="2026-04-01T00:00:00Z")
@@ -97,6 +133,16 @@ class TestListTasks:
             limit=50, updated_after="2026-04-01T00:00:00Z"
         )
 
+    async def test_list_tasks_all_pages(self, mock_task_client, sample_task):
+        async def pages(updated_after):
+            yield [sample_task]
+            yield [sample_task.model_copy(update={"id": "task_real_id_002"})]
+
+        mock_task_client.iter_tasks = pages
+        result = await list_tasks(all_pages=True)
+        assert result["count"] == 2
+        mock_task_client.list_tasks.assert_not_awaited()
+
     async def test_list_tasks_rejects_bad_limit(self, mock_task_client):
         with pytest.raises(ToolError, match="limit must be"):
             await list_tasks(limit=0)
@@ -111,6 +157,60 @@ class TestListTasks:
             await list_tasks()
 
 
+class TestQueryTasks:
+    @pytest.fixture
+    def tasks(self, sample_task):
+        return [
+            sample_task,
+            Task(id="t2", title="Book flights", progress="needs-action"),
+            Task(
+                id="t3",
+                title="Review budget",
+                due="2026-05-03T09:00:00",
+                progress="completed",
+            ),
+            Task(
+                id="t4",
+                title="Pay invoice",
+                due="2026-04-20T09:00:00",
+                progress="in-process",
+                tags=["tag_real_id_001"],
+            ),
+        ]
+
+    async def test_defaults_to_open_tasks(self, mock_task_client, tasks):
+        mock_task_client.list_all_tasks.return_value = tasks
+        result = await query_tasks()
+        titles = [t["title"] for t in result["tasks"]]
+        assert titles == ["Review report", "Book flights", "Pay invoice"]
+        mock_task_client.list_tasks.assert_not_awaited()
+
+    async def test_filters_combine(self, mock_task_client, tasks):
+        mock_task_client.list_all_tasks.return_value = tasks
+        tag = register_id("tag_real_id_001")
+
+        result = await query_tasks(
+            status="all", due_after="2026-04-25T00:00:00", search="REVIEW"
+        )
+        assert [t["title"] for t in result["tasks"]] == [
+            "Review report",
+            "Review budget",
+        ]
+
+        result = await query_tasks(tag_ids=[tag], due_before="2026-05-01T00:00:00")
+        assert [t["title"] for t in result["tasks"]] == ["Pay invoice"]
+
+    async def test_limit_reports_total_matches(self, mock_task_client, tasks):
+        mock_task_client.list_all_tasks.return_value = tasks
+        result = await query_tasks(status="all", limit=2)
+        assert result["count"] == 2
+        assert result["matched"] == 4
+
+    async def test_rejects_bad_due_bound(self, mock_task_client):
+        with pytest.raises(ToolError, match="due_after"):
+            await query_tasks(due_after="2026-04-25T00:00:00Z")
+
+
 class TestGetTask:
     async def test_get_task_resolves_virtual(self, mock_task_client, sample_task):
         virtual = register_id(sample_task.id)
@@ -284,11 +384,19 @@ class TestDeleteTask:
 
 class TestListTags:
     async def test_list_tags(self, mock_tag_client, sample_tag):
-        mock_tag_client.list_tags.return_value = [sample_tag]
+        mock_tag_client.list_all_tags.return_value = [sample_tag]
         result = await list_tags()
         assert result["count"] == 1
         assert result["tags"][0]["name"] == "Work"
         assert len(result["tags"][0]["id"]) == 7
+        mock_tag_client.list_tags.assert_not_awaited()
+
+    async def test_list_tags_by_name(self, mock_tag_client, sample_tag):
+        mock_tag_client.find_tag.return_value = sample_tag
+        result = await list_tags(name="work")
+        assert [t["name"] for t in result["tags"]] == ["Work"]
+        mock_tag_client.find_tag.return_value = None
+        assert (await list_tags(name="missing"))["count"] == 0
 
     async def test_list_tags_with_limit(self, mock_tag_client):
         mock_tag_client.list_tags.return_value = []
@@ -297,6 +405,18 @@ class TestListTags:
             limit=10, updated_after="2026-04-01T00:00:00Z"
         )
 
+    async def test_list_tags_all_pages(self, mock_tag_client, sample_tag):
+        calls = []
+
+        async def pages(updated_after):
+            calls.append(updated_after)
+            yield [sample_tag]
+
+        mock_tag_client.iter_tags = pages
+        result = await list_tags(all_pages=True, updated_after="2026-04-01T00:00:00Z")
+        assert result["count"] == 1
+        assert calls == ["2026-04-01T00:00:00Z"]
+
     async def test_list_tags_rejects_bad_limit(self, mock_tag_client):
         with pytest.raises(ToolError, match="limit"):
             await list_tags(limit=0)
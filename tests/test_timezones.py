@@ -0,0 +1,72 @@
+"""Tests for the memoized time zone lookups."""
+
+from datetime import datetime
+from unittest.mock import patch
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import pytest
+
+from morgenmcp.timezones import TimeZones
+
+
+@pytest.fixture
+def zones(clock):
+    return TimeZones(local_ttl_s=60, clock=clock)
+
+
+class TestZone:
+    def test_known_key(self, zones):
+        assert zones.zone("Europe/Berlin") is ZoneInfo("Europe/Berlin")
+
+    @pytest.mark.parametrize("key", ["Mars/Phobos", "../etc/passwd", ""])
+    def test_unknown_key_is_looked_up_once(self, zones, key):
+        with patch("morgenmcp.timezones.ZoneInfo", side_effect=ValueError) as lookup:
+            for _ in range(3):
+                with pytest.raises(ZoneInfoNotFoundError):
+                    zones.zone(key)
+        assert lookup.call_count == 1
+
+
+class TestDisplay:
+    def test_precedence(self, zones, monkeypatch):
+        monkeypatch.setenv("MORGENMCP_DISPLAY_TZ", "Asia/Tokyo")
+        assert zones.display("Europe/London") == ZoneInfo("Europe/London")
+        assert zones.display(None) == ZoneInfo("Asia/Tokyo")
+
+    def test_env_change_applies_on_next_call(self, zones, monkeypatch):
+        monkeypatch.setenv("MORGENMCP_DISPLAY_TZ", "Asia/Tokyo")
+        zones.display()
+        monkeypatch.setenv("MORGENMCP_DISPLAY_TZ", "UTC")
+        assert zones.display() == ZoneInfo("UTC")
+
+    def test_bad_env_falls_back_to_system(self, zones, monkeypatch):
+        monkeypatch.setenv("MORGENMCP_DISPLAY_TZ", "Mars/Phobos")
+        assert zones.display() == datetime.now().astimezone().tzinfo
+
+    def test_system_zone_is_probed_once_per_ttl(self, zones, clock, monkeypatch):
+        monkeypatch.delenv("MORGENMCP_DISPLAY_TZ", raising=False)
+        with patch("morgenmcp.timezones.datetime", wraps=datetime) as dt:
+            zones.display()
+            clock.now = 59
+            zones.display()
+            assert dt.now.call_count == 1
+            clock.now = 60
+            zones.display()
+            assert dt.now.call_count == 2
+
+
+class TestLabel:
+    @pytest.mark.parametrize(
+        ("when", "expected"),
+        [
+            (datetime(2026, 1, 15, 9), "CST (America/Chicago)"),
+            (datetime(2026, 7, 15, 9), "CDT (America/Chicago)"),
+        ],
+    )
+    def test_abbreviation_follows_dst(self, zones, when, expected):
+        tz = ZoneInfo("America/Chicago")
+        assert zones.label(when.replace(tzinfo=tz), tz) == expected
+
+    def test_label_without_abbreviation(self, zones):
+        tz = ZoneInfo("UTC")
+        assert zones.label(datetime(2026, 1, 1, tzinfo=tz), tz) == "UTC"
@@ -635,6 +635,42 @@ class TestListEvents:
         # Verify list_calendars was called
         mock_morgen_client.list_calendars.assert_called_once()
 
+    async def test_list_events_fields_projection(
+        self, mock_morgen_client, sample_event, sample_calendar_id
+    ):
+        """Only the requested fields (plus id) are computed and returned."""
+        mock_morgen_client.list_events.return_value = [sample_event]
+        virtual_cal = register_id(sample_calendar_id)
+
+        with patch(
+            "morgenmcp.tools.events.register_id", wraps=register_id
+        ) as registered:
+            result = await list_events(
+                start="2023-03-01T00:00:00",
+                end="2023-03-02T00:00:00",
+                calendar_ids=[virtual_cal],
+                fields=["title", "start"],
+            )
+
+        [event] = result["events"]
+        assert set(event) == {"id", "title", "start"}
+        # Only the event ID is virtualized; calendarId/accountId are skipped.
+        registered.assert_called_once_with(sample_event.id)
+
+    async def test_list_events_fields_rejects_unknown_names(
+        self, mock_morgen_client, sample_calendar_id
+    ):
+        virtual_cal = register_id(sample_calendar_id)
+        window = {"start": "2023-03-01T00:00:00", "end": "2023-03-02T00:00:00"}
+
+        with pytest.raises(ToolError, match="Unknown field.*colour"):
+            await list_events(**window, calendar_ids=[virtual_cal], fields=["colour"])
+        with pytest.raises(ToolError, match="full output"):
+            await list_events(
+                **window, calendar_ids=[virtual_cal], compact=True, fields=["title"]
+            )
+        mock_morgen_client.list_events.assert_not_awaited()
+
     async def test_list_events_compact_mode(
         self, mock_morgen_client, sample_event, sample_calendar_id
     ):
@@ -1277,6 +1313,58 @@ class TestContextWarnings:
 
         ctx.report_progress.assert_awaited_once_with(1, 1)
 
+    async def test_list_events_streams_accounts_as_they_complete(
+        self, mock_morgen_client, sample_calendar, sample_event, sample_account_id
+    ):
+        """stream=True emits the fast account's events before the slow one ends."""
+        import asyncio
+
+        slow_account_id = "bbbb00000000000000000002"
+        slow_cal = Calendar(
+            id=make_calendar_id(slow_account_id, "slow@test.com"),
+            account_id=slow_account_id,
+            integration_id="o365",
+        )
+        # The slow account is listed first, so completion order differs
+        mock_morgen_client.list_calendars.return_value = [slow_cal, sample_calendar]
+        first_emitted = asyncio.Event()
+
+        async def _list_events(**kwargs):
+            if kwargs["account_id"] == slow_account_id:
+                await first_emitted.wait()
+                return []
+            return [sample_event]
+
+        mock_morgen_client.list_events.side_effect = _list_events
+
+        messages: list[str] = []
+
+        async def _report_progress(progress, total, message=None):
+            assert message is not None
+            messages.append(message)
+            first_emitted.set()
+
+        ctx = AsyncMock()
+        ctx.report_progress.side_effect = _report_progress
+        result = await asyncio.wait_for(
+            list_events(
+                start="2023-03-01T00:00:00",
+                end="2023-03-02T00:00:00",
+                compact=True,
+                display_timezone="Europe/Berlin",
+                stream=True,
+                ctx=ctx,
+            ),
+            timeout=5,
+        )
+
+        first = json.loads(messages[0])
+        assert first["accountId"] == register_id(sample_account_id)
+        assert first["count"] == 1
+        assert "Team Meeting" in first["events"][0]
+        assert json.loads(messages[1])["count"] == 0
+        assert result["events"] == first["events"]
+
     async def test_batch_delete_warns_on_failure(
         self, mock_morgen_client, sample_account_id
     ):
@@ -0,0 +1,96 @@
+"""Tests for the startup warm-up of hot data."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastmcp import Client
+
+from benchmarks.fake_morgen import FakeMorgen, FakeMorgenConfig
+from morgenmcp import client as client_module
+from morgenmcp.models import RateLimitInfo
+from morgenmcp.resources import res_events_today, res_tags, res_tasks
+from morgenmcp.server import _warmup_enabled
+from morgenmcp.server import mcp as server
+from morgenmcp.tools.id_registry import clear_registry
+from morgenmcp.warmup import warm_up
+
+SMALL = FakeMorgenConfig(
+    accounts=2,
+    calendars_per_account=2,
+    events_per_calendar=20,
+    tasks=10,
+    tags=3,
+    id_history=0,
+)
+
+
+@pytest.fixture(autouse=True)
+def _restore_client():
+    saved = client_module._client
+    clear_registry()
+    yield
+    client_module._client = saved
+    clear_registry()
+
+
+class TestWarmUp:
+    async def test_hot_reads_are_served_without_upstream_calls(self):
+        fake = FakeMorgen(SMALL)
+        async with fake.client() as client:
+            client_module._client = client
+            assert await warm_up() == []
+            assert fake.requests["/events/list"] > 0
+
+            before = sum(fake.requests.values())
+            await res_events_today()
+            await res_tasks()
+            await res_tags()
+            await client.list_calendars()
+            assert sum(fake.requests.values()) == before
+
+    async def test_failed_steps_are_reported_not_raised(self):
+        client = AsyncMock()
+        client.rate_limiter.available = 300.0
+        client.list_all_tags.side_effect = RuntimeError("boom")
+        with (
+            patch("morgenmcp.warmup.get_client", return_value=client),
+            patch("morgenmcp.resources.get_client", return_value=client),
+        ):
+            assert await warm_up() == ["tags"]
+        client.list_all_tasks.assert_awaited_once()
+
+    async def test_low_rate_budget_skips_the_run(self):
+        fake = FakeMorgen(SMALL)
+        async with fake.client() as client:
+            client_module._client = client
+            client.rate_limiter.observe(
+                RateLimitInfo(limit=300, remaining=50, reset_seconds=600)
+            )
+            assert await warm_up() == []
+            assert sum(fake.requests.values()) == 0
+
+
+class TestWarmupAtStartup:
+    @pytest.fixture(autouse=True)
+    def _isolate(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("MORGENMCP_DATA_DIR", str(tmp_path))
+        monkeypatch.delenv("MORGENMCP_WARMUP", raising=False)
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [(None, False), ("0", False), ("1", True), ("true", True), ("YES", True)],
+    )
+    def test_enabled_from_env(self, monkeypatch, value, expected):
+        if value is not None:
+            monkeypatch.setenv("MORGENMCP_WARMUP", value)
+        assert _warmup_enabled() is expected
+
+    @pytest.mark.parametrize(("value", "runs"), [(None, 0), ("1", 1)])
+    async def test_runs_once_per_startup(self, monkeypatch, value, runs):
+        if value is not None:
+            monkeypatch.setenv("MORGENMCP_WARMUP", value)
+        warm = AsyncMock(return_value=[])
+        with patch("morgenmcp.warmup.warm_up", warm):
+            async with Client(server) as client:
+                await client.ping()
+        assert warm.await_count == runs